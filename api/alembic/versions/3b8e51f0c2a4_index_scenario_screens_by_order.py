@@ -0,0 +1,33 @@
+"""index scenario screens by scenario and order
+
+Revision ID: 3b8e51f0c2a4
+Revises: 989e4819d21b
+Create Date: 2026-10-18 10:12:40.218734
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8e51f0c2a4'
+down_revision: Union[str, Sequence[str], None] = '989e4819d21b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_scenario_screens_scenario_id_order_index',
+        'scenario_screens',
+        ['scenario_id', 'order_index'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_scenario_screens_scenario_id_order_index', table_name='scenario_screens')
@@ -0,0 +1,33 @@
+"""index active scenarios by creation
+
+Revision ID: 7c1d9a4e6f20
+Revises: 3b8e51f0c2a4
+Create Date: 2026-10-18 11:02:17.540193
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7c1d9a4e6f20'
+down_revision: Union[str, Sequence[str], None] = '3b8e51f0c2a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_scenarios_is_active_created_at_id',
+        'scenarios',
+        ['is_active', 'created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_scenarios_is_active_created_at_id', table_name='scenarios')
@@ -0,0 +1,33 @@
+"""index scenarios by creation
+
+Revision ID: a41f6c2d8e93
+Revises: 7c1d9a4e6f20
+Create Date: 2026-10-18 16:40:05.118342
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41f6c2d8e93'
+down_revision: Union[str, Sequence[str], None] = '7c1d9a4e6f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_scenarios_created_at_id',
+        'scenarios',
+        ['created_at', 'id'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_scenarios_created_at_id', table_name='scenarios')
@@ -0,0 +1,34 @@
+"""add catalog versions
+
+Revision ID: c5d03b7e9a16
+Revises: a41f6c2d8e93
+Create Date: 2026-10-18 18:12:44.902571
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5d03b7e9a16'
+down_revision: Union[str, Sequence[str], None] = 'a41f6c2d8e93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    catalog_versions = op.create_table(
+        'catalog_versions',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.bulk_insert(catalog_versions, [{'id': 1, 'version': 0}])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('catalog_versions')
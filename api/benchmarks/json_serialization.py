@@ -0,0 +1,100 @@
+"""Compares the per-item ``model_dump`` + ``json.dumps`` serialization with
+``dump_models_json`` on large reagent and reaction lists.
+
+    python -m benchmarks.json_serialization [--rows 10000] [--repeat 5]
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import statistics
+import time
+from typing import Any, Callable
+
+import models  # noqa: F401 - registers every mapper
+from core.json_response import dump_models_json
+from models.reaction import Reaction
+from models.reaction_reagent import ReactionReagent
+from models.reagent import Reagent
+from schemas.reaction import ReactionRead
+from schemas.reagent import ReagentRead
+
+
+def _reagents(rows: int) -> list[Reagent]:
+    return [
+        Reagent(
+            id=index,
+            name=f"Reagente {index}",
+            formula="H2O",
+            physical_state="liquid",
+            tags=["solvente", "comum"],
+            image_path=f"reagents/{index}.png",
+        )
+        for index in range(1, rows + 1)
+    ]
+
+
+def _reactions(rows: int) -> list[Reaction]:
+    return [
+        Reaction(
+            id=index,
+            scenario_id=None,
+            description=f"Reação {index}",
+            product_reagent_id=3,
+            reaction_key="1:1|2:1",
+            message="Reação concluída.",
+            reagents=[
+                ReactionReagent(id=index * 2, reaction_id=index, reagent_id=1, coefficient=1, role="reactant"),
+                ReactionReagent(id=index * 2 + 1, reaction_id=index, reagent_id=2, coefficient=1, role="reactant"),
+            ],
+        )
+        for index in range(1, rows + 1)
+    ]
+
+
+def _legacy(schema: Any, items: list[Any]) -> bytes:
+    data = [schema.model_validate(item).model_dump(mode="json") for item in items]
+    return json.dumps(data).encode()
+
+
+def _best_of(fn: Callable[[], bytes], repeat: int) -> tuple[float, float]:
+    # Like timeit, keep the collector out of the timings
+    timings = []
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            fn()
+            timings.append(time.perf_counter() - started)
+    finally:
+        gc.enable()
+    return min(timings), statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    for label, schema, items in (
+        ("reagents", ReagentRead, _reagents(args.rows)),
+        ("reactions", ReactionRead, _reactions(args.rows)),
+    ):
+        assert json.loads(_legacy(schema, items)) == json.loads(dump_models_json(list[schema], items))
+        legacy_best, legacy_median = _best_of(lambda: _legacy(schema, items), args.repeat)
+        fast_best, fast_median = _best_of(
+            lambda: dump_models_json(list[schema], items), args.repeat
+        )
+        print(
+            f"{label:<10} {args.rows} linhas | model_dump + json.dumps: "
+            f"{legacy_best * 1000:8.1f} ms (mediana {legacy_median * 1000:.1f}) | "
+            f"dump_json: {fast_best * 1000:8.1f} ms (mediana {fast_median * 1000:.1f}) | "
+            f"{legacy_best / fast_best:.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from sqlalchemy.orm import Session
+
+from core.json_response import json_response
+from services import scenario_validation as validation_service
+
+
+def validate_scenarios(
+    db: Session,
+    scenario_ids: list[int] | None = None,
+    include_inactive: bool = False,
+    workers: int | None = None,
+):
+    if not scenario_ids:
+        scenario_ids = validation_service.list_scenario_ids(db, include_inactive=include_inactive)
+    reports = validation_service.validate_scenarios(scenario_ids, workers=workers)
+    data = {
+        "validated": len(reports),
+        "failed": sum(1 for report in reports if not report["ok"]),
+        "reports": reports,
+    }
+    return json_response(data, status_code=200)
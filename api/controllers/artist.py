@@ -1,36 +1,57 @@
 from __future__ import annotations
 
-import json
-
+from fastapi import Request
 from fastapi.responses import HTMLResponse
 from sqlalchemy.orm import Session
 
+from core.fieldsets import parse_fields, sparse_list_adapter
+from core.http_cache import etag_matches, not_modified
+from core.json_response import adapter_json_response, model_json_response
+from core.pagination import decode_after, next_page_headers, page_limit
 from schemas.artist import ArtistCreate, ArtistRead, ArtistUpdate
 from services import artist as artist_service
+from services.catalog_version import catalog_cache_headers
 
 
 def create_artist(payload: ArtistCreate, db: Session):
     artist = artist_service.create_artist(db=db, data=payload)
-    data = ArtistRead.model_validate(artist).model_dump(mode="json")
-    return HTMLResponse(content=json.dumps(data), status_code=201)
-
-
-def list_artists(db: Session):
-    artists = artist_service.list_artists(db)
-    data = [ArtistRead.model_validate(item).model_dump(mode="json") for item in artists]
-    return HTMLResponse(content=json.dumps(data), status_code=200)
-
-
-def get_artist(artist_id: int, db: Session):
-    artist = artist_service.get_artist(db, artist_id)
-    data = ArtistRead.model_validate(artist).model_dump(mode="json")
-    return HTMLResponse(content=json.dumps(data), status_code=200)
+    return model_json_response(ArtistRead, artist, status_code=201)
+
+
+def list_artists(
+    request: Request,
+    db: Session,
+    limit: int | None = None,
+    after: str | None = None,
+    fields: str | None = None,
+):
+    cache_headers = catalog_cache_headers(db)
+    if etag_matches(request.headers.get("if-none-match"), cache_headers["ETag"]):
+        return not_modified(cache_headers["ETag"], cache_headers)
+    limit = page_limit(limit, after)
+    fieldset = parse_fields(fields, ArtistRead)
+    after_key = decode_after(after, artist_service.ARTIST_SORT_KEYS)
+    artists, next_key = artist_service.list_artists(
+        db, limit, after=after_key, fields=fieldset
+    )
+    headers = {**cache_headers, **next_page_headers(request, next_key, limit)}
+    adapter = sparse_list_adapter(ArtistRead, fieldset)
+    return adapter_json_response(adapter, artists, status_code=200, headers=headers)
+
+
+def get_artist(artist_id: int, request: Request, db: Session):
+    cache_headers = catalog_cache_headers(db)
+    if etag_matches(request.headers.get("if-none-match"), cache_headers["ETag"]):
+        return not_modified(cache_headers["ETag"], cache_headers)
+    artist = artist_service.get_artist(
+        db, artist_id, options=artist_service.ARTIST_DETAIL_OPTIONS
+    )
+    return model_json_response(ArtistRead, artist, status_code=200, headers=cache_headers)
 
 
 def update_artist(artist_id: int, payload: ArtistUpdate, db: Session):
     artist = artist_service.update_artist(db, artist_id, payload)
-    data = ArtistRead.model_validate(artist).model_dump(mode="json")
-    return HTMLResponse(content=json.dumps(data), status_code=200)
+    return model_json_response(ArtistRead, artist, status_code=200)
 
 
 def delete_artist(artist_id: int, db: Session):
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
-import json
-
+from fastapi import Request
 from fastapi.responses import HTMLResponse
 from sqlalchemy.orm import Session
 
+from core.fieldsets import parse_fields, sparse_list_adapter
+from core.http_cache import etag_matches, not_modified
+from core.json_response import adapter_json_response, model_json_response
+from core.pagination import decode_after, next_page_headers, page_limit
 from schemas.instrument import (
     InstrumentCreate,
     InstrumentRead,
     InstrumentUpdate,
 )
 from services import instrument as instrument_service
+from services.catalog_version import catalog_cache_headers
 
 
 def create_instrument(payload: InstrumentCreate, db: Session):
@@ -23,20 +27,36 @@ def create_instrument(payload: InstrumentCreate, db: Session):
         is_container=payload.is_container,
         allowed_physical_states=payload.allowed_physical_states,
     )
-    data = InstrumentRead.model_validate(instrument).model_dump()
-    return HTMLResponse(content=json.dumps(data), status_code=201)
+    return model_json_response(InstrumentRead, instrument, status_code=201)
 
 
-def list_instruments(db: Session):
-    instruments = instrument_service.list_instruments(db)
-    data = [InstrumentRead.model_validate(item).model_dump() for item in instruments]
-    return HTMLResponse(content=json.dumps(data), status_code=200)
+def list_instruments(
+    request: Request,
+    db: Session,
+    limit: int | None = None,
+    after: str | None = None,
+    fields: str | None = None,
+):
+    cache_headers = catalog_cache_headers(db)
+    if etag_matches(request.headers.get("if-none-match"), cache_headers["ETag"]):
+        return not_modified(cache_headers["ETag"], cache_headers)
+    limit = page_limit(limit, after)
+    fieldset = parse_fields(fields, InstrumentRead)
+    after_key = decode_after(after, instrument_service.INSTRUMENT_SORT_KEYS)
+    instruments, next_key = instrument_service.list_instruments(
+        db, limit, after=after_key, fields=fieldset
+    )
+    headers = {**cache_headers, **next_page_headers(request, next_key, limit)}
+    adapter = sparse_list_adapter(InstrumentRead, fieldset)
+    return adapter_json_response(adapter, instruments, status_code=200, headers=headers)
 
 
-def get_instrument(instrument_id: int, db: Session):
+def get_instrument(instrument_id: int, request: Request, db: Session):
+    cache_headers = catalog_cache_headers(db)
+    if etag_matches(request.headers.get("if-none-match"), cache_headers["ETag"]):
+        return not_modified(cache_headers["ETag"], cache_headers)
     instrument = instrument_service.get_instrument_by_id(db, instrument_id)
-    data = InstrumentRead.model_validate(instrument).model_dump()
-    return HTMLResponse(content=json.dumps(data), status_code=200)
+    return model_json_response(InstrumentRead, instrument, status_code=200, headers=cache_headers)
 
 
 def update_instrument(
@@ -52,8 +72,7 @@ def update_instrument(
         is_container=payload.is_container,
         allowed_physical_states=payload.allowed_physical_states,
     )
-    data = InstrumentRead.model_validate(instrument).model_dump()
-    return HTMLResponse(content=json.dumps(data), status_code=200)
+    return model_json_response(InstrumentRead, instrument, status_code=200)
 
 
 def delete_instrument(instrument_id: int, db: Session):
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-import json
 from typing import Optional
 
+from fastapi import Request
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
+from core.fieldsets import parse_fields, sparse_list_adapter
+from core.http_cache import etag_matches, not_modified
+from core.json_response import adapter_json_response, model_json_response
+from core.pagination import decode_after, next_page_headers, page_limit
 from schemas.reaction import ReactionRead, ReactionReagentBase, ReactionUpdate
 from services import reaction as reaction_service
+from services.catalog_version import catalog_cache_headers
 
 
 class ReactionCreatePayload(BaseModel):
@@ -32,20 +37,38 @@ def create_reaction(payload: ReactionCreatePayload, db: Session):
         scenario_id=payload.scenario_id,
         reagents=[item.model_dump() for item in payload.reagents],
     )
-    data = ReactionRead.model_validate(reaction).model_dump(mode='json')
-    return HTMLResponse(content=json.dumps(data), status_code=201)
+    return model_json_response(ReactionRead, reaction, status_code=201)
 
 
-def list_reactions(db: Session):
-    reactions = reaction_service.list_reactions(db)
-    data = [ReactionRead.model_validate(item).model_dump(mode='json') for item in reactions]
-    return HTMLResponse(content=json.dumps(data), status_code=200)
+def list_reactions(
+    request: Request,
+    db: Session,
+    limit: int | None = None,
+    after: str | None = None,
+    fields: str | None = None,
+):
+    cache_headers = catalog_cache_headers(db)
+    if etag_matches(request.headers.get("if-none-match"), cache_headers["ETag"]):
+        return not_modified(cache_headers["ETag"], cache_headers)
+    limit = page_limit(limit, after)
+    fieldset = parse_fields(fields, ReactionRead)
+    after_key = decode_after(after, reaction_service.REACTION_SORT_KEYS)
+    reactions, next_key = reaction_service.list_reactions(
+        db, limit, after=after_key, fields=fieldset
+    )
+    headers = {**cache_headers, **next_page_headers(request, next_key, limit)}
+    adapter = sparse_list_adapter(ReactionRead, fieldset)
+    return adapter_json_response(adapter, reactions, status_code=200, headers=headers)
 
 
-def get_reaction(reaction_id: int, db: Session):
-    reaction = reaction_service.get_reaction_by_id(db, reaction_id)
-    data = ReactionRead.model_validate(reaction).model_dump(mode='json')
-    return HTMLResponse(content=json.dumps(data), status_code=200)
+def get_reaction(reaction_id: int, request: Request, db: Session):
+    cache_headers = catalog_cache_headers(db)
+    if etag_matches(request.headers.get("if-none-match"), cache_headers["ETag"]):
+        return not_modified(cache_headers["ETag"], cache_headers)
+    reaction = reaction_service.get_reaction_by_id(
+        db, reaction_id, options=reaction_service.REACTION_DETAIL_OPTIONS
+    )
+    return model_json_response(ReactionRead, reaction, status_code=200, headers=cache_headers)
 
 
 def update_reaction(
@@ -60,8 +83,7 @@ def update_reaction(
         scenario_id=payload.scenario_id,
         reagents=[item.model_dump() for item in payload.reagents] if payload.reagents is not None else None,
     )
-    data = ReactionRead.model_validate(reaction).model_dump(mode='json')
-    return HTMLResponse(content=json.dumps(data), status_code=200)
+    return model_json_response(ReactionRead, reaction, status_code=200)
 
 
 def delete_reaction(reaction_id: int, db: Session):
@@ -1,16 +1,20 @@
 from __future__ import annotations
 
-import json
-
+from fastapi import Request
 from fastapi.responses import HTMLResponse
 from sqlalchemy.orm import Session
 
+from core.fieldsets import parse_fields, sparse_list_adapter
+from core.http_cache import etag_matches, not_modified
+from core.json_response import adapter_json_response, model_json_response
+from core.pagination import decode_after, next_page_headers, page_limit
 from schemas.reagent import (
     ReagentCreate,
     ReagentRead,
     ReagentUpdate,
 )
 from services import reagent as reagent_service
+from services.catalog_version import catalog_cache_headers
 
 
 def create_reagent(payload: ReagentCreate, db: Session): 
@@ -22,20 +26,36 @@ def create_reagent(payload: ReagentCreate, db: Session):
         tags=payload.tags,
         image_path=payload.image_path,
     )
-    data = ReagentRead.model_validate(reagent).model_dump()
-    return HTMLResponse(content=json.dumps(data), status_code=201)
+    return model_json_response(ReagentRead, reagent, status_code=201)
 
 
-def list_reagents(db: Session):
-    reagents = reagent_service.list_reagents(db)
-    data = [ReagentRead.model_validate(item).model_dump() for item in reagents]
-    return HTMLResponse(content=json.dumps(data), status_code=200)
+def list_reagents(
+    request: Request,
+    db: Session,
+    limit: int | None = None,
+    after: str | None = None,
+    fields: str | None = None,
+):
+    cache_headers = catalog_cache_headers(db)
+    if etag_matches(request.headers.get("if-none-match"), cache_headers["ETag"]):
+        return not_modified(cache_headers["ETag"], cache_headers)
+    limit = page_limit(limit, after)
+    fieldset = parse_fields(fields, ReagentRead)
+    after_key = decode_after(after, reagent_service.REAGENT_SORT_KEYS)
+    reagents, next_key = reagent_service.list_reagents(
+        db, limit, after=after_key, fields=fieldset
+    )
+    headers = {**cache_headers, **next_page_headers(request, next_key, limit)}
+    adapter = sparse_list_adapter(ReagentRead, fieldset)
+    return adapter_json_response(adapter, reagents, status_code=200, headers=headers)
 
 
-def get_reagent(reagent_id: int, db: Session):
+def get_reagent(reagent_id: int, request: Request, db: Session):
+    cache_headers = catalog_cache_headers(db)
+    if etag_matches(request.headers.get("if-none-match"), cache_headers["ETag"]):
+        return not_modified(cache_headers["ETag"], cache_headers)
     reagent = reagent_service.get_reagent_by_id(db, reagent_id)
-    data = ReagentRead.model_validate(reagent).model_dump()
-    return HTMLResponse(content=json.dumps(data), status_code=200)
+    return model_json_response(ReagentRead, reagent, status_code=200, headers=cache_headers)
 
 
 def update_reagent(reagent_id: int, payload: ReagentUpdate, db: Session):
@@ -48,8 +68,7 @@ def update_reagent(reagent_id: int, payload: ReagentUpdate, db: Session):
         tags=payload.tags,
         image_path=payload.image_path,
     )
-    data = ReagentRead.model_validate(reagent).model_dump()
-    return HTMLResponse(content=json.dumps(data), status_code=200)
+    return model_json_response(ReagentRead, reagent, status_code=200)
 
 
 def delete_reagent(reagent_id: int, db: Session):
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
-import json
 from typing import Optional
 
+from fastapi import Request
 from fastapi.responses import HTMLResponse
 from pydantic import Field
 from sqlalchemy.orm import Session
 
+from core.fieldsets import parse_fields, sparse_list_adapter
+from core.json_response import adapter_json_response, model_json_response
+from core.pagination import decode_after, next_page_headers, page_limit
 from schemas.scenario import (
     ScenarioCreate,
     ScenarioRead,
@@ -34,20 +37,32 @@ def create_scenario(payload: ScenarioCreatePayload, db: Session):
         artist_id=payload.artist_id,
         screens=[screen.model_dump() for screen in payload.screens] if payload.screens else None,
     )
-    data = ScenarioRead.model_validate(scenario).model_dump(mode='json')
-    return HTMLResponse(content=json.dumps(data), status_code=201)
+    return model_json_response(ScenarioRead, scenario, status_code=201)
 
 
-def list_scenarios(db: Session):
-    scenarios = scenario_service.list_scenarios(db)
-    data = [ScenarioRead.model_validate(item).model_dump(mode='json') for item in scenarios]
-    return HTMLResponse(content=json.dumps(data), status_code=200)
+def list_scenarios(
+    request: Request,
+    db: Session,
+    limit: int | None = None,
+    after: str | None = None,
+    fields: str | None = None,
+):
+    limit = page_limit(limit, after)
+    fieldset = parse_fields(fields, ScenarioRead)
+    after_key = decode_after(after, scenario_service.SCENARIO_SORT_KEYS)
+    scenarios, next_key = scenario_service.list_scenarios(
+        db, limit, after=after_key, fields=fieldset
+    )
+    headers = next_page_headers(request, next_key, limit)
+    adapter = sparse_list_adapter(ScenarioRead, fieldset)
+    return adapter_json_response(adapter, scenarios, status_code=200, headers=headers)
 
 
 def get_scenario(scenario_id: int, db: Session):
-    scenario = scenario_service.get_scenario_by_id(db, scenario_id)
-    data = ScenarioRead.model_validate(scenario).model_dump(mode='json')
-    return HTMLResponse(content=json.dumps(data), status_code=200)
+    scenario = scenario_service.get_scenario_by_id(
+        db, scenario_id, options=scenario_service.SCENARIO_DETAIL_OPTIONS
+    )
+    return model_json_response(ScenarioRead, scenario, status_code=200)
 
 
 def update_scenario(
@@ -61,8 +76,7 @@ def update_scenario(
         is_active=payload.is_active,
         steps=[step.model_dump() for step in payload.steps] if payload.steps is not None else None,
     )
-    data = ScenarioRead.model_validate(scenario).model_dump(mode='json')
-    return HTMLResponse(content=json.dumps(data), status_code=200)
+    return model_json_response(ScenarioRead, scenario, status_code=200)
 
 
 def delete_scenario(scenario_id: int, db: Session):
@@ -1,15 +1,15 @@
 from __future__ import annotations
 
-import json
-
-from fastapi import Depends
-from fastapi.responses import HTMLResponse
+from fastapi import Depends, Request
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.dependencies import get_db
-from schemas.scenario_run import ScenarioRunActionApply
+from core.dependencies import get_async_db
+from core.http_cache import not_modified
+from core.json_response import json_response
+from schemas.scenario_run import ScenarioRunActionApply, ScenarioRunBulkStart
 from services import scenario_run as run_service
+from services.run_actors import run_serialized_in_session
 
 
 class StartRunPayload(BaseModel):
@@ -21,32 +21,48 @@ class AddReagentPayload(BaseModel):
     reagent_id: int
 
 
-def start_run(payload: StartRunPayload, db: Session = Depends(get_db)):
-    state = run_service.start_scenario_run(payload.scenario_id, db=db)
-    return HTMLResponse(content=json.dumps(state), status_code=201)
+async def start_run(payload: StartRunPayload, db: AsyncSession = Depends(get_async_db)):
+    state = await run_service.start_scenario_run(payload.scenario_id, db)
+    return json_response(state, status_code=201)
 
 
-def get_run(run_id: str, db: Session = Depends(get_db)):
-    state = run_service.get_run_state(run_id, db=db)
-    return HTMLResponse(content=json.dumps(state), status_code=200)
+async def start_runs_bulk(
+    payload: ScenarioRunBulkStart, db: AsyncSession = Depends(get_async_db)
+):
+    labels = payload.student_labels or [None] * (payload.count or 0)
+    runs = await run_service.start_scenario_runs_bulk(payload.scenario_id, labels, db)
+    data = {"scenario_id": payload.scenario_id, "runs": runs}
+    return json_response(data, status_code=201)
 
 
-def add_reagent(
-    run_id: str, payload: AddReagentPayload, db: Session = Depends(get_db)
-):
-    state = run_service.add_reagent_to_container(
-        db=db,
+async def get_run(run_id: str, request: Request):
+    etag, state = await run_service.get_run_state_if_modified(
+        run_id, request.headers.get("if-none-match")
+    )
+    if state is None:
+        return not_modified(etag)
+    return json_response(state, status_code=200, headers={"ETag": etag})
+
+
+async def add_reagent(run_id: str, payload: AddReagentPayload):
+    state = await run_serialized_in_session(
+        run_id,
+        run_service.add_reagent_to_container,
         run_id=run_id,
         container_name=payload.container_name,
         reagent_id=payload.reagent_id,
     )
-    return HTMLResponse(content=json.dumps(state), status_code=200)
+    return json_response(state, status_code=200)
 
 
-def apply_action_to_run(
-    run_id: str, action_data: ScenarioRunActionApply, db: Session = Depends(get_db)
+async def apply_action_to_run(
+    run_id: str,
+    action_data: ScenarioRunActionApply,
+    since_version: int | None = None,
 ):
-    state = run_service.apply_action(
+    state = await run_serialized_in_session(
+        run_id,
+        run_service.apply_action,
         run_id=run_id,
         action_type=action_data.action_type,
         instrument_id=action_data.instrument_id,
@@ -55,6 +71,37 @@ def apply_action_to_run(
         reagent_id=action_data.reagent_id,
         amount_value=action_data.amount_value,
         amount_unit=action_data.amount_unit,
-        db=db,
+        since_version=since_version,
+    )
+    etag = run_service.run_etag(state["run_id"], state["version"])
+    return json_response(state, status_code=200, headers={"ETag": etag})
+
+
+async def apply_actions_batch_to_run(
+    run_id: str,
+    actions: list[ScenarioRunActionApply],
+):
+    applied, result = await run_serialized_in_session(
+        run_id,
+        run_service.apply_actions_batch,
+        run_id=run_id,
+        actions=[action.model_dump() for action in actions],
+    )
+    state = result["state"]
+    etag = run_service.run_etag(state["run_id"], state["version"])
+    return json_response(
+        result,
+        status_code=200 if applied else 400,
+        headers={"ETag": etag},
     )
-    return HTMLResponse(content=json.dumps(state), status_code=200)
+
+
+def list_run_events(run_id: str):
+    events = run_service.list_run_events(run_id)
+    return json_response(events, status_code=200)
+
+
+async def recover_run(run_id: str):
+    state = await run_serialized_in_session(run_id, run_service.recover_run, run_id)
+    etag = run_service.run_etag(state["run_id"], state["version"])
+    return json_response(state, status_code=200, headers={"ETag": etag})
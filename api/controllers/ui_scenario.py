@@ -1,55 +1,98 @@
 from __future__ import annotations
 
-import json
+import hashlib
 
-from fastapi import Depends, Request
+from fastapi import Depends, Request, Response
 from fastapi.responses import HTMLResponse
-from sqlalchemy.orm import Session
+from markupsafe import Markup
+from pydantic_core import to_json
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
-from core.dependencies import get_db
-from core.templates import templates
+from core.config import get_settings
+from core.dependencies import get_async_db, get_db
+from core.exceptions import NotFoundError
+from core.http_cache import etag_matches, not_modified
+from core.json_response import JSONBytesResponse, dump_models_json
+from core.pagination import decode_after, encode_cursor
+from core.templates import FragmentCache, script_json, templates
 from models.instrument import Instrument
 from models.reagent import Reagent
+from models.scenario import Scenario
+from models.scenario_screen import ScenarioScreen
 from services import scenario as scenario_service
+from services import scenario_screen as scenario_screen_service
 from services import scenario_run as run_service
+from services.catalog_version import get_catalog_change_version
+from services.scenario_plan import get_scenario_plan
 from services.utils_instruments import split_instruments_by_container
 from schemas.scenario_screen import ScenarioScreenRead
 
 
-def list_scenarios_page(request: Request, db: Session = Depends(get_db)) -> HTMLResponse:
-    scenarios = [s for s in scenario_service.list_scenarios(db) if s.is_active]
+_SCENARIOS_PER_PAGE = 24
+
+
+def list_scenarios_page(
+    request: Request, db: Session = Depends(get_db), after: str | None = None
+) -> Response:
+    last_modified, active_count = scenario_service.get_active_scenarios_version(db)
+    version = f"{active_count}|{last_modified.isoformat() if last_modified else ''}|{after or ''}"
+    etag = 'W/"' + hashlib.sha256(version.encode("utf-8")).hexdigest()[:32] + '"'
+    # No Last-Modified: max(updated_at) does not move when a scenario is
+    # deleted, so only the ETag, which counts them too, validates the page.
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag, headers)
+
+    after_values = decode_after(after, scenario_service.SCENARIO_SORT_KEYS)
+    after_key = tuple(after_values) if after_values else None
+    scenarios, next_key = scenario_service.list_active_scenarios_page(
+        db, limit=_SCENARIOS_PER_PAGE, after=after_key
+    )
     return templates.TemplateResponse(
         "scenarios/list.html",
         {
             "request": request,
             "scenarios": scenarios,
+            "next_cursor": encode_cursor(next_key) if next_key else None,
+            "is_first_page": after is None,
         },
+        headers=headers,
     )
 
 
-def run_scenario_page(
-    scenario_id: int, request: Request, db: Session = Depends(get_db)
-) -> HTMLResponse:
-    scenario = scenario_service.get_scenario_by_id(db, scenario_id)
-    screens = list(scenario.screens) if scenario.screens else []
-    screens_json = json.dumps(
-        [ScenarioScreenRead.model_validate(screen).model_dump(mode="json") for screen in screens]
+# Stands in for the run id in cached run pages. User content is autoescaped,
+# and the screens JSON is HTML-safe, so "<" only reaches the page from the
+# template itself; run ids are uuids and need no escaping.
+_RUN_ID_SLOT = Markup("<run-id>")
+# One page per (scenario, scenario version, catalog version)
+_run_pages = FragmentCache(max_entries=64)
+
+
+async def _render_run_page(
+    db: AsyncSession, scenario_id: int, containers_meta: dict
+) -> str:
+    scenario = await db.get(
+        Scenario,
+        scenario_id,
+        options=[selectinload(Scenario.screens).selectinload(ScenarioScreen.slider_images)],
     )
-    run_state = run_service.start_scenario_run(scenario_id, db=db)
-    reagents = db.query(Reagent).all()
-    all_instruments = db.query(Instrument).all()
+    if not scenario:
+        raise NotFoundError("Cenário não encontrado.")
+    screens = list(scenario.screens) if scenario.screens else []
+    screens_json = script_json(dump_models_json(list[ScenarioScreenRead], screens))
+    reagents = (await db.scalars(select(Reagent))).all()
+    all_instruments = list((await db.scalars(select(Instrument))).all())
     transfer_instruments, container_instruments = split_instruments_by_container(all_instruments)
-    containers_meta = run_state.get("containers_meta", {})
     container_names = [
         name for name, meta in containers_meta.items() if meta.get("is_container")
     ]
     instrument_map = {inst.id: inst.name for inst in all_instruments}
-    return templates.TemplateResponse(
-        "scenario_runs/run.html",
+    return templates.get_template("scenario_runs/run.html").render(
         {
-            "request": request,
             "scenario": scenario,
-            "run_state": run_state,
+            "run_state": {"run_id": _RUN_ID_SLOT},
             "reagents": reagents,
             "transfer_instruments": transfer_instruments,
             "container_names": container_names,
@@ -57,19 +100,68 @@ def run_scenario_page(
             "instrument_map": instrument_map,
             "screens": screens,
             "screens_json": screens_json,
-        },
+        }
     )
 
 
+async def run_scenario_page(
+    scenario_id: int, request: Request, db: AsyncSession = Depends(get_async_db)
+) -> HTMLResponse:
+    run_state = await run_service.start_scenario_run(scenario_id, db)
+    plan = await db.run_sync(get_scenario_plan, scenario_id)
+    # The key is read before the page is rendered, so a concurrent write can
+    # only leave newer content under an older key, never the reverse.
+    key = (scenario_id, plan.updated_at, await db.run_sync(get_catalog_change_version))
+    page = _run_pages.get(key)
+    if page is None:
+        page = _run_pages.put(
+            key, await _render_run_page(db, scenario_id, run_state["containers_meta"])
+        )
+    return HTMLResponse(content=page.replace(_RUN_ID_SLOT, run_state["run_id"]))
+
+
+# Rendered screens and bundles, keyed by scenario version
+_screen_fragments = FragmentCache(max_entries=512)
+
+
+def _render_screen(screen: ScenarioScreen) -> str:
+    return templates.get_template("scenario_runs/partials/screen.html").render(screen=screen)
+
+
+def _screen_response(
+    request: Request, body: str, response_class: type[Response] = HTMLResponse
+) -> Response:
+    etag = '"' + hashlib.sha256(body.encode("utf-8")).hexdigest()[:32] + '"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={get_settings().screen_cache_max_age_seconds}",
+    }
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified(etag, headers)
+    return response_class(content=body, status_code=200, headers=headers)
+
+
 def scenario_screen_partial(
     scenario_id: int, index: int, request: Request, db: Session = Depends(get_db)
-) -> HTMLResponse:
-    scenario = scenario_service.get_scenario_by_id(db, scenario_id)
-    screens = list(scenario.screens) if scenario.screens else []
-    if index < 0 or index >= len(screens):
-        return HTMLResponse(content="Tela não encontrada.", status_code=404)
-    screen = screens[index]
-    return templates.TemplateResponse(
-        "scenario_runs/partials/screen.html",
-        {"request": request, "screen": screen},
-    )
+) -> Response:
+    key = (scenario_id, scenario_service.get_scenario_version(db, scenario_id), index)
+    body = _screen_fragments.get(key)
+    if body is None:
+        screen = scenario_screen_service.get_screen_at(db, scenario_id, index)
+        if screen is None:
+            return HTMLResponse(content="Tela não encontrada.", status_code=404)
+        body = _screen_fragments.put(key, _render_screen(screen))
+    return _screen_response(request, body)
+
+
+def scenario_screens_bundle(
+    scenario_id: int, request: Request, db: Session = Depends(get_db)
+) -> Response:
+    """All of a scenario's rendered screens, in display order, for prefetching."""
+    key = (scenario_id, scenario_service.get_scenario_version(db, scenario_id), "bundle")
+    body = _screen_fragments.get(key)
+    if body is None:
+        screens = scenario_screen_service.list_screens_for_scenario(db, scenario_id)
+        data = {"screens": [_render_screen(screen) for screen in screens]}
+        body = _screen_fragments.put(key, to_json(data).decode("utf-8"))
+    return _screen_response(request, body, JSONBytesResponse)
@@ -2,49 +2,82 @@ from __future__ import annotations
 
 from fastapi import Depends, Request, Form
 from fastapi.responses import HTMLResponse
-from sqlalchemy.orm import Session
+from markupsafe import Markup
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.dependencies import get_db
-from core.templates import templates
+from core.dependencies import get_async_db
+from core.templates import FragmentCache, template_macro, templates
 from core.exceptions import BadRequestError, NotFoundError
-from models.reagent import Reagent
-from models.scenario import Scenario
-from models.instrument import Instrument
 from services import scenario_run as run_service
+from services.catalog_cache import get_catalog_names
+from services.run_actors import run_serialized_in_session
+from services.scenario_plan import ScenarioPlan, get_scenario_plan
 
 
-def _build_reagents_map(db: Session) -> dict[int, str]:
-    reagents = db.query(Reagent).all()
-    return {r.id: r.name for r in reagents}
+# One panel per (scenario version, current step)
+_steps_panels = FragmentCache(max_entries=512)
 
 
-def _build_instrument_map(db: Session) -> dict[int, str]:
-    instruments = db.query(Instrument).all()
-    return {i.id: i.name for i in instruments}
+def _render_steps_panel(plan: ScenarioPlan | None, current_index: int) -> Markup:
+    steps_panel = template_macro("scenario_runs/partials/steps.html", "steps_panel")
+    if plan is None:
+        return steps_panel((), current_index)
+    return _steps_panels.get_or_render(
+        (plan.scenario_id, plan.updated_at, current_index),
+        lambda: steps_panel(plan.steps, current_index),
+    )
 
 
-def run_state_partial(
-    run_id: str,
+async def _render_state(
     request: Request,
-    db: Session = Depends(get_db),
+    db: AsyncSession,
+    run_state: dict,
+    error_message: str | None = None,
+    status_code: int = 200,
+    advanced: bool = False,
 ) -> HTMLResponse:
-    run_state = run_service.get_run_state(run_id, db=db)
-    reagents_map = _build_reagents_map(db)
-    instrument_map = _build_instrument_map(db)
-    scenario = db.get(Scenario, run_state["scenario_id"])
+    """Renders the state partial. After a step is completed only the two step
+    items whose highlight changed are swapped in; the full steps panel is sent
+    when the state is loaded, and nothing when an action was rejected."""
+    names = await db.run_sync(get_catalog_names)
+    try:
+        plan = await db.run_sync(get_scenario_plan, run_state["scenario_id"])
+    except NotFoundError:
+        plan = None
+    current_index = run_state["current_step_index"]
+    steps_panel = None
+    moved_step_indexes: list[int] = []
+    if advanced and plan is not None:
+        moved_step_indexes = [
+            index for index in (current_index - 1, current_index) if 0 <= index < plan.step_count
+        ]
+    elif error_message is None:
+        steps_panel = _render_steps_panel(plan, current_index)
     return templates.TemplateResponse(
         "scenario_runs/partials/state.html",
         {
             "request": request,
             "run_state": run_state,
-            "scenario": scenario,
-            "reagents_map": reagents_map,
-            "instrument_map": instrument_map,
-            "error_message": None,
+            "plan": plan,
+            "steps_panel": steps_panel,
+            "moved_step_indexes": moved_step_indexes,
+            "reagents_map": names.reagents,
+            "instrument_map": names.instruments,
+            "error_message": error_message,
         },
+        status_code=status_code,
     )
 
 
+async def run_state_partial(
+    run_id: str,
+    request: Request,
+    db: AsyncSession = Depends(get_async_db),
+) -> HTMLResponse:
+    run_state = await run_service.get_run_state(run_id)
+    return await _render_state(request, db, run_state)
+
+
 async def apply_action_ui(
     request: Request,
     run_id: str,
@@ -55,7 +88,7 @@ async def apply_action_ui(
     reagent_id: str = Form(""),
     amount_value: str = Form(""),
     amount_unit: str = Form(""),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> HTMLResponse:
     # Normaliza e converte campos de formulário
     source_container_name = source_container_name or None
@@ -66,7 +99,9 @@ async def apply_action_ui(
     amount_value_val = float(amount_value) if amount_value not in (None, "") else None
 
     try:
-        run_service.apply_action(
+        run_state = await run_serialized_in_session(
+            run_id,
+            run_service.apply_action,
             run_id=run_id,
             action_type=action_type,
             instrument_id=instrument_id_val,
@@ -75,37 +110,10 @@ async def apply_action_ui(
             reagent_id=reagent_id_val,
             amount_value=amount_value_val,
             amount_unit=amount_unit,
-            db=db,
-        )
-        run_state = run_service.get_run_state(run_id, db=db)
-        reagents_map = _build_reagents_map(db)
-        instrument_map = _build_instrument_map(db)
-        scenario = db.get(Scenario, run_state["scenario_id"])
-        return templates.TemplateResponse(
-            "scenario_runs/partials/state.html",
-            {
-                "request": request,
-                "run_state": run_state,
-                "scenario": scenario,
-                "reagents_map": reagents_map,
-                "instrument_map": instrument_map,
-                "error_message": None,
-            },
         )
+        return await _render_state(request, db, run_state, advanced=True)
     except (BadRequestError, NotFoundError) as exc:
-        run_state = run_service.get_run_state(run_id, db=db)
-        reagents_map = _build_reagents_map(db)
-        instrument_map = _build_instrument_map(db)
-        scenario = db.get(Scenario, run_state["scenario_id"])
-        return templates.TemplateResponse(
-            "scenario_runs/partials/state.html",
-            {
-                "request": request,
-                "run_state": run_state,
-                "scenario": scenario,
-                "reagents_map": reagents_map,
-                "instrument_map": instrument_map,
-                "error_message": str(exc),
-            },
-            status_code=400,
+        run_state = await run_service.get_run_state(run_id)
+        return await _render_state(
+            request, db, run_state, error_message=str(exc), status_code=400
         )
@@ -0,0 +1,256 @@
+"""Content-negotiated response compression.
+
+Bodies are gzip- or brotli-encoded (brotli when the ``brotli`` package is
+installed and the client accepts it). Complete bodies under
+``minimum_size`` are sent as they are; streamed bodies are compressed
+chunk by chunk and flushed after each one so partial output still reaches
+the client early.
+"""
+from __future__ import annotations
+
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from typing import Iterable, Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+
+@dataclass
+class CompressionStats:
+    compressed_responses: int
+    # Bodies under the minimum size, or already encoded by the handler
+    uncompressed_responses: int
+    bytes_in: int
+    bytes_out: int
+    # bytes_in / bytes_out over every compressed response
+    compression_ratio: float
+    cpu_seconds: float
+
+
+class _Counters:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._compressed = 0
+            self._uncompressed = 0
+            self._bytes_in = 0
+            self._bytes_out = 0
+            self._cpu_seconds = 0.0
+
+    def record_uncompressed(self) -> None:
+        with self._lock:
+            self._uncompressed += 1
+
+    def record_compressed(self, bytes_in: int, bytes_out: int, cpu_seconds: float) -> None:
+        with self._lock:
+            self._compressed += 1
+            self._bytes_in += bytes_in
+            self._bytes_out += bytes_out
+            self._cpu_seconds += cpu_seconds
+
+    def snapshot(self) -> CompressionStats:
+        with self._lock:
+            return CompressionStats(
+                compressed_responses=self._compressed,
+                uncompressed_responses=self._uncompressed,
+                bytes_in=self._bytes_in,
+                bytes_out=self._bytes_out,
+                compression_ratio=self._bytes_in / self._bytes_out if self._bytes_out else 0.0,
+                cpu_seconds=self._cpu_seconds,
+            )
+
+
+_counters = _Counters()
+
+
+def get_compression_stats() -> CompressionStats:
+    return _counters.snapshot()
+
+
+def reset_compression_stats() -> None:
+    _counters.reset()
+
+
+class _Encoder(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes: ...
+
+    def finish(self) -> bytes: ...
+
+
+class _GzipEncoder:
+    def __init__(self, level: int) -> None:
+        # wbits 16 + 15: gzip container
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class _BrotliEncoder:
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+def select_encoding(accept_encoding: str) -> str | None:
+    """Picks ``br`` or ``gzip`` from an Accept-Encoding header by q-value,
+    preferring brotli on a tie."""
+    supported = ("br", "gzip") if brotli is not None else ("gzip",)
+    best: tuple[float, int] | None = None
+    selected: str | None = None
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        coding = coding.strip().lower()
+        if coding == "*":
+            coding = supported[0]
+        if coding not in supported:
+            continue
+        q = 1.0
+        name, _, value = params.strip().partition("=")
+        if name.strip().lower() == "q":
+            try:
+                q = float(value)
+            except ValueError:
+                continue
+        rank = (q, -supported.index(coding))
+        if q > 0 and (best is None or rank > best):
+            best, selected = rank, coding
+    return selected
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+        exclude_paths: Iterable[str] = (),
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.exclude_paths = tuple(exclude_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"].startswith(self.exclude_paths):
+            await self.app(scope, receive, send)
+            return
+        encoding = select_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def encoder(self, encoding: str) -> _Encoder:
+        if encoding == "br":
+            return _BrotliEncoder(self.brotli_quality)
+        return _GzipEncoder(self.gzip_level)
+
+
+def _weaken_etag(headers: MutableHeaders) -> None:
+    """An encoded body is a different representation from the identity one,
+    so it can't share its strong validator (RFC 9110 8.8.3); a weak one still
+    answers If-None-Match."""
+    etag = headers.get("etag")
+    if etag is not None and not etag.startswith("W/"):
+        headers["ETag"] = "W/" + etag
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self._start: Message | None = None
+        self._encoder: _Encoder | None = None
+        self._passthrough = False
+        self._bytes_in = 0
+        self._bytes_out = 0
+        self._cpu_seconds = 0.0
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self._start = message
+            return
+        if message["type"] != "http.response.body":
+            await self._send(message)
+            return
+        if self._passthrough:
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self._encoder is None:
+            headers = MutableHeaders(raw=self._start["headers"])
+            too_small = not more_body and len(body) < self.middleware.minimum_size
+            if too_small or "content-encoding" in headers:
+                if self._start["status"] == 304:
+                    # Validators must match the encoded 200 the client holds.
+                    _weaken_etag(headers)
+                self._passthrough = True
+                _counters.record_uncompressed()
+                await self._send(self._start)
+                await self._send(message)
+                return
+            self._encoder = self.middleware.encoder(self.encoding)
+            headers["Content-Encoding"] = self.encoding
+            headers.add_vary_header("Accept-Encoding")
+            _weaken_etag(headers)
+            if more_body:
+                del headers["Content-Length"]
+            else:
+                data = self._encode(body, final=True)
+                headers["Content-Length"] = str(len(data))
+                await self._send(self._start)
+                await self._send({"type": "http.response.body", "body": data})
+                self._record()
+                return
+            await self._send(self._start)
+
+        data = self._encode(body, final=not more_body)
+        await self._send({"type": "http.response.body", "body": data, "more_body": more_body})
+        if not more_body:
+            self._record()
+
+    def _encode(self, body: bytes, final: bool) -> bytes:
+        started = time.thread_time()
+        data = self._encoder.compress(body)
+        data += self._encoder.finish() if final else self._encoder.flush()
+        self._cpu_seconds += time.thread_time() - started
+        self._bytes_in += len(body)
+        self._bytes_out += len(data)
+        return data
+
+    def _record(self) -> None:
+        _counters.record_compressed(self._bytes_in, self._bytes_out, self._cpu_seconds)
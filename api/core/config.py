@@ -13,7 +13,30 @@ class Settings(BaseSettings):
 
     app_name: str = "Chemistry API"
     database_url: str = "sqlite:///./app.db"
+    # Defaults to database_url with its async driver (aiosqlite, asyncpg)
+    async_database_url: str | None = None
     environment: str = "development"
+    run_store_backend: str = "memory"
+    run_store_path: str = "./runs.db"
+    run_store_max_runs: int = 10000
+    run_store_idle_ttl_seconds: float = 4 * 60 * 60
+    run_store_sweep_interval_seconds: float = 60
+    run_log_enabled: bool = True
+    run_log_path: str = "./run_log.db"
+    run_log_snapshot_every: int = 20
+    run_log_flush_size: int = 200
+    run_log_flush_interval_seconds: float = 1.0
+    screen_cache_max_age_seconds: int = 300
+    # Catalog list endpoints (reagents, instruments, reactions, scenarios, artists)
+    page_size_default: int = 50
+    page_size_max: int = 200
+    static_build_dir: str = "./build/static"
+    # Hash and compress the static files at startup; otherwise run
+    # `python -m core.static_assets` at deploy time
+    static_build_on_startup: bool = True
+    compression_minimum_size: int = 1024
+    compression_gzip_level: int = 6
+    compression_brotli_quality: int = 5
 
 
 @lru_cache
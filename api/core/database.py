@@ -1,14 +1,48 @@
+from __future__ import annotations
+
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase, sessionmaker
 
-from core.config import get_settings
+from core.config import Settings, get_settings
 
 settings = get_settings()
 
+_ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
 
 class Base(DeclarativeBase):
     pass
 
 
+def resolve_async_database_url(settings: Settings) -> str | None:
+    if settings.async_database_url:
+        return settings.async_database_url
+    url = make_url(settings.database_url)
+    driver = _ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        return None
+    return url.set(drivername=f"{url.get_backend_name()}+{driver}").render_as_string(
+        hide_password=False
+    )
+
+
 engine = create_engine(settings.database_url, future=True)
 SessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False, future=True)
+
+_async_database_url = resolve_async_database_url(settings)
+async_engine: AsyncEngine | None = (
+    create_async_engine(_async_database_url) if _async_database_url else None
+)
+AsyncSessionLocal: async_sessionmaker[AsyncSession] | None = (
+    async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+    if async_engine is not None
+    else None
+)
+
+
+def new_async_session() -> AsyncSession:
+    if AsyncSessionLocal is None:
+        raise RuntimeError("Nenhum driver assíncrono configurado para o banco de dados.")
+    return AsyncSessionLocal()
@@ -1,8 +1,9 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from core.database import SessionLocal
+from core.database import SessionLocal, new_async_session
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -11,3 +12,8 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    async with new_async_session() as db:
+        yield db
@@ -0,0 +1,86 @@
+"""Sparse fieldsets for the list endpoints (``?fields=id,name``).
+
+The requested fields narrow both the query, through ``load_only`` and by
+leaving out the loaders of relationships nobody asked for, and the
+serialized rows, through a read schema restricted to those fields.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Callable, Collection, Mapping, Sequence
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+from sqlalchemy import inspect
+from sqlalchemy.orm import load_only
+from sqlalchemy.orm.interfaces import ORMOption
+
+from core.exceptions import BadRequestError
+from core.json_response import type_adapter
+from core.pagination import SortKey
+
+Fieldset = frozenset[str]
+
+# Fieldsets come from the client, so every per-fieldset cache is bounded
+SPARSE_CACHE_SIZE = 256
+
+
+def parse_fields(fields: str | None, schema: type[BaseModel]) -> Fieldset | None:
+    """Parses a comma-separated ``fields`` parameter; None means every field."""
+    if not fields:
+        return None
+    requested = frozenset(name.strip() for name in fields.split(",") if name.strip())
+    unknown = requested - schema.model_fields.keys()
+    if unknown:
+        raise BadRequestError(f"Campos desconhecidos: {', '.join(sorted(unknown))}.")
+    return requested or None
+
+
+@lru_cache(maxsize=SPARSE_CACHE_SIZE)
+def sparse_schema(schema: type[BaseModel], fields: Fieldset | None) -> type[BaseModel]:
+    """``schema`` with only ``fields``, in the schema's own order."""
+    if fields is None:
+        return schema
+    return create_model(
+        f"{schema.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **{
+            name: (info.annotation, info)
+            for name, info in schema.model_fields.items()
+            if name in fields
+        },
+    )
+
+
+@lru_cache(maxsize=SPARSE_CACHE_SIZE)
+def sparse_list_adapter(schema: type[BaseModel], fields: Fieldset | None) -> TypeAdapter[Any]:
+    """Adapter for a list of ``sparse_schema(schema, fields)``, cached by
+    ``(schema, fields)`` rather than by the generated class."""
+    if fields is None:
+        return type_adapter(list[schema])
+    return TypeAdapter(list[sparse_schema(schema, fields)])
+
+
+def fieldset_options(
+    model: type[Any],
+    fields: Collection[str] | None,
+    sort_keys: Sequence[SortKey],
+    relationship_loaders: Mapping[str, Callable[[], ORMOption]] | None = None,
+) -> list[ORMOption]:
+    """Loader options for ``fields``: every relationship loader when no
+    fieldset was requested, otherwise ``load_only`` over the requested
+    columns plus the sort keys, and only the requested relationships'
+    loaders."""
+    relationship_loaders = relationship_loaders or {}
+    if fields is None:
+        return [loader() for loader in relationship_loaders.values()]
+    column_names = inspect(model).column_attrs.keys()
+    columns = [column for column, _ in sort_keys]
+    sort_names = {column.key for column in columns}
+    columns += [
+        getattr(model, name)
+        for name in sorted(fields)
+        if name in column_names and name not in sort_names
+    ]
+    options: list[ORMOption] = [load_only(*columns)]
+    options += [loader() for name, loader in relationship_loaders.items() if name in fields]
+    return options
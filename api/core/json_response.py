@@ -0,0 +1,73 @@
+"""JSON responses serialized by pydantic-core straight to bytes.
+
+``model_json_response`` validates ORM rows through a cached ``TypeAdapter``
+of the read schema (``ReagentRead``, ``list[ReagentRead]``) and dumps them
+with ``dump_json``, so no intermediate dicts or ``json.dumps`` pass are
+needed.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Mapping
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+from starlette.responses import Response
+
+
+class JSONBytesResponse(Response):
+    media_type = "application/json"
+
+
+# Keyed by schema identity: only for the app's own, fixed set of schemas
+@lru_cache(maxsize=None)
+def type_adapter(schema: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(schema)
+
+
+def _is_validated(obj: Any) -> bool:
+    if isinstance(obj, BaseModel):
+        return True
+    return isinstance(obj, list) and bool(obj) and all(isinstance(item, BaseModel) for item in obj)
+
+
+def dump_adapter_json(adapter: TypeAdapter[Any], obj: Any) -> bytes:
+    """Dumps ``obj`` through ``adapter``. ORM objects are validated into the
+    schema first; models that already are are dumped in one pass."""
+    if not _is_validated(obj):
+        obj = adapter.validate_python(obj, from_attributes=True)
+    return adapter.dump_json(obj)
+
+
+def dump_models_json(schema: Any, obj: Any) -> bytes:
+    """Serializes ORM objects (or plain data) as ``schema`` to JSON bytes."""
+    return dump_adapter_json(type_adapter(schema), obj)
+
+
+def model_json_response(
+    schema: Any,
+    obj: Any,
+    status_code: int = 200,
+    headers: Mapping[str, str] | None = None,
+) -> JSONBytesResponse:
+    return JSONBytesResponse(dump_models_json(schema, obj), status_code=status_code, headers=headers)
+
+
+def adapter_json_response(
+    adapter: TypeAdapter[Any],
+    obj: Any,
+    status_code: int = 200,
+    headers: Mapping[str, str] | None = None,
+) -> JSONBytesResponse:
+    """Like ``model_json_response`` for adapters cached by the caller, e.g.
+    the per-fieldset ones of ``core.fieldsets``."""
+    return JSONBytesResponse(dump_adapter_json(adapter, obj), status_code=status_code, headers=headers)
+
+
+def json_response(
+    data: Any,
+    status_code: int = 200,
+    headers: Mapping[str, str] | None = None,
+) -> JSONBytesResponse:
+    """Serializes plain dicts and lists (e.g. run states) in one pass."""
+    return JSONBytesResponse(to_json(data), status_code=status_code, headers=headers)
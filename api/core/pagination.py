@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, Sequence, Tuple, TypeVar
+
+from sqlalchemy import Select, String, and_, or_, type_coerce
+from sqlalchemy.orm import InstrumentedAttribute, Session
+from starlette.requests import Request
+
+from core.config import get_settings
+from core.exceptions import BadRequestError
+
+T = TypeVar("T")
+
+# (column, descending); the last column must be unique, e.g. the id
+SortKey = Tuple[InstrumentedAttribute[Any], bool]
+
+_DATETIME_TAG = "dt"
+
+
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return [_DATETIME_TAG, value.isoformat()]
+    return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, list) and len(value) == 2 and value[0] == _DATETIME_TAG:
+        return datetime.fromisoformat(value[1])
+    return value
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encodes the sort key of the last row of a page as an opaque token."""
+    payload = json.dumps([_encode_value(value) for value in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _check_value(value: Any, column: InstrumentedAttribute[Any]) -> Any:
+    """Rejects values whose type does not match the sort key's column, so a
+    crafted cursor never reaches the SQL bind."""
+    if value is None:
+        return value
+    python_type = column.type.python_type
+    if isinstance(value, bool) and python_type is not bool:
+        raise ValueError(value)
+    if python_type is float and isinstance(value, int):
+        return float(value)
+    if not isinstance(value, python_type):
+        raise ValueError(value)
+    return value
+
+
+def decode_cursor(token: str, sort_keys: Sequence[SortKey]) -> list[Any]:
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(sort_keys):
+            raise ValueError(token)
+        return [
+            _check_value(_decode_value(value), column)
+            for value, (column, _) in zip(values, sort_keys)
+        ]
+    except (TypeError, ValueError) as exc:
+        raise BadRequestError("Cursor de paginação inválido.") from exc
+
+
+def keyset_param(db: Session, value: Any) -> Any:
+    """Binds a cursor value so it compares equal to the stored one."""
+    # SQLite keeps timestamps as text and CURRENT_TIMESTAMP defaults carry no
+    # fractional seconds, so bind datetimes in that shape.
+    if not isinstance(value, datetime) or db.get_bind().dialect.name != "sqlite":
+        return value
+    text = value.strftime("%Y-%m-%d %H:%M:%S")
+    if value.microsecond:
+        text += f".{value.microsecond:06d}"
+    return type_coerce(text, String)
+
+
+def paginate_keyset(
+    db: Session,
+    query: Select[Tuple[T]],
+    sort_keys: Sequence[SortKey],
+    limit: int | None,
+    after: Sequence[Any] | None = None,
+) -> tuple[list[T], tuple[Any, ...] | None]:
+    """Returns up to ``limit`` rows ordered by ``sort_keys`` that come after
+    the ``after`` key, and the key to continue from if there are more. With
+    no ``limit``, every remaining row is returned."""
+    query = query.order_by(
+        *(column.desc() if descending else column.asc() for column, descending in sort_keys)
+    )
+    if limit is not None:
+        query = query.limit(limit + 1)
+    if after is not None:
+        params = [keyset_param(db, value) for value in after]
+        # (a, b) after (x, y): a > x OR (a = x AND b > y), flipped for descending keys
+        conditions = []
+        for index, (column, descending) in enumerate(sort_keys):
+            beyond = column < params[index] if descending else column > params[index]
+            conditions.append(
+                and_(*(sort_keys[i][0] == params[i] for i in range(index)), beyond)
+            )
+        query = query.where(or_(*conditions))
+    rows = list(db.scalars(query))
+    if limit is None or len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, tuple(getattr(rows[-1], column.key) for column, _ in sort_keys)
+
+
+def page_limit(limit: int | None, after: str | None = None) -> int | None:
+    """The requested page size, capped at the configured maximum.
+
+    Requests with neither ``limit`` nor ``after`` get the whole list, as
+    before the endpoints were paginated; a cursor without a limit continues
+    with the default page size.
+    """
+    settings = get_settings()
+    if limit is None:
+        return settings.page_size_default if after else None
+    return max(1, min(limit, settings.page_size_max))
+
+
+def decode_after(after: str | None, sort_keys: Sequence[SortKey]) -> list[Any] | None:
+    return decode_cursor(after, sort_keys) if after else None
+
+
+def next_page_headers(
+    request: Request, next_key: Sequence[Any] | None, limit: int | None
+) -> dict[str, str]:
+    """A ``Link: <...>; rel="next"`` header when there is another page."""
+    if next_key is None:
+        return {}
+    url = request.url.include_query_params(after=encode_cursor(next_key), limit=limit)
+    return {"Link": f'<{url}>; rel="next"'}
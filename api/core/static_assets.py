@@ -0,0 +1,233 @@
+"""Content-hashed, precompressed copies of the static files.
+
+``build_assets`` copies every file under a mount's source directory to
+``<name>.<hash><ext>`` in the build directory, writes gzip (and brotli, when
+the ``brotli`` package is installed) siblings for text files, and records
+the mapping in ``manifest.json``. Templates resolve URLs with the
+``asset_url`` global; hashed URLs are served with an immutable
+Cache-Control, anything else falls back to the source file.
+
+    python -m core.static_assets
+"""
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import mimetypes
+import os
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Mapping
+
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.types import Scope
+
+from core.config import get_settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+app_dir = Path(__file__).resolve().parent.parent
+
+# URL prefix -> source directory
+ASSET_MOUNTS: Mapping[str, Path] = {
+    "/static": app_dir / "static",
+    "/assets": app_dir / "assets",
+}
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+MANIFEST_NAME = "manifest.json"
+
+_COMPRESSIBLE_SUFFIXES = {".css", ".js", ".json", ".svg", ".txt", ".html", ".map", ".wav"}
+# Preferred first
+_ENCODING_SUFFIXES = (("br", ".br"), ("gzip", ".gz"))
+
+
+@dataclass(frozen=True, slots=True)
+class BuiltAsset:
+    path: Path
+    media_type: str | None
+    # Content-codings with a precompressed sibling next to ``path``
+    encodings: frozenset[str]
+
+
+class AssetManifest:
+    def __init__(self, url_prefix: str, build_dir: Path, entries: Mapping[str, str]) -> None:
+        self.url_prefix = url_prefix
+        self.build_dir = build_dir
+        self.entries = dict(entries)
+        self._built: Dict[str, BuiltAsset] = {}
+        for source_name, hashed_name in self.entries.items():
+            path = build_dir / hashed_name
+            self._built[hashed_name] = BuiltAsset(
+                path=path,
+                media_type=mimetypes.guess_type(source_name)[0],
+                encodings=frozenset(
+                    encoding
+                    for encoding, suffix in _ENCODING_SUFFIXES
+                    if path.with_name(path.name + suffix).is_file()
+                ),
+            )
+
+    def url_for(self, name: str) -> str:
+        name = name.lstrip("/")
+        return f"{self.url_prefix}/{self.entries.get(name, name)}"
+
+    def built(self, hashed_name: str) -> BuiltAsset | None:
+        return self._built.get(hashed_name)
+
+
+def _hashed_name(relative: Path, digest: str) -> Path:
+    return relative.with_name(f"{relative.stem}.{digest}{relative.suffix}")
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Writes ``data`` to a temp file of its own next to ``path`` and renames
+    it into place, so workers building at once never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            tmp.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _write_compressed(path: Path, data: bytes) -> None:
+    gz_path = path.with_name(path.name + ".gz")
+    if not gz_path.exists():
+        compressed = gzip.compress(data, compresslevel=9, mtime=0)
+        if len(compressed) < len(data):
+            _write_atomic(gz_path, compressed)
+    br_path = path.with_name(path.name + ".br")
+    if brotli is not None and not br_path.exists():
+        compressed = brotli.compress(data, quality=11)
+        if len(compressed) < len(data):
+            _write_atomic(br_path, compressed)
+
+
+def build_assets(source_dir: Path, build_dir: Path) -> Dict[str, str]:
+    """Writes hashed copies and compressed siblings of every file under
+    ``source_dir`` and returns the source -> hashed name manifest. Files whose
+    hashed copy already exists are skipped, so rebuilding is cheap; every
+    file is written atomically, so concurrent builds are safe."""
+    build_dir.mkdir(parents=True, exist_ok=True)
+    manifest: Dict[str, str] = {}
+    if source_dir.is_dir():
+        for source in sorted(source_dir.rglob("*")):
+            if not source.is_file() or source.name.startswith("."):
+                continue
+            data = source.read_bytes()
+            relative = source.relative_to(source_dir)
+            hashed = _hashed_name(relative, hashlib.sha256(data).hexdigest()[:12])
+            target = build_dir / hashed
+            if not target.exists():
+                _write_atomic(target, data)
+            if source.suffix.lower() in _COMPRESSIBLE_SUFFIXES:
+                _write_compressed(target, data)
+            manifest[relative.as_posix()] = hashed.as_posix()
+
+    _write_atomic(
+        build_dir / MANIFEST_NAME,
+        json.dumps(manifest, indent=2, sort_keys=True).encode("utf-8"),
+    )
+    return manifest
+
+
+def load_manifest(url_prefix: str, build_dir: Path) -> AssetManifest:
+    manifest_path = build_dir / MANIFEST_NAME
+    entries: Dict[str, str] = {}
+    if manifest_path.is_file():
+        entries = json.loads(manifest_path.read_text(encoding="utf-8"))
+    return AssetManifest(url_prefix, build_dir, entries)
+
+
+def mount_build_dir(url_prefix: str) -> Path:
+    return Path(get_settings().static_build_dir) / url_prefix.strip("/")
+
+
+_manifests: Dict[str, AssetManifest] = {}
+
+
+def register_manifest(manifest: AssetManifest) -> None:
+    _manifests[manifest.url_prefix] = manifest
+
+
+def asset_url(url: str) -> str:
+    """Resolves ``/static/styles.css`` to its hashed URL when it was built."""
+    for url_prefix, manifest in _manifests.items():
+        if url.startswith(url_prefix + "/"):
+            return manifest.url_for(url[len(url_prefix) + 1 :])
+    return url
+
+
+def _accepted_encodings(accept_encoding: str) -> set[str]:
+    accepted = set()
+    for part in accept_encoding.split(","):
+        coding, _, params = part.strip().partition(";")
+        if params.strip().replace(" ", "") in {"q=0", "q=0.0", "q=0.00", "q=0.000"}:
+            continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+class FingerprintedStaticFiles(StaticFiles):
+    """Serves hashed builds immutably, with a precompressed variant when the
+    client accepts one; other paths are served from ``directory`` as usual."""
+
+    def __init__(self, directory: Path, manifest: AssetManifest) -> None:
+        super().__init__(directory=str(directory), check_dir=False)
+        self.manifest = manifest
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        built = self.manifest.built(path.replace(os.sep, "/"))
+        if built is None or scope["method"] not in ("GET", "HEAD"):
+            return await super().get_response(path, scope)
+
+        # The hashed name identifies the content; each encoding gets its own
+        # strong ETag, since the encoded files are different representations.
+        headers = {"Cache-Control": IMMUTABLE_CACHE_CONTROL, "ETag": f'"{built.path.name}"'}
+        file_path = built.path
+        if built.encodings:
+            headers["Vary"] = "Accept-Encoding"
+            accepted = _accepted_encodings(Headers(scope=scope).get("accept-encoding", ""))
+            for encoding, suffix in _ENCODING_SUFFIXES:
+                if encoding in built.encodings and encoding in accepted:
+                    file_path = built.path.with_name(built.path.name + suffix)
+                    headers["Content-Encoding"] = encoding
+                    headers["ETag"] = f'"{file_path.name}"'
+                    break
+        return FileResponse(file_path, media_type=built.media_type, headers=headers)
+
+
+def setup_static_assets(build: bool) -> Dict[str, FingerprintedStaticFiles]:
+    """Builds (optionally) and registers every mount's manifest, returning the
+    static apps to mount by URL prefix."""
+    apps: Dict[str, FingerprintedStaticFiles] = {}
+    for url_prefix, source_dir in ASSET_MOUNTS.items():
+        build_dir = mount_build_dir(url_prefix)
+        if build:
+            build_assets(source_dir, build_dir)
+        manifest = load_manifest(url_prefix, build_dir)
+        register_manifest(manifest)
+        apps[url_prefix] = FingerprintedStaticFiles(source_dir, manifest)
+    return apps
+
+
+def main() -> int:
+    for url_prefix, source_dir in ASSET_MOUNTS.items():
+        manifest = build_assets(source_dir, mount_build_dir(url_prefix))
+        print(f"{url_prefix}: {len(manifest)} arquivos", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,70 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
 from pathlib import Path
+
 from fastapi.templating import Jinja2Templates
+from markupsafe import Markup
+
+from core.static_assets import asset_url
 
 templates_dir = Path(__file__).resolve().parent.parent / "templates"
 templates = Jinja2Templates(directory=str(templates_dir))
+templates.env.globals["asset_url"] = asset_url
+
+
+class FragmentCache:
+    """Size-bounded LRU of rendered template fragments.
+
+    Keys must change whenever the fragment's inputs do (e.g. include a
+    version), so entries never need to be invalidated individually.
+    """
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._fragments: OrderedDict[Hashable, Markup] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Markup | None:
+        with self._lock:
+            fragment = self._fragments.get(key)
+            if fragment is not None:
+                self._fragments.move_to_end(key)
+            return fragment
+
+    def put(self, key: Hashable, fragment: str) -> Markup:
+        fragment = Markup(fragment)
+        with self._lock:
+            self._fragments[key] = fragment
+            self._fragments.move_to_end(key)
+            while len(self._fragments) > self.max_entries:
+                self._fragments.popitem(last=False)
+        return fragment
+
+    def get_or_render(self, key: Hashable, render: Callable[[], str]) -> Markup:
+        fragment = self.get(key)
+        if fragment is None:
+            fragment = self.put(key, render())
+        return fragment
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fragments.clear()
+
+    def __len__(self) -> int:
+        return len(self._fragments)
+
+
+def template_macro(template_name: str, macro_name: str) -> Callable[..., Markup]:
+    return getattr(templates.get_template(template_name).module, macro_name)
+
+
+# Characters that could end a <script> element or start markup, as JSON escapes
+_SCRIPT_JSON_ESCAPES = {b"<": b"\\u003c", b">": b"\\u003e", b"&": b"\\u0026", b"'": b"\\u0027"}
+
+
+def script_json(data: bytes) -> Markup:
+    """Serialized JSON made safe to embed in HTML, like Jinja's ``tojson``."""
+    for char, escape in _SCRIPT_JSON_ESCAPES.items():
+        data = data.replace(char, escape)
+    return Markup(data.decode("utf-8"))
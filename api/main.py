@@ -1,9 +1,12 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
-from pathlib import Path
 
+from core.compression import CompressionMiddleware
 from core.config import get_settings
 from core.error_handlers import register_exception_handlers
+from core.static_assets import setup_static_assets
 from routers import (
     health_router,
     instrument,
@@ -15,17 +18,50 @@ from routers import (
     ui_scenario_run,
     artist,
     scenario_screen,
+    admin,
 )
+from services.run_log import get_run_log, run_log_flusher
+from services.run_store import get_run_store, run_store_sweeper
 
 settings = get_settings()
-app = FastAPI(title=settings.app_name)
 
-base_dir = Path(__file__).resolve().parent
-static_dir = base_dir / "static"
-assets_dir = base_dir / "assets"
 
-app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
-app.mount("/assets", StaticFiles(directory=str(assets_dir)), name="assets")
+@asynccontextmanager
+async def lifespan(_: FastAPI):
+    tasks = [
+        asyncio.create_task(
+            run_store_sweeper(get_run_store(), settings.run_store_sweep_interval_seconds)
+        )
+    ]
+    run_log = get_run_log()
+    if run_log is not None:
+        tasks.append(
+            asyncio.create_task(
+                run_log_flusher(run_log, settings.run_log_flush_interval_seconds)
+            )
+        )
+    try:
+        yield
+    finally:
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+
+
+app = FastAPI(title=settings.app_name, lifespan=lifespan)
+# Images and audio under /assets are already compressed
+app.add_middleware(
+    CompressionMiddleware,
+    minimum_size=settings.compression_minimum_size,
+    gzip_level=settings.compression_gzip_level,
+    brotli_quality=settings.compression_brotli_quality,
+    exclude_paths=("/assets",),
+)
+
+for url_prefix, static_app in setup_static_assets(settings.static_build_on_startup).items():
+    app.mount(url_prefix, static_app, name=url_prefix.strip("/"))
 
 app.include_router(health_router.router)
 app.include_router(instrument.router)
@@ -37,4 +73,5 @@ app.include_router(ui_scenario.router)
 app.include_router(ui_scenario_run.router)
 app.include_router(artist.router)
 app.include_router(scenario_screen.router)
+app.include_router(admin.router)
 register_exception_handlers(app)
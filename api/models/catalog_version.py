@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from sqlalchemy import Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.database import Base
+
+
+class CatalogVersion(Base):
+    """Single-row counter bumped by every reagent, instrument, reaction and
+    artist write."""
+
+    __tablename__ = "catalog_versions"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -2,7 +2,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING  
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.database import Base
@@ -15,6 +15,10 @@ if TYPE_CHECKING:
 
 class Scenario(Base):
     __tablename__ = "scenarios"
+    __table_args__ = (
+        Index("ix_scenarios_is_active_created_at_id", "is_active", "created_at", "id"),
+        Index("ix_scenarios_created_at_id", "created_at", "id"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     title: Mapped[str] = mapped_column(String(150), nullable=False)
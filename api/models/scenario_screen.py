@@ -2,7 +2,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey, Integer, String, Text
+from sqlalchemy import ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from core.database import Base
@@ -20,6 +20,9 @@ class ScenarioScreenType(str, Enum):
 
 class ScenarioScreen(Base):
     __tablename__ = "scenario_screens"
+    __table_args__ = (
+        Index("ix_scenario_screens_scenario_id_order_index", "scenario_id", "order_index"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, index=True)
     scenario_id: Mapped[int] = mapped_column(
@@ -0,0 +1,24 @@
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from controllers.admin import validate_scenarios
+from core.dependencies import get_db
+from core.json_response import JSONBytesResponse
+from services.scenario_validation import MAX_WORKERS
+
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Admin"],
+    default_response_class=JSONBytesResponse,
+)
+
+
+@router.post("/scenarios/validate", response_class=JSONBytesResponse)
+def validate_scenarios_route(
+    scenario_id: list[int] | None = Query(None),
+    include_inactive: bool = False,
+    workers: int | None = Query(None, ge=1, le=MAX_WORKERS),
+    db: Session = Depends(get_db),
+):
+    return validate_scenarios(db, scenario_id, include_inactive, workers)
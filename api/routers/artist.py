@@ -1,5 +1,4 @@
-from fastapi import APIRouter, Depends
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
 
 from controllers.artist import (
@@ -11,38 +10,49 @@ from controllers.artist import (
 )
 from schemas.artist import ArtistCreate, ArtistUpdate
 from core.dependencies import get_db
+from core.json_response import JSONBytesResponse
 
 
 router = APIRouter(
     prefix="/artists",
     tags=["Artists"],
-    default_response_class=HTMLResponse,
+    default_response_class=JSONBytesResponse,
 )
 
 
-@router.post("/", response_class=HTMLResponse, status_code=201)
+@router.post("/", response_class=JSONBytesResponse, status_code=201)
 def create_artist_route(payload: ArtistCreate, db: Session = Depends(get_db)):
     return create_artist(payload, db)
 
 
-@router.get("/", response_class=HTMLResponse)
-def list_artists_route(db: Session = Depends(get_db)):
-    return list_artists(db)
+@router.get("/", response_class=JSONBytesResponse)
+def list_artists_route(
+    request: Request,
+    limit: int | None = Query(None, ge=1),
+    after: str | None = Query(None),
+    fields: str | None = Query(None),
+    db: Session = Depends(get_db),
+):
+    return list_artists(request, db, limit=limit, after=after, fields=fields)
 
 
-@router.get("/{artist_id}", response_class=HTMLResponse)
-def get_artist_route(artist_id: int, db: Session = Depends(get_db)):
-    return get_artist(artist_id, db)
+@router.get("/{artist_id}", response_class=JSONBytesResponse)
+def get_artist_route(
+    artist_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
+):
+    return get_artist(artist_id, request, db)
 
 
-@router.put("/{artist_id}", response_class=HTMLResponse)
-@router.patch("/{artist_id}", response_class=HTMLResponse)
+@router.put("/{artist_id}", response_class=JSONBytesResponse)
+@router.patch("/{artist_id}", response_class=JSONBytesResponse)
 def update_artist_route(
     artist_id: int, payload: ArtistUpdate, db: Session = Depends(get_db)
 ):
     return update_artist(artist_id, payload, db)
 
 
-@router.delete("/{artist_id}", response_class=HTMLResponse, status_code=204)
+@router.delete("/{artist_id}", response_class=JSONBytesResponse, status_code=204)
 def delete_artist_route(artist_id: int, db: Session = Depends(get_db)):
     return delete_artist(artist_id, db)
@@ -1,8 +1,29 @@
+from dataclasses import asdict
+
 from fastapi import APIRouter, status
 
+from core.compression import get_compression_stats
+from services.run_actors import get_actor_registry
+from services.run_store import get_run_store
+
 router = APIRouter(tags=["Health"])
 
 
 @router.get("/health", status_code=status.HTTP_200_OK)
 def read_health() -> dict[str, str]:
     return {"status": "ok", "message": "Serviço operacional"}
+
+
+@router.get("/health/runs", status_code=status.HTTP_200_OK)
+def read_run_store_health() -> dict[str, int]:
+    return asdict(get_run_store().stats())
+
+
+@router.get("/health/run-actors", status_code=status.HTTP_200_OK)
+async def read_run_actor_health() -> dict[str, int | float]:
+    return asdict(get_actor_registry().stats())
+
+
+@router.get("/health/compression", status_code=status.HTTP_200_OK)
+def read_compression_health() -> dict[str, int | float]:
+    return asdict(get_compression_stats())
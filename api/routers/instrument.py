@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Depends
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
 
 from core.dependencies import get_db  
+from core.json_response import JSONBytesResponse
 from controllers.instrument import (
     list_instruments, 
     create_instrument, 
@@ -15,30 +15,35 @@ from schemas.instrument import InstrumentCreate, InstrumentUpdate
 router = APIRouter(
     prefix="/instruments",
     tags=["Instruments"],
-    default_response_class=HTMLResponse,
+    default_response_class=JSONBytesResponse,
 )
 
-@router.post("/", response_class=HTMLResponse)
+@router.post("/", response_class=JSONBytesResponse)
 def create_instrument_route(
     payload: InstrumentCreate,
     db: Session = Depends(get_db)  
 ):
     return create_instrument(payload, db)  
 
-@router.get("/", response_class=HTMLResponse)
+@router.get("/", response_class=JSONBytesResponse)
 def list_instruments_route(
-    db: Session = Depends(get_db)
+    request: Request,
+    limit: int | None = Query(None, ge=1),
+    after: str | None = Query(None),
+    fields: str | None = Query(None),
+    db: Session = Depends(get_db),
 ):
-    return list_instruments(db)
+    return list_instruments(request, db, limit=limit, after=after, fields=fields)
 
-@router.get("/{instrument_id}", response_class=HTMLResponse)
+@router.get("/{instrument_id}", response_class=JSONBytesResponse)
 def get_instrument_route(
     instrument_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    db: Session = Depends(get_db),
 ):
-    return get_instrument(instrument_id, db)
+    return get_instrument(instrument_id, request, db)
 
-@router.put("/{instrument_id}", response_class=HTMLResponse)
+@router.put("/{instrument_id}", response_class=JSONBytesResponse)
 def update_instrument_route(
     instrument_id: int,
     payload: InstrumentUpdate,
@@ -46,7 +51,7 @@ def update_instrument_route(
 ):
     return update_instrument(instrument_id, payload, db)
 
-@router.delete("/{instrument_id}", response_class=HTMLResponse)
+@router.delete("/{instrument_id}", response_class=JSONBytesResponse)
 def delete_instrument_route(
     instrument_id: int,
     db: Session = Depends(get_db)
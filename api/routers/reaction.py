@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Depends
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
 
 from core.dependencies import get_db  
+from core.json_response import JSONBytesResponse
 from controllers.reaction import (
     ReactionCreatePayload,
     ReactionUpdatePayload,
@@ -16,33 +16,38 @@ from controllers.reaction import (
 router = APIRouter(
     prefix="/reactions",
     tags=["Reactions"],
-    default_response_class=HTMLResponse,
+    default_response_class=JSONBytesResponse,
 )
 
 
-@router.post("/", response_class=HTMLResponse, status_code=201)
+@router.post("/", response_class=JSONBytesResponse, status_code=201)
 def create_reaction_route(
     payload: ReactionCreatePayload,
     db: Session = Depends(get_db)  
 ):
     return create_reaction(payload, db)  
 
-@router.get("/", response_class=HTMLResponse)
+@router.get("/", response_class=JSONBytesResponse)
 def list_reactions_route(
-    db: Session = Depends(get_db)
+    request: Request,
+    limit: int | None = Query(None, ge=1),
+    after: str | None = Query(None),
+    fields: str | None = Query(None),
+    db: Session = Depends(get_db),
 ):
-    return list_reactions(db)
+    return list_reactions(request, db, limit=limit, after=after, fields=fields)
 
 
-@router.get("/{reaction_id}", response_class=HTMLResponse)
+@router.get("/{reaction_id}", response_class=JSONBytesResponse)
 def get_reaction_route(
     reaction_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    db: Session = Depends(get_db),
 ):
-    return get_reaction(reaction_id, db)
+    return get_reaction(reaction_id, request, db)
 
 
-@router.put("/{reaction_id}", response_class=HTMLResponse)
+@router.put("/{reaction_id}", response_class=JSONBytesResponse)
 def update_reaction_route(
     reaction_id: int, 
     payload: ReactionUpdatePayload,
@@ -51,7 +56,7 @@ def update_reaction_route(
     return update_reaction(reaction_id, payload, db)
 
 
-@router.delete("/{reaction_id}", response_class=HTMLResponse, status_code=204)
+@router.delete("/{reaction_id}", response_class=JSONBytesResponse, status_code=204)
 def delete_reaction_route(
     reaction_id: int,
     db: Session = Depends(get_db)
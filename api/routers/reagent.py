@@ -1,38 +1,43 @@
-from fastapi import APIRouter, Depends
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
 
 from controllers.reagent import create_reagent, list_reagents, get_reagent, update_reagent, delete_reagent
 from schemas.reagent import ReagentCreate, ReagentUpdate
 from core.dependencies import get_db  
+from core.json_response import JSONBytesResponse
 
 router = APIRouter(
     prefix="/reagents",
     tags=["Reagents"],
-    default_response_class=HTMLResponse,
+    default_response_class=JSONBytesResponse,
 )
 
-@router.post("/", response_class=HTMLResponse)
+@router.post("/", response_class=JSONBytesResponse)
 def create_reagent_route(
     payload: ReagentCreate,
     db: Session = Depends(get_db) 
 ):
     return create_reagent(payload, db)
 
-@router.get("/", response_class=HTMLResponse)
+@router.get("/", response_class=JSONBytesResponse)
 def list_reagents_route(
-    db: Session = Depends(get_db) 
+    request: Request,
+    limit: int | None = Query(None, ge=1),
+    after: str | None = Query(None),
+    fields: str | None = Query(None),
+    db: Session = Depends(get_db),
 ):
-    return list_reagents(db)
+    return list_reagents(request, db, limit=limit, after=after, fields=fields)
 
-@router.get("/{reagent_id}", response_class=HTMLResponse)
+@router.get("/{reagent_id}", response_class=JSONBytesResponse)
 def get_reagent_route(
-    reagent_id: int, 
-    db: Session = Depends(get_db)
+    reagent_id: int,
+    request: Request,
+    db: Session = Depends(get_db),
 ):
-    return get_reagent(reagent_id, db)
+    return get_reagent(reagent_id, request, db)
 
-@router.put("/{reagent_id}", response_class=HTMLResponse)
+@router.put("/{reagent_id}", response_class=JSONBytesResponse)
 def update_reagent_route(
     reagent_id: int,
     payload: ReagentUpdate,
@@ -40,7 +45,7 @@ def update_reagent_route(
 ):
     return update_reagent(reagent_id, payload, db)
 
-@router.delete("/{reagent_id}", response_class=HTMLResponse)    
+@router.delete("/{reagent_id}", response_class=JSONBytesResponse)    
 def delete_reagent_route(
     reagent_id: int,
     db: Session = Depends(get_db)
@@ -1,8 +1,8 @@
-from fastapi import APIRouter, Depends
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, Depends, Query, Request
 from sqlalchemy.orm import Session
 
 from core.dependencies import get_db  
+from core.json_response import JSONBytesResponse
 from controllers.scenario import (
     ScenarioCreatePayload,
     ScenarioUpdatePayload,
@@ -16,11 +16,11 @@ from controllers.scenario import (
 router = APIRouter(
     prefix="/scenarios",
     tags=["Scenarios"],
-    default_response_class=HTMLResponse,
+    default_response_class=JSONBytesResponse,
 )
 
 
-@router.post("/", response_class=HTMLResponse, status_code=201)
+@router.post("/", response_class=JSONBytesResponse, status_code=201)
 def create_scenario_route(
     payload: ScenarioCreatePayload,
     db: Session = Depends(get_db)  
@@ -28,14 +28,18 @@ def create_scenario_route(
     return create_scenario(payload, db)
 
 
-@router.get("/", response_class=HTMLResponse)
+@router.get("/", response_class=JSONBytesResponse)
 def list_scenarios_route(
-    db: Session = Depends(get_db)
+    request: Request,
+    limit: int | None = Query(None, ge=1),
+    after: str | None = Query(None),
+    fields: str | None = Query(None),
+    db: Session = Depends(get_db),
 ):
-    return list_scenarios(db)
+    return list_scenarios(request, db, limit=limit, after=after, fields=fields)
 
 
-@router.get("/{scenario_id}", response_class=HTMLResponse)
+@router.get("/{scenario_id}", response_class=JSONBytesResponse)
 def get_scenario_route(
     scenario_id: int,
     db: Session = Depends(get_db)
@@ -43,7 +47,7 @@ def get_scenario_route(
     return get_scenario(scenario_id, db)
 
 
-@router.put("/{scenario_id}", response_class=HTMLResponse)
+@router.put("/{scenario_id}", response_class=JSONBytesResponse)
 def update_scenario_route(
     scenario_id: int, 
     payload: ScenarioUpdatePayload,
@@ -52,7 +56,7 @@ def update_scenario_route(
     return update_scenario(scenario_id, payload, db)
 
 
-@router.delete("/{scenario_id}", response_class=HTMLResponse, status_code=204)
+@router.delete("/{scenario_id}", response_class=JSONBytesResponse, status_code=204)
 def delete_scenario_route(
     scenario_id: int,
     db: Session = Depends(get_db)
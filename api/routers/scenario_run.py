@@ -1,54 +1,80 @@
-from fastapi import APIRouter, Depends
-from fastapi.responses import HTMLResponse
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.dependencies import get_db  
+from core.dependencies import get_async_db
+from core.json_response import JSONBytesResponse
 from controllers.scenario_run import (
     AddReagentPayload,
     StartRunPayload,
     add_reagent,
     apply_action_to_run,
+    apply_actions_batch_to_run,
     get_run,
+    list_run_events,
+    recover_run,
     start_run,
+    start_runs_bulk,
 )
-from schemas.scenario_run import ScenarioRunActionApply
+from schemas.scenario_run import ScenarioRunActionApply, ScenarioRunBulkStart
 
 router = APIRouter(
     prefix="/scenario-runs",
     tags=["ScenarioRuns"],
-    default_response_class=HTMLResponse,
+    default_response_class=JSONBytesResponse,
 )
 
 
-@router.post("/", response_class=HTMLResponse, status_code=201)
-def start_run_route(
+@router.post("/", response_class=JSONBytesResponse, status_code=201)
+async def start_run_route(
     payload: StartRunPayload,
-    db: Session = Depends(get_db)  
+    db: AsyncSession = Depends(get_async_db)
 ):
-    return start_run(payload, db) 
+    return await start_run(payload, db)
 
 
-@router.post("/{run_id}/actions/add-reagent", response_class=HTMLResponse)
-def add_reagent_route(
+@router.post(":bulk", response_class=JSONBytesResponse, status_code=201)
+async def start_runs_bulk_route(
+    payload: ScenarioRunBulkStart,
+    db: AsyncSession = Depends(get_async_db)
+):
+    return await start_runs_bulk(payload, db)
+
+
+@router.post("/{run_id}/actions/add-reagent", response_class=JSONBytesResponse)
+async def add_reagent_route(
     run_id: str, 
     payload: AddReagentPayload,
-    db: Session = Depends(get_db)
 ):
-    return add_reagent(run_id, payload, db)
+    return await add_reagent(run_id, payload)
 
 
-@router.post("/{run_id}/actions", response_class=HTMLResponse)
-def apply_action_route(
+@router.post("/{run_id}/actions", response_class=JSONBytesResponse)
+async def apply_action_route(
     run_id: str, 
     payload: ScenarioRunActionApply,
-    db: Session = Depends(get_db)
+    since_version: int | None = Query(None, ge=0),
 ):
-    return apply_action_to_run(run_id, payload, db)
+    return await apply_action_to_run(run_id, payload, since_version=since_version)
 
 
-@router.get("/{run_id}", response_class=HTMLResponse)
-def get_run_route(
+@router.post("/{run_id}/actions:batch", response_class=JSONBytesResponse)
+async def apply_actions_batch_route(
     run_id: str,
-    db: Session = Depends(get_db)
+    payload: list[ScenarioRunActionApply],
 ):
-    return get_run(run_id, db)
+    return await apply_actions_batch_to_run(run_id, payload)
+
+
+@router.get("/{run_id}/events", response_class=JSONBytesResponse)
+def list_run_events_route(run_id: str):
+    return list_run_events(run_id)
+
+
+@router.post("/{run_id}/recover", response_class=JSONBytesResponse)
+async def recover_run_route(run_id: str):
+    return await recover_run(run_id)
+
+
+@router.get("/{run_id}", response_class=JSONBytesResponse)
+async def get_run_route(run_id: str, request: Request):
+    return await get_run(run_id, request)
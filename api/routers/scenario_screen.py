@@ -1,5 +1,4 @@
 from fastapi import APIRouter, Depends
-from fastapi.responses import HTMLResponse
 from sqlalchemy.orm import Session
 
 from controllers.scenario_screen import (
@@ -9,21 +8,22 @@ from controllers.scenario_screen import (
 )
 from schemas.scenario_screen import ScenarioScreenCreate
 from core.dependencies import get_db
+from core.json_response import JSONBytesResponse
 
 
 router = APIRouter(
     prefix="",
     tags=["Scenario Screens"],
-    default_response_class=HTMLResponse,
+    default_response_class=JSONBytesResponse,
 )
 
 
-@router.get("/scenario-screens/{screen_id}", response_class=HTMLResponse)
+@router.get("/scenario-screens/{screen_id}", response_class=JSONBytesResponse)
 def get_screen_route(screen_id: int, db: Session = Depends(get_db)):
     return get_screen(screen_id, db)
 
 
-@router.get("/scenarios/{scenario_id}/screens", response_class=HTMLResponse)
+@router.get("/scenarios/{scenario_id}/screens", response_class=JSONBytesResponse)
 def list_screens_for_scenario_route(
     scenario_id: int, db: Session = Depends(get_db)
 ):
@@ -32,7 +32,7 @@ def list_screens_for_scenario_route(
 
 @router.post(
     "/scenarios/{scenario_id}/screens",
-    response_class=HTMLResponse,
+    response_class=JSONBytesResponse,
     status_code=201,
 )
 def create_screens_for_scenario_route(
@@ -1,9 +1,11 @@
-from fastapi import APIRouter, Depends, Request
+from fastapi import APIRouter, Depends, Query, Request
 from fastapi.responses import HTMLResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from controllers import ui_scenario
-from core.dependencies import get_db
+from core.dependencies import get_async_db, get_db
+from core.json_response import JSONBytesResponse
 
 router = APIRouter(
     prefix="/ui/scenarios",
@@ -13,13 +15,17 @@ router = APIRouter(
 
 
 @router.get("/", response_class=HTMLResponse)
-def list_scenarios_page(request: Request, db: Session = Depends(get_db)):
-    return ui_scenario.list_scenarios_page(request, db)
+def list_scenarios_page(
+    request: Request, after: str | None = Query(None), db: Session = Depends(get_db)
+):
+    return ui_scenario.list_scenarios_page(request, db, after=after)
 
 
 @router.get("/{scenario_id}/run", response_class=HTMLResponse)
-def run_scenario_page(scenario_id: int, request: Request, db: Session = Depends(get_db)):
-    return ui_scenario.run_scenario_page(scenario_id, request, db)
+async def run_scenario_page(
+    scenario_id: int, request: Request, db: AsyncSession = Depends(get_async_db)
+):
+    return await ui_scenario.run_scenario_page(scenario_id, request, db)
 
 
 @router.get("/{scenario_id}/screens/{index}", response_class=HTMLResponse)
@@ -27,3 +33,10 @@ def scenario_screen_partial(
     scenario_id: int, index: int, request: Request, db: Session = Depends(get_db)
 ):
     return ui_scenario.scenario_screen_partial(scenario_id, index, request, db)
+
+
+@router.get("/{scenario_id}/screens", response_class=JSONBytesResponse)
+def scenario_screens_bundle(
+    scenario_id: int, request: Request, db: Session = Depends(get_db)
+):
+    return ui_scenario.scenario_screens_bundle(scenario_id, request, db)
@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, Request, Form
 from fastapi.responses import HTMLResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from controllers import ui_scenario_run
-from core.dependencies import get_db
+from core.dependencies import get_async_db
 
 router = APIRouter(
     prefix="/ui/scenario-runs",
@@ -13,8 +13,10 @@ router = APIRouter(
 
 
 @router.get("/{run_id}/state", response_class=HTMLResponse)
-def run_state_partial(run_id: str, request: Request, db: Session = Depends(get_db)):
-    return ui_scenario_run.run_state_partial(run_id, request, db)
+async def run_state_partial(
+    run_id: str, request: Request, db: AsyncSession = Depends(get_async_db)
+):
+    return await ui_scenario_run.run_state_partial(run_id, request, db)
 
 
 @router.post("/{run_id}/actions", response_class=HTMLResponse)
@@ -28,7 +30,7 @@ async def apply_action_ui(
     reagent_id: str = Form(""),
     amount_value: str = Form(""),
     amount_unit: str = Form(""),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     return await ui_scenario_run.apply_action_ui(
         request=request,
@@ -38,7 +38,7 @@ from schemas.scenario_screen import (
     ScenarioScreenSliderImageRead,
     ScenarioScreenType,
 )
-from schemas.scenario_run import ScenarioRunActionApply
+from schemas.scenario_run import ScenarioRunActionApply, ScenarioRunBulkStart
 from schemas.scenario import (
     ScenarioBase,
     ScenarioCreate,
@@ -90,4 +90,5 @@ __all__ = [
     "ScenarioScreenSliderImageRead",
     "ScenarioScreenType",
     "ScenarioRunActionApply",
+    "ScenarioRunBulkStart",
 ]
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import AliasChoices, BaseModel, ConfigDict, Field
 
 
 class ArtistTimelineEntryBase(BaseModel):
@@ -38,6 +38,10 @@ class ArtistUpdate(BaseModel):
 
 class ArtistRead(ArtistBase):
     id: int
-    timeline: list[ArtistTimelineEntryRead] = Field(default_factory=list)
+    # Read from Artist.timeline_entries when validated from the ORM
+    timeline: list[ArtistTimelineEntryRead] = Field(
+        default_factory=list,
+        validation_alias=AliasChoices("timeline", "timeline_entries"),
+    )
 
     model_config = ConfigDict(from_attributes=True)
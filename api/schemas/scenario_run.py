@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from typing import Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, model_validator
 
-from services.scenario_run import AmountUnit
+from services.run_state import AmountUnit
 
 
 class ScenarioRunActionApply(BaseModel):
@@ -15,3 +15,15 @@ class ScenarioRunActionApply(BaseModel):
     reagent_id: Optional[int] = None
     amount_value: Optional[float] = None
     amount_unit: Optional[AmountUnit] = None
+
+
+class ScenarioRunBulkStart(BaseModel):
+    scenario_id: int
+    count: Optional[int] = Field(default=None, ge=1, le=500)
+    student_labels: Optional[list[str]] = Field(default=None, min_length=1, max_length=500)
+
+    @model_validator(mode="after")
+    def check_count_or_labels(self) -> "ScenarioRunBulkStart":
+        if (self.count is None) == (self.student_labels is None):
+            raise ValueError("Informe count ou student_labels, mas não ambos.")
+        return self
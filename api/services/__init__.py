@@ -3,9 +3,18 @@ from services import (
     reagent,
     scenario,
     reaction,
+    reaction_index,
+    catalog_cache,
+    catalog_version,
     scenario_run,
+    run_state,
+    run_store,
+    run_log,
+    run_actors,
+    scenario_plan,
     artist,
     scenario_screen,
+    scenario_validation,
 )
 
 __all__ = [
@@ -13,7 +22,16 @@ __all__ = [
     "reagent",
     "scenario",
     "reaction",
+    "reaction_index",
+    "catalog_cache",
+    "catalog_version",
     "scenario_run",
+    "run_state",
+    "run_store",
+    "run_log",
+    "run_actors",
+    "scenario_plan",
     "artist",
     "scenario_screen",
+    "scenario_validation",
 ]
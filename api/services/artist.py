@@ -1,11 +1,18 @@
 from __future__ import annotations
 
-from sqlalchemy.orm import Session
+from typing import Any, Callable, Collection, Mapping, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
 
 from core.exceptions import ConflictError, NotFoundError
+from core.fieldsets import fieldset_options
+from core.pagination import SortKey, paginate_keyset
 from models.artist import Artist
 from models.artist_timeline_entry import ArtistTimelineEntry
 from schemas.artist import ArtistCreate, ArtistUpdate
+from services.catalog_version import bump_catalog_change_version
 
 
 def create_artist(db: Session, data: ArtistCreate) -> Artist:
@@ -32,20 +39,42 @@ def create_artist(db: Session, data: ArtistCreate) -> Artist:
                 )
             )
 
+    bump_catalog_change_version(db)
     db.commit()
     db.refresh(artist)
     return artist
 
 
-def get_artist(db: Session, artist_id: int) -> Artist:
-    artist = db.get(Artist, artist_id)
+def get_artist(db: Session, artist_id: int, options: Sequence[ORMOption] = ()) -> Artist:
+    artist = db.get(Artist, artist_id, options=options)
     if not artist:
         raise NotFoundError("Artista não encontrado.")
     return artist
 
 
-def list_artists(db: Session) -> list[Artist]:
-    return db.query(Artist).order_by(Artist.name).all()
+ARTIST_SORT_KEYS: tuple[SortKey, ...] = ((Artist.name, False), (Artist.id, False))
+# Relationships serialized by ArtistRead
+ARTIST_LOADERS: Mapping[str, Callable[[], ORMOption]] = {
+    "timeline": lambda: selectinload(Artist.timeline_entries),
+}
+# Everything ArtistRead serializes, for single-artist responses
+ARTIST_DETAIL_OPTIONS: tuple[ORMOption, ...] = tuple(
+    loader() for loader in ARTIST_LOADERS.values()
+)
+
+
+def list_artists(
+    db: Session,
+    limit: int | None,
+    after: Sequence[Any] | None = None,
+    fields: Collection[str] | None = None,
+) -> tuple[list[Artist], tuple[Any, ...] | None]:
+    """Returns one page of artists, by name, and the (name, id) key to
+    continue after, if there are more. With ``fields``, only those columns
+    and relationships are loaded."""
+    options = fieldset_options(Artist, fields, ARTIST_SORT_KEYS, ARTIST_LOADERS)
+    query = select(Artist).options(*options)
+    return paginate_keyset(db, query, ARTIST_SORT_KEYS, limit, after)
 
 
 def update_artist(db: Session, artist_id: int, data: ArtistUpdate) -> Artist:
@@ -75,6 +104,7 @@ def update_artist(db: Session, artist_id: int, data: ArtistUpdate) -> Artist:
             )
 
     db.add(artist)
+    bump_catalog_change_version(db)
     db.commit()
     db.refresh(artist)
     return artist
@@ -83,4 +113,5 @@ def update_artist(db: Session, artist_id: int, data: ArtistUpdate) -> Artist:
 def delete_artist(db: Session, artist_id: int) -> None:
     artist = get_artist(db, artist_id)
     db.delete(artist)
+    bump_catalog_change_version(db)
     db.commit()
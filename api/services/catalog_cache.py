@@ -0,0 +1,146 @@
+"""Process-wide read-through cache of reagent and instrument records.
+
+Run actions only need a few columns of each catalog row. Records are loaded
+on first use and belong to the persisted catalog change version they were
+read under: ``sync_catalog_cache``, called once per request or run action,
+drops them when a write in any process has moved that version since.
+"""
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Mapping
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models.instrument import Instrument
+from models.reagent import Reagent
+from services.catalog_version import get_catalog_change_version
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogReagent:
+    id: int
+    name: str
+    physical_state: str
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogInstrument:
+    id: int
+    name: str
+    instrument_type: str
+    is_container: bool
+    # Empty when the instrument accepts any physical state
+    allowed_states: frozenset[str]
+
+
+@dataclass(frozen=True, slots=True)
+class CatalogNames:
+    version: int
+    reagents: Mapping[int, str]
+    instruments: Mapping[int, str]
+
+
+def parse_allowed_states(raw: str | None) -> frozenset[str]:
+    return frozenset(state.strip() for state in (raw or "").split(",") if state.strip())
+
+
+_reagents: Dict[int, CatalogReagent] = {}
+_instruments: Dict[int, CatalogInstrument] = {}
+_names: CatalogNames | None = None
+# Catalog change version the cached entries were read under; a load that
+# raced with a newer version is not cached
+_version = -1
+_lock = threading.Lock()
+
+
+def sync_catalog_cache(db: Session) -> int:
+    """Reads the persisted catalog change version, dropping every cached
+    entry if it moved, and returns it."""
+    global _names, _version
+    version = get_catalog_change_version(db)
+    with _lock:
+        # The counter only grows; an older read must not roll the cache back
+        if version > _version:
+            _reagents.clear()
+            _instruments.clear()
+            _names = None
+            _version = version
+    return version
+
+
+def get_catalog_reagent(db: Session, reagent_id: int) -> CatalogReagent | None:
+    reagent = _reagents.get(reagent_id)
+    if reagent is not None:
+        return reagent
+    version = _version
+    row = db.execute(
+        select(Reagent.id, Reagent.name, Reagent.physical_state).where(Reagent.id == reagent_id)
+    ).one_or_none()
+    if row is None:
+        return None
+    reagent = CatalogReagent(id=row.id, name=row.name, physical_state=row.physical_state)
+    with _lock:
+        if version == _version:
+            _reagents[reagent_id] = reagent
+    return reagent
+
+
+def get_catalog_instrument(db: Session, instrument_id: int) -> CatalogInstrument | None:
+    instrument = _instruments.get(instrument_id)
+    if instrument is not None:
+        return instrument
+    version = _version
+    row = db.execute(
+        select(
+            Instrument.id,
+            Instrument.name,
+            Instrument.instrument_type,
+            Instrument.is_container,
+            Instrument.allowed_physical_states,
+        ).where(Instrument.id == instrument_id)
+    ).one_or_none()
+    if row is None:
+        return None
+    instrument = CatalogInstrument(
+        id=row.id,
+        name=row.name,
+        instrument_type=row.instrument_type,
+        is_container=row.is_container,
+        allowed_states=parse_allowed_states(row.allowed_physical_states),
+    )
+    with _lock:
+        if version == _version:
+            _instruments[instrument_id] = instrument
+    return instrument
+
+
+def get_catalog_names(db: Session) -> CatalogNames:
+    global _names
+    version = sync_catalog_cache(db)
+    names = _names
+    if names is not None and names.version == version:
+        return names
+    reagents = db.execute(select(Reagent.id, Reagent.name)).tuples().all()
+    instruments = db.execute(select(Instrument.id, Instrument.name)).tuples().all()
+    names = CatalogNames(
+        version=version,
+        reagents=MappingProxyType(dict(reagents)),
+        instruments=MappingProxyType(dict(instruments)),
+    )
+    with _lock:
+        if version == _version:
+            _names = names
+    return names
+
+
+def clear_catalog_cache() -> None:
+    global _names, _version
+    with _lock:
+        _reagents.clear()
+        _instruments.clear()
+        _names = None
+        _version = -1
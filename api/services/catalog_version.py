@@ -0,0 +1,39 @@
+"""Persisted catalog change counter behind the catalog routers' ETags.
+
+Writes bump the counter inside their own transaction, so it commits (or
+rolls back) with them and every process sees the same version. A GET only
+reads this one row to answer If-None-Match.
+"""
+from __future__ import annotations
+
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from models.catalog_version import CatalogVersion
+
+_ROW_ID = 1
+
+
+def get_catalog_change_version(db: Session) -> int:
+    version = db.scalar(select(CatalogVersion.version).where(CatalogVersion.id == _ROW_ID))
+    return version or 0
+
+
+def bump_catalog_change_version(db: Session) -> None:
+    """Increments the counter; call before the write's commit."""
+    result = db.execute(
+        update(CatalogVersion)
+        .where(CatalogVersion.id == _ROW_ID)
+        .values(version=CatalogVersion.version + 1)
+    )
+    if result.rowcount == 0:
+        # Databases created without the migration have no row yet
+        db.add(CatalogVersion(id=_ROW_ID, version=1))
+
+
+def catalog_cache_headers(db: Session) -> dict[str, str]:
+    """ETag and Cache-Control for GET responses of the catalog routers."""
+    return {
+        "ETag": f'W/"catalog-{get_catalog_change_version(db)}"',
+        "Cache-Control": "no-cache",
+    }
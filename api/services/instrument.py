@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+from typing import Any, Collection, Sequence
+
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from core.exceptions import ConflictError, NotFoundError
+from core.fieldsets import fieldset_options
+from core.pagination import SortKey, paginate_keyset
 from models.instrument import Instrument
+from services.catalog_version import bump_catalog_change_version
 
 
 def create_instrument(
@@ -28,6 +34,7 @@ def create_instrument(
         allowed_physical_states=allowed_physical_states,
     )
     db.add(instrument)
+    bump_catalog_change_version(db)
     db.commit()
     db.refresh(instrument)
     return instrument
@@ -40,8 +47,21 @@ def get_instrument_by_id(db: Session, instrument_id: int) -> Instrument:
     return instrument
 
 
-def list_instruments(db: Session) -> list[Instrument]:
-    return db.query(Instrument).order_by(Instrument.name).all()
+INSTRUMENT_SORT_KEYS: tuple[SortKey, ...] = ((Instrument.name, False), (Instrument.id, False))
+
+
+def list_instruments(
+    db: Session,
+    limit: int | None,
+    after: Sequence[Any] | None = None,
+    fields: Collection[str] | None = None,
+) -> tuple[list[Instrument], tuple[Any, ...] | None]:
+    """Returns one page of instruments, by name, and the (name, id) key to
+    continue after, if there are more. With ``fields``, only those columns
+    and relationships are loaded."""
+    options = fieldset_options(Instrument, fields, INSTRUMENT_SORT_KEYS)
+    query = select(Instrument).options(*options)
+    return paginate_keyset(db, query, INSTRUMENT_SORT_KEYS, limit, after)
 
 
 def update_instrument(
@@ -74,6 +94,7 @@ def update_instrument(
         instrument.allowed_physical_states = allowed_physical_states
 
     db.add(instrument)
+    bump_catalog_change_version(db)
     db.commit()
     db.refresh(instrument)
     return instrument
@@ -82,4 +103,5 @@ def update_instrument(
 def delete_instrument(db: Session, instrument_id: int) -> None:
     instrument = get_instrument_by_id(db, instrument_id)
     db.delete(instrument)
+    bump_catalog_change_version(db)
     db.commit()
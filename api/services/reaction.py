@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from typing import Sequence
+from typing import Any, Callable, Collection, Mapping, Sequence
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
 
 from core.exceptions import NotFoundError
+from core.fieldsets import fieldset_options
+from core.pagination import SortKey, paginate_keyset
 from models.reaction import Reaction
 from models.reaction_reagent import ReactionReagent
+from services.catalog_version import bump_catalog_change_version
+from services.utils import generate_reaction_key
 
 
 def create_reaction(
@@ -23,7 +29,7 @@ def create_reaction(
         product_reagent_id=product_reagent_id,
         message=message,
         scenario_id=scenario_id,
-        reaction_key=_generate_reaction_key(reagent_ids),
+        reaction_key=generate_reaction_key(reagent_ids),
     )
     db.add(reaction)
     db.flush()
@@ -31,20 +37,44 @@ def create_reaction(
     if reagents:
         _replace_reagents(db, reaction, reagents)
 
+    bump_catalog_change_version(db)
     db.commit()
     db.refresh(reaction)
     return reaction
 
 
-def get_reaction_by_id(db: Session, reaction_id: int) -> Reaction:
-    reaction = db.get(Reaction, reaction_id)
+def get_reaction_by_id(
+    db: Session, reaction_id: int, options: Sequence[ORMOption] = ()
+) -> Reaction:
+    reaction = db.get(Reaction, reaction_id, options=options)
     if not reaction:
         raise NotFoundError("Reação não encontrada.")
     return reaction
 
 
-def list_reactions(db: Session) -> list[Reaction]:
-    return db.query(Reaction).order_by(Reaction.id.desc()).all()
+REACTION_SORT_KEYS: tuple[SortKey, ...] = ((Reaction.id, True),)
+# Relationships serialized by ReactionRead
+REACTION_LOADERS: Mapping[str, Callable[[], ORMOption]] = {
+    "reagents": lambda: selectinload(Reaction.reagents),
+}
+# Everything ReactionRead serializes, for single-reaction responses
+REACTION_DETAIL_OPTIONS: tuple[ORMOption, ...] = tuple(
+    loader() for loader in REACTION_LOADERS.values()
+)
+
+
+def list_reactions(
+    db: Session,
+    limit: int | None,
+    after: Sequence[Any] | None = None,
+    fields: Collection[str] | None = None,
+) -> tuple[list[Reaction], tuple[Any, ...] | None]:
+    """Returns one page of reactions, newest first, and the id key to
+    continue after, if there are more. With ``fields``, only those columns
+    and relationships are loaded."""
+    options = fieldset_options(Reaction, fields, REACTION_SORT_KEYS, REACTION_LOADERS)
+    query = select(Reaction).options(*options)
+    return paginate_keyset(db, query, REACTION_SORT_KEYS, limit, after)
 
 
 def update_reaction(
@@ -70,9 +100,10 @@ def update_reaction(
     if reagents is not None:
         _replace_reagents(db, reaction, reagents)
         reagent_ids = [item["reagent_id"] for item in reagents]
-        reaction.reaction_key = _generate_reaction_key(reagent_ids)
+        reaction.reaction_key = generate_reaction_key(reagent_ids)
 
     db.add(reaction)
+    bump_catalog_change_version(db)
     db.commit()
     db.refresh(reaction)
     return reaction
@@ -81,6 +112,7 @@ def update_reaction(
 def delete_reaction(db: Session, reaction_id: int) -> None:
     reaction = get_reaction_by_id(db, reaction_id)
     db.delete(reaction)
+    bump_catalog_change_version(db)
     db.commit()
 
 
@@ -99,10 +131,3 @@ def _replace_reagents(db: Session, reaction: Reaction, reagents: Sequence[dict])
                 role=reagent_data.get("role", "reagent"),
             )
         )
-
-
-def _generate_reaction_key(reagent_ids: Sequence[int]) -> str:
-    if not reagent_ids:
-        return ""
-    sorted_ids = sorted(reagent_ids)
-    return "+".join(str(rid) for rid in sorted_ids)
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import threading
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from models.reaction import Reaction
+from models.reaction_reagent import ReactionReagent
+from services.catalog_version import get_catalog_change_version
+from services.utils import generate_reaction_key
+
+
+@dataclass(frozen=True, slots=True)
+class IndexedReaction:
+    reaction_id: int
+    scenario_id: Optional[int]
+    required: frozenset[int]
+    product_reagent_id: int
+    message: str
+
+    @property
+    def specificity(self) -> int:
+        return len(self.required)
+
+
+@dataclass(frozen=True, slots=True)
+class ReactionIndex:
+    # Catalog change version the index was built under
+    version: int
+    # reagent_id -> reactions requiring it, most specific first
+    by_reagent: Dict[int, Tuple[IndexedReaction, ...]]
+    # reaction_key of the required reagents -> reactions with exactly that set
+    by_key: Dict[str, Tuple[IndexedReaction, ...]]
+
+    def find_best_match(
+        self, scenario_id: int, container_reagents: Iterable[int]
+    ) -> IndexedReaction | None:
+        reagents = frozenset(container_reagents)
+        if not reagents:
+            return None
+
+        # An exact match is as specific as any reaction can be for this container.
+        exact = self.by_key.get(generate_reaction_key(sorted(reagents)), ())
+        for reaction in exact:
+            if _applies_to(reaction, scenario_id):
+                return reaction
+
+        hits: Dict[int, int] = defaultdict(int)
+        best: IndexedReaction | None = None
+        for reagent_id in reagents:
+            for reaction in self.by_reagent.get(reagent_id, ()):
+                if not _applies_to(reaction, scenario_id):
+                    continue
+                hits[reaction.reaction_id] += 1
+                if hits[reaction.reaction_id] != reaction.specificity:
+                    continue
+                if best is None or _ranks_before(reaction, best):
+                    best = reaction
+        return best
+
+
+def _applies_to(reaction: IndexedReaction, scenario_id: int) -> bool:
+    return reaction.scenario_id is None or reaction.scenario_id == scenario_id
+
+
+def _ranks_before(reaction: IndexedReaction, other: IndexedReaction) -> bool:
+    if reaction.specificity != other.specificity:
+        return reaction.specificity > other.specificity
+    return reaction.reaction_id < other.reaction_id
+
+
+# Process-wide index, rebuilt lazily once the catalog change version moves
+_index: ReactionIndex | None = None
+_index_lock = threading.Lock()
+
+
+def build_reaction_index(db: Session, version: int = 0) -> ReactionIndex:
+    reactions = db.execute(
+        select(
+            Reaction.id,
+            Reaction.scenario_id,
+            Reaction.product_reagent_id,
+            Reaction.message,
+        )
+    ).all()
+    links = db.execute(
+        select(ReactionReagent.reaction_id, ReactionReagent.reagent_id).where(
+            ReactionReagent.role == "reagent"
+        )
+    ).all()
+
+    required: Dict[int, set[int]] = defaultdict(set)
+    for reaction_id, reagent_id in links:
+        required[reaction_id].add(reagent_id)
+
+    by_reagent: Dict[int, list[IndexedReaction]] = defaultdict(list)
+    by_key: Dict[str, list[IndexedReaction]] = defaultdict(list)
+    for reaction_id, scenario_id, product_reagent_id, message in reactions:
+        reagent_ids = required.get(reaction_id)
+        if not reagent_ids:
+            continue
+        entry = IndexedReaction(
+            reaction_id=reaction_id,
+            scenario_id=scenario_id,
+            required=frozenset(reagent_ids),
+            product_reagent_id=product_reagent_id,
+            message=message,
+        )
+        by_key[generate_reaction_key(sorted(reagent_ids))].append(entry)
+        for reagent_id in reagent_ids:
+            by_reagent[reagent_id].append(entry)
+
+    def _ordered(entries: list[IndexedReaction]) -> Tuple[IndexedReaction, ...]:
+        return tuple(sorted(entries, key=lambda r: (-r.specificity, r.reaction_id)))
+
+    return ReactionIndex(
+        version=version,
+        by_reagent={rid: _ordered(entries) for rid, entries in by_reagent.items()},
+        by_key={key: _ordered(entries) for key, entries in by_key.items()},
+    )
+
+
+def get_reaction_index(db: Session, version: int | None = None) -> ReactionIndex:
+    """Returns the cached index unless a reaction write, in this process or
+    another, has moved the catalog change version since it was built.
+
+    Run actions pass the version ``sync_catalog_cache`` already read; without
+    one, it is read here.
+    """
+    global _index
+    if version is None:
+        version = get_catalog_change_version(db)
+    index = _index
+    if index is not None and index.version >= version:
+        return index
+    with _index_lock:
+        if _index is None or _index.version < version:
+            _index = build_reaction_index(db, version)
+        return _index
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
+from typing import Any, Collection, Sequence
+
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from core.exceptions import ConflictError, NotFoundError
+from core.fieldsets import fieldset_options
+from core.pagination import SortKey, paginate_keyset
 from models.reagent import Reagent
+from services.catalog_version import bump_catalog_change_version
 
 
 def create_reagent(
@@ -26,6 +32,7 @@ def create_reagent(
         image_path=image_path,
     )
     db.add(reagent)
+    bump_catalog_change_version(db)
     db.commit()
     db.refresh(reagent)
     return reagent
@@ -38,8 +45,21 @@ def get_reagent_by_id(db: Session, reagent_id: int) -> Reagent:
     return reagent
 
 
-def list_reagents(db: Session) -> list[Reagent]:
-    return db.query(Reagent).order_by(Reagent.name).all()
+REAGENT_SORT_KEYS: tuple[SortKey, ...] = ((Reagent.name, False), (Reagent.id, False))
+
+
+def list_reagents(
+    db: Session,
+    limit: int | None,
+    after: Sequence[Any] | None = None,
+    fields: Collection[str] | None = None,
+) -> tuple[list[Reagent], tuple[Any, ...] | None]:
+    """Returns one page of reagents, by name, and the (name, id) key to
+    continue after, if there are more. With ``fields``, only those columns
+    and relationships are loaded."""
+    options = fieldset_options(Reagent, fields, REAGENT_SORT_KEYS)
+    query = select(Reagent).options(*options)
+    return paginate_keyset(db, query, REAGENT_SORT_KEYS, limit, after)
 
 
 def update_reagent(
@@ -69,6 +89,7 @@ def update_reagent(
         reagent.image_path = image_path
 
     db.add(reagent)
+    bump_catalog_change_version(db)
     db.commit()
     db.refresh(reagent)
     return reagent
@@ -77,4 +98,5 @@ def update_reagent(
 def delete_reagent(db: Session, reagent_id: int) -> None:
     reagent = get_reagent_by_id(db, reagent_id)
     db.delete(reagent)
+    bump_catalog_change_version(db)
     db.commit()
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+import weakref
+from collections import deque
+from dataclasses import dataclass
+from functools import partial
+from typing import Any, Awaitable, Callable, Deque, Dict, Tuple, TypeVar
+
+from core.database import new_async_session
+
+T = TypeVar("T")
+
+_Message = Tuple[Callable[[], Any], "asyncio.Future[Any]", float]
+
+
+@dataclass
+class RunActorStats:
+    active_actors: int
+    queued_messages: int
+    max_mailbox_depth: int
+    processed_messages: int
+    total_wait_seconds: float
+    max_wait_seconds: float
+
+
+class RunActor:
+    """Owns one run: messages are processed one at a time, in arrival order.
+
+    The actor only has a task while its mailbox has work; it exits once the
+    mailbox is drained and is recreated by the next message.
+    """
+
+    def __init__(self, run_id: str, registry: RunActorRegistry) -> None:
+        self.run_id = run_id
+        self.mailbox: Deque[_Message] = deque()
+        self._registry = registry
+        self._task: asyncio.Task[None] | None = None
+
+    def send(self, fn: Callable[[], Any]) -> asyncio.Future[Any]:
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        self.mailbox.append((fn, future, time.monotonic()))
+        self._registry._observe_depth(len(self.mailbox))
+        if self._task is None:
+            self._task = loop.create_task(self._drain())
+        return future
+
+    async def _drain(self) -> None:
+        try:
+            while self.mailbox:
+                fn, future, enqueued_at = self.mailbox.popleft()
+                if future.cancelled():
+                    continue
+                self._registry._observe_wait(time.monotonic() - enqueued_at)
+                try:
+                    if inspect.iscoroutinefunction(fn):
+                        result = await fn()
+                    else:
+                        result = await asyncio.to_thread(fn)
+                except Exception as exc:
+                    if not future.cancelled():
+                        future.set_exception(exc)
+                else:
+                    if not future.cancelled():
+                        future.set_result(result)
+        finally:
+            while self.mailbox:
+                self.mailbox.popleft()[1].cancel()
+            self._task = None
+            self._registry._release(self)
+
+
+class RunActorRegistry:
+    """Maps run ids to their actors for one event loop."""
+
+    def __init__(self) -> None:
+        self._actors: Dict[str, RunActor] = {}
+        self._max_depth = 0
+        self._processed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    async def call(self, run_id: str, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        actor = self._actors.get(run_id)
+        if actor is None:
+            actor = self._actors[run_id] = RunActor(run_id, self)
+        return await actor.send(partial(fn, *args, **kwargs))
+
+    def _release(self, actor: RunActor) -> None:
+        if self._actors.get(actor.run_id) is actor and not actor.mailbox:
+            del self._actors[actor.run_id]
+
+    def _observe_depth(self, depth: int) -> None:
+        self._max_depth = max(self._max_depth, depth)
+
+    def _observe_wait(self, seconds: float) -> None:
+        self._processed += 1
+        self._total_wait += seconds
+        self._max_wait = max(self._max_wait, seconds)
+
+    def stats(self) -> RunActorStats:
+        return RunActorStats(
+            active_actors=len(self._actors),
+            queued_messages=sum(len(actor.mailbox) for actor in self._actors.values()),
+            max_mailbox_depth=self._max_depth,
+            processed_messages=self._processed,
+            total_wait_seconds=self._total_wait,
+            max_wait_seconds=self._max_wait,
+        )
+
+
+_registries: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, RunActorRegistry]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_actor_registry() -> RunActorRegistry:
+    loop = asyncio.get_running_loop()
+    registry = _registries.get(loop)
+    if registry is None:
+        registry = _registries[loop] = RunActorRegistry()
+    return registry
+
+
+async def run_serialized(run_id: str, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Runs ``fn`` after every earlier call for the same run has finished.
+
+    Coroutine functions are awaited on the loop; plain functions run in a
+    worker thread.
+    """
+    return await get_actor_registry().call(run_id, fn, *args, **kwargs)
+
+
+async def run_serialized_in_session(
+    run_id: str, fn: Callable[..., Awaitable[T]], /, *args: Any, **kwargs: Any
+) -> T:
+    """Like ``run_serialized`` for coroutine functions taking ``db``: each call
+    gets an AsyncSession of its own, opened and closed by the actor.
+
+    A cancelled request closes its own session while the actor may still be
+    running its work, so that work must never use the request's session.
+    """
+
+    async def call() -> T:
+        async with new_async_session() as db:
+            return await fn(*args, db=db, **kwargs)
+
+    return await run_serialized(run_id, call)
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Union
+
+from core.config import Settings, get_settings
+from services.run_state import ScenarioRunState, decode_state, encode_state
+from services.run_store import connect_wal
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True, slots=True)
+class RunEvent:
+    run_id: str
+    # Run version after an accepted action, or the unchanged version for a rejected one
+    version: int
+    recorded_at: float
+    action: Dict[str, object]
+    accepted: bool
+    error: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True)
+class RunSnapshot:
+    run_id: str
+    version: int
+    state: bytes
+
+
+LogEntry = Union[RunEvent, RunSnapshot]
+
+
+class RunActionLog:
+    """Append-only log of run actions with periodic state snapshots.
+
+    Writes are buffered and flushed in one transaction once ``flush_size``
+    entries are pending, or by ``run_log_flusher``. A run is rebuilt from its
+    latest snapshot plus the accepted events recorded after it.
+    """
+
+    def __init__(self, path: str, snapshot_every: int, flush_size: int) -> None:
+        self.snapshot_every = snapshot_every
+        self.flush_size = flush_size
+        self._path = path
+        self._local = threading.local()
+        self._pending: List[LogEntry] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS run_events ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, run_id TEXT NOT NULL, "
+            "version INTEGER NOT NULL, recorded_at REAL NOT NULL, "
+            "accepted INTEGER NOT NULL, action TEXT NOT NULL, error TEXT)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_run_events_run_version ON run_events (run_id, version)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS run_snapshots ("
+            "run_id TEXT NOT NULL, version INTEGER NOT NULL, state BLOB NOT NULL, "
+            "PRIMARY KEY (run_id, version)) WITHOUT ROWID"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = connect_wal(self._path)
+            self._local.conn = conn
+        return conn
+
+    def record(
+        self,
+        state: ScenarioRunState,
+        action: Dict[str, object],
+        accepted: bool,
+        error: str | None = None,
+    ) -> None:
+        self.append(self.entries_for(state, action, accepted, error))
+
+    def entries_for(
+        self,
+        state: ScenarioRunState,
+        action: Dict[str, object],
+        accepted: bool,
+        error: str | None = None,
+    ) -> List[LogEntry]:
+        """Builds the event for an action, plus a snapshot when one is due."""
+        event = RunEvent(
+            run_id=state.run_id,
+            version=state.version,
+            recorded_at=time.time(),
+            action={key: value for key, value in action.items() if value is not None},
+            accepted=accepted,
+            error=error,
+        )
+        entries: List[LogEntry] = [event]
+        if accepted and self.snapshot_every > 0 and state.version % self.snapshot_every == 0:
+            entries.append(RunSnapshot(state.run_id, state.version, encode_state(state)))
+        return entries
+
+    def snapshot(self, state: ScenarioRunState) -> None:
+        self.append([RunSnapshot(state.run_id, state.version, encode_state(state))])
+
+    def snapshot_many(self, states: List[ScenarioRunState]) -> None:
+        self.append(
+            [RunSnapshot(state.run_id, state.version, encode_state(state)) for state in states]
+        )
+
+    def append(self, entries: List[LogEntry]) -> None:
+        with self._lock:
+            self._pending.extend(entries)
+            should_flush = len(self._pending) >= self.flush_size
+        if should_flush:
+            self.flush()
+
+    def flush(self) -> int:
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+            if not pending:
+                return 0
+            events = [
+                (
+                    entry.run_id,
+                    entry.version,
+                    entry.recorded_at,
+                    int(entry.accepted),
+                    json.dumps(entry.action, separators=(",", ":"), ensure_ascii=False),
+                    entry.error,
+                )
+                for entry in pending
+                if isinstance(entry, RunEvent)
+            ]
+            snapshots = [
+                (entry.run_id, entry.version, entry.state)
+                for entry in pending
+                if isinstance(entry, RunSnapshot)
+            ]
+            conn = self._connection()
+            conn.execute("BEGIN")
+            try:
+                conn.executemany(
+                    "INSERT INTO run_events (run_id, version, recorded_at, accepted, action, error) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    events,
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO run_snapshots (run_id, version, state) VALUES (?, ?, ?)",
+                    snapshots,
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                with self._lock:
+                    self._pending[:0] = pending
+                raise
+            return len(pending)
+
+    def list_events(self, run_id: str) -> list[RunEvent]:
+        self.flush()
+        rows = self._connection().execute(
+            "SELECT version, recorded_at, accepted, action, error FROM run_events "
+            "WHERE run_id = ? ORDER BY id",
+            (run_id,),
+        ).fetchall()
+        return [
+            RunEvent(run_id, version, recorded_at, json.loads(action), bool(accepted), error)
+            for version, recorded_at, accepted, action, error in rows
+        ]
+
+    def load_for_replay(
+        self, run_id: str
+    ) -> tuple[ScenarioRunState, list[RunEvent]] | None:
+        """Returns the latest snapshot and the accepted events that follow it."""
+        self.flush()
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT version, state FROM run_snapshots WHERE run_id = ? "
+            "ORDER BY version DESC LIMIT 1",
+            (run_id,),
+        ).fetchone()
+        if row is None:
+            return None
+        version, payload = row
+        rows = conn.execute(
+            "SELECT version, recorded_at, action FROM run_events "
+            "WHERE run_id = ? AND accepted = 1 AND version > ? ORDER BY version",
+            (run_id, version),
+        ).fetchall()
+        events = [
+            RunEvent(run_id, event_version, recorded_at, json.loads(action), True)
+            for event_version, recorded_at, action in rows
+        ]
+        return decode_state(run_id, payload), events
+
+
+def create_run_log(settings: Settings) -> RunActionLog | None:
+    if not settings.run_log_enabled:
+        return None
+    return RunActionLog(
+        settings.run_log_path,
+        snapshot_every=settings.run_log_snapshot_every,
+        flush_size=settings.run_log_flush_size,
+    )
+
+
+@lru_cache
+def get_run_log() -> RunActionLog | None:
+    return create_run_log(get_settings())
+
+
+async def run_log_flusher(log: RunActionLog, interval_seconds: float) -> None:
+    try:
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await asyncio.to_thread(log.flush)
+            except Exception:
+                logger.exception("Falha ao gravar o log de ações das execuções.")
+    finally:
+        await asyncio.to_thread(log.flush)
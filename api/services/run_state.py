@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import asdict, dataclass, field
+from enum import Enum
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional, Tuple
+
+
+class AmountUnit(str, Enum):
+    GRAM = "g"
+    MILLILITER = "mL"
+    DROP = "drop"
+
+
+@dataclass(frozen=True, slots=True)
+class ContainerMeta:
+    instrument_id: int
+    instrument_type: str
+    is_container: bool
+    allowed_physical_states: Optional[str] = None
+
+
+@dataclass(slots=True)
+class ContainerContentItem:
+    reagent_id: int
+    amount_value: float
+    amount_unit: str
+
+
+ContentKey = Tuple[int, str]
+# Insertion-ordered, so contents render in the order they were added
+ContainerContents = Dict[ContentKey, ContainerContentItem]
+ContainersMeta = Mapping[str, ContainerMeta]
+
+
+@dataclass(slots=True)
+class ScenarioRunState:
+    run_id: str
+    scenario_id: int
+    containers: Dict[str, ContainerContents]
+    containers_meta: ContainersMeta
+    current_step_index: int = 0
+    message: Optional[str] = None
+    # Bumped on every accepted action; container_versions records the version
+    # at which each container last changed, for delta responses.
+    version: int = 0
+    container_versions: Dict[str, int] = field(default_factory=dict)
+
+    def mark_container_changed(self, container_name: str) -> None:
+        self.container_versions[container_name] = self.version + 1
+
+
+# Read-only metadata maps shared by every run started with the same instrument roster
+_interned_meta: Dict[Tuple[Tuple[str, ContainerMeta], ...], ContainersMeta] = {}
+_interned_meta_lock = threading.Lock()
+_MAX_INTERNED_ROSTERS = 64
+
+
+def intern_containers_meta(meta: Mapping[str, ContainerMeta]) -> ContainersMeta:
+    key = tuple(meta.items())
+    shared = _interned_meta.get(key)
+    if shared is not None:
+        return shared
+    with _interned_meta_lock:
+        if len(_interned_meta) >= _MAX_INTERNED_ROSTERS:
+            _interned_meta.clear()
+        return _interned_meta.setdefault(key, MappingProxyType(dict(meta)))
+
+
+# Serialized form of each interned metadata map: id(map) -> (map, serialized)
+_meta_dicts: Dict[int, Tuple[ContainersMeta, Dict[str, Dict[str, object]]]] = {}
+
+
+def containers_meta_to_dict(meta: ContainersMeta) -> Dict[str, Dict[str, object]]:
+    cached = _meta_dicts.get(id(meta))
+    if cached is not None and cached[0] is meta:
+        return cached[1]
+    serialized = {name: asdict(item) for name, item in meta.items()}
+    if isinstance(meta, MappingProxyType):
+        if len(_meta_dicts) >= _MAX_INTERNED_ROSTERS:
+            _meta_dicts.clear()
+        _meta_dicts[id(meta)] = (meta, serialized)
+    return serialized
+
+
+def clone_state(state: ScenarioRunState) -> ScenarioRunState:
+    """Copies a run's mutable parts; the container metadata stays shared."""
+    return ScenarioRunState(
+        run_id=state.run_id,
+        scenario_id=state.scenario_id,
+        containers={
+            name: {
+                key: ContainerContentItem(item.reagent_id, item.amount_value, item.amount_unit)
+                for key, item in contents.items()
+            }
+            for name, contents in state.containers.items()
+        },
+        containers_meta=state.containers_meta,
+        current_step_index=state.current_step_index,
+        message=state.message,
+        version=state.version,
+        container_versions=dict(state.container_versions),
+    )
+
+
+def encode_state(state: ScenarioRunState) -> bytes:
+    """Serializes a run as positional JSON arrays, without repeating field names."""
+    record = [
+        state.scenario_id,
+        state.current_step_index,
+        state.message,
+        {
+            name: [
+                [item.reagent_id, item.amount_value, item.amount_unit]
+                for item in contents.values()
+            ]
+            for name, contents in state.containers.items()
+        },
+        {
+            name: [
+                meta.instrument_id,
+                meta.instrument_type,
+                meta.is_container,
+                meta.allowed_physical_states,
+            ]
+            for name, meta in state.containers_meta.items()
+        },
+        state.version,
+        state.container_versions,
+    ]
+    return json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def decode_state(run_id: str, payload: bytes) -> ScenarioRunState:
+    record = json.loads(payload)
+    scenario_id, current_step_index, message, containers, containers_meta = record[:5]
+    version, container_versions = record[5:7] if len(record) >= 7 else (0, {})
+    return ScenarioRunState(
+        run_id=run_id,
+        scenario_id=scenario_id,
+        containers={
+            name: {
+                (reagent_id, unit): ContainerContentItem(reagent_id, amount, unit)
+                for reagent_id, amount, unit in contents
+            }
+            for name, contents in containers.items()
+        },
+        containers_meta=intern_containers_meta(
+            {name: ContainerMeta(*meta) for name, meta in containers_meta.items()}
+        ),
+        current_step_index=current_step_index,
+        message=message,
+        version=version,
+        container_versions=container_versions,
+    )
@@ -0,0 +1,306 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Sequence
+
+from core.config import Settings, get_settings
+from services.run_state import ScenarioRunState, decode_state, encode_state
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RunStoreStats:
+    live_runs: int
+    evicted_lru: int = 0
+    expired_idle: int = 0
+
+
+def connect_wal(path: str) -> sqlite3.Connection:
+    """Opens an autocommit SQLite connection in WAL mode."""
+    conn = sqlite3.connect(path, timeout=5.0, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
+
+
+class RunStore(ABC):
+    """Storage for active scenario runs, bounded by run count and idle time."""
+
+    def __init__(self, max_runs: int, idle_ttl_seconds: float) -> None:
+        self.max_runs = max_runs
+        self.idle_ttl_seconds = idle_ttl_seconds
+        self._evicted_lru = 0
+        self._expired_idle = 0
+
+    @abstractmethod
+    def get(self, run_id: str) -> ScenarioRunState | None:
+        ...
+
+    @abstractmethod
+    def put(self, state: ScenarioRunState, expected_version: int | None = None) -> bool:
+        """Saves ``state``. With ``expected_version``, only if the stored run is
+        still at that version (or gone); returns False when another writer
+        got there first."""
+
+    @abstractmethod
+    def put_many(self, states: Sequence[ScenarioRunState]) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, run_id: str) -> None:
+        ...
+
+    @abstractmethod
+    def sweep(self) -> int:
+        """Removes idle and over-capacity runs. Returns how many were removed."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    def stats(self) -> RunStoreStats:
+        return RunStoreStats(
+            live_runs=len(self),
+            evicted_lru=self._evicted_lru,
+            expired_idle=self._expired_idle,
+        )
+
+
+class InMemoryRunStore(RunStore):
+    """Keeps runs in a process-local LRU. States are shared by reference."""
+
+    def __init__(self, max_runs: int, idle_ttl_seconds: float) -> None:
+        super().__init__(max_runs, idle_ttl_seconds)
+        # run_id -> (state, last access), least recently used first
+        self._runs: OrderedDict[str, tuple[ScenarioRunState, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _is_expired(self, last_access: float, now: float) -> bool:
+        return self.idle_ttl_seconds > 0 and now - last_access > self.idle_ttl_seconds
+
+    def get(self, run_id: str) -> ScenarioRunState | None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._runs.get(run_id)
+            if entry is None:
+                return None
+            state, last_access = entry
+            if self._is_expired(last_access, now):
+                del self._runs[run_id]
+                self._expired_idle += 1
+                return None
+            self._runs[run_id] = (state, now)
+            self._runs.move_to_end(run_id)
+            return state
+
+    def put(self, state: ScenarioRunState, expected_version: int | None = None) -> bool:
+        with self._lock:
+            entry = self._runs.get(state.run_id)
+            if expected_version is not None and entry is not None:
+                if entry[0].version != expected_version:
+                    return False
+            self._put_locked((state,))
+        return True
+
+    def put_many(self, states: Sequence[ScenarioRunState]) -> None:
+        with self._lock:
+            self._put_locked(states)
+
+    def _put_locked(self, states: Sequence[ScenarioRunState]) -> None:
+        now = time.monotonic()
+        for state in states:
+            self._runs[state.run_id] = (state, now)
+            self._runs.move_to_end(state.run_id)
+        while self.max_runs > 0 and len(self._runs) > self.max_runs:
+            self._runs.popitem(last=False)
+            self._evicted_lru += 1
+
+    def delete(self, run_id: str) -> None:
+        with self._lock:
+            self._runs.pop(run_id, None)
+
+    def sweep(self) -> int:
+        now = time.monotonic()
+        removed = 0
+        with self._lock:
+            # Entries are ordered by last access, so expired ones sit at the front.
+            while self._runs:
+                run_id, (_, last_access) = next(iter(self._runs.items()))
+                if not self._is_expired(last_access, now):
+                    break
+                del self._runs[run_id]
+                removed += 1
+            self._expired_idle += removed
+        return removed
+
+    def __len__(self) -> int:
+        return len(self._runs)
+
+
+class SqliteRunStore(RunStore):
+    """Keeps runs in a SQLite file in WAL mode, shared by every worker on the host.
+
+    Reads refresh the idle clock; the run-count cap is enforced by ``sweep``
+    rather than on every write, to keep writes free of table scans. Each row
+    keeps its run's version, so conditional puts from different workers are
+    a single compare-and-set ``UPDATE``.
+    """
+
+    def __init__(self, path: str, max_runs: int, idle_ttl_seconds: float) -> None:
+        super().__init__(max_runs, idle_ttl_seconds)
+        self._path = path
+        self._local = threading.local()
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS scenario_runs ("
+            "run_id TEXT PRIMARY KEY, state BLOB NOT NULL, updated_at REAL NOT NULL,"
+            " version INTEGER"
+            ") WITHOUT ROWID"
+        )
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(scenario_runs)")}
+        if "version" not in columns:
+            # Rows written before the column existed accept any expected version.
+            conn.execute("ALTER TABLE scenario_runs ADD COLUMN version INTEGER")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS ix_scenario_runs_updated_at ON scenario_runs (updated_at)"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = connect_wal(self._path)
+            self._local.conn = conn
+        return conn
+
+    def _cutoff(self, now: float) -> float | None:
+        if self.idle_ttl_seconds <= 0:
+            return None
+        return now - self.idle_ttl_seconds
+
+    def get(self, run_id: str) -> ScenarioRunState | None:
+        now = time.time()
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT state, updated_at FROM scenario_runs WHERE run_id = ?", (run_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        payload, updated_at = row
+        cutoff = self._cutoff(now)
+        if cutoff is not None and updated_at < cutoff:
+            conn.execute("DELETE FROM scenario_runs WHERE run_id = ?", (run_id,))
+            self._expired_idle += 1
+            return None
+        conn.execute(
+            "UPDATE scenario_runs SET updated_at = ? WHERE run_id = ?", (now, run_id)
+        )
+        return decode_state(run_id, payload)
+
+    def put(self, state: ScenarioRunState, expected_version: int | None = None) -> bool:
+        conn = self._connection()
+        row = (state.run_id, encode_state(state), time.time(), state.version)
+        if expected_version is None:
+            conn.execute(
+                "INSERT OR REPLACE INTO scenario_runs (run_id, state, updated_at, version)"
+                " VALUES (?, ?, ?, ?)",
+                row,
+            )
+            return True
+        updated = conn.execute(
+            "UPDATE scenario_runs SET state = ?, updated_at = ?, version = ?"
+            " WHERE run_id = ? AND (version = ? OR version IS NULL)",
+            (row[1], row[2], row[3], state.run_id, expected_version),
+        ).rowcount
+        if updated:
+            return True
+        # The run was swept meanwhile: save it again unless someone else did.
+        return conn.execute(
+            "INSERT OR IGNORE INTO scenario_runs (run_id, state, updated_at, version)"
+            " VALUES (?, ?, ?, ?)",
+            row,
+        ).rowcount == 1
+
+    def put_many(self, states: Sequence[ScenarioRunState]) -> None:
+        now = time.time()
+        rows = [(state.run_id, encode_state(state), now, state.version) for state in states]
+        conn = self._connection()
+        conn.execute("BEGIN")
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO scenario_runs (run_id, state, updated_at, version)"
+                " VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def delete(self, run_id: str) -> None:
+        self._connection().execute("DELETE FROM scenario_runs WHERE run_id = ?", (run_id,))
+
+    def sweep(self) -> int:
+        conn = self._connection()
+        expired = 0
+        cutoff = self._cutoff(time.time())
+        if cutoff is not None:
+            expired = conn.execute(
+                "DELETE FROM scenario_runs WHERE updated_at < ?", (cutoff,)
+            ).rowcount
+        evicted = 0
+        if self.max_runs > 0:
+            evicted = conn.execute(
+                "DELETE FROM scenario_runs WHERE run_id IN ("
+                "SELECT run_id FROM scenario_runs ORDER BY updated_at DESC LIMIT -1 OFFSET ?"
+                ")",
+                (self.max_runs,),
+            ).rowcount
+        self._expired_idle += expired
+        self._evicted_lru += evicted
+        return expired + evicted
+
+    def __len__(self) -> int:
+        row = self._connection().execute("SELECT COUNT(*) FROM scenario_runs").fetchone()
+        return int(row[0])
+
+
+def create_run_store(settings: Settings) -> RunStore:
+    backend = settings.run_store_backend.lower()
+    if backend == "memory":
+        return InMemoryRunStore(
+            max_runs=settings.run_store_max_runs,
+            idle_ttl_seconds=settings.run_store_idle_ttl_seconds,
+        )
+    if backend == "sqlite":
+        return SqliteRunStore(
+            settings.run_store_path,
+            max_runs=settings.run_store_max_runs,
+            idle_ttl_seconds=settings.run_store_idle_ttl_seconds,
+        )
+    raise ValueError(f"Unsupported run store backend: {settings.run_store_backend}")
+
+
+@lru_cache
+def get_run_store() -> RunStore:
+    return create_run_store(get_settings())
+
+
+async def run_store_sweeper(store: RunStore, interval_seconds: float) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            removed = await asyncio.to_thread(store.sweep)
+        except Exception:
+            logger.exception("Falha ao limpar execuções inativas.")
+            continue
+        if removed:
+            logger.info("Execuções removidas pela limpeza: %s", removed)
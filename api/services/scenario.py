@@ -1,12 +1,21 @@
 from __future__ import annotations
 
-from typing import Sequence
+from datetime import datetime, timezone
+from typing import Any, Callable, Collection, Mapping, Sequence
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, joinedload, load_only, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
 
 from core.exceptions import NotFoundError
+from core.fieldsets import fieldset_options
+from core.pagination import SortKey, paginate_keyset
+from services.catalog_version import bump_catalog_change_version
+from services.scenario_plan import invalidate_scenario_plan
 from services.scenario_screen import create_screens_for_scenario
+from models.artist import Artist
 from models.scenario import Scenario
+from models.scenario_screen import ScenarioScreen
 from models.scenario_step import ScenarioStep
 
 
@@ -38,15 +47,75 @@ def create_scenario(
     return scenario
 
 
-def get_scenario_by_id(db: Session, scenario_id: int) -> Scenario:
-    scenario = db.get(Scenario, scenario_id)
+def get_scenario_by_id(
+    db: Session, scenario_id: int, options: Sequence[ORMOption] = ()
+) -> Scenario:
+    scenario = db.get(Scenario, scenario_id, options=options)
     if not scenario:
         raise NotFoundError("Cenário não encontrado.")
     return scenario
 
 
-def list_scenarios(db: Session) -> list[Scenario]:
-    return db.query(Scenario).order_by(Scenario.created_at.desc()).all()
+def get_scenario_version(db: Session, scenario_id: int) -> datetime:
+    """Returns the scenario's updated_at, which changes with its steps and screens."""
+    row = db.execute(select(Scenario.updated_at).where(Scenario.id == scenario_id)).one_or_none()
+    if row is None:
+        raise NotFoundError("Cenário não encontrado.")
+    return row.updated_at
+
+
+SCENARIO_SORT_KEYS: tuple[SortKey, ...] = ((Scenario.created_at, True), (Scenario.id, True))
+# Relationships serialized by ScenarioRead
+SCENARIO_LOADERS: Mapping[str, Callable[[], ORMOption]] = {
+    "steps": lambda: selectinload(Scenario.steps),
+    "artist": lambda: joinedload(Scenario.artist).selectinload(Artist.timeline_entries),
+    "screens": lambda: selectinload(Scenario.screens).selectinload(ScenarioScreen.slider_images),
+}
+# Everything ScenarioRead serializes, for single-scenario responses
+SCENARIO_DETAIL_OPTIONS: tuple[ORMOption, ...] = tuple(
+    loader() for loader in SCENARIO_LOADERS.values()
+)
+
+
+def list_scenarios(
+    db: Session,
+    limit: int | None,
+    after: Sequence[Any] | None = None,
+    fields: Collection[str] | None = None,
+) -> tuple[list[Scenario], tuple[Any, ...] | None]:
+    """Returns one page of scenarios, newest first, and the
+    (created_at, id) key to continue after, if there are more. With
+    ``fields``, only those columns and relationships are loaded."""
+    options = fieldset_options(Scenario, fields, SCENARIO_SORT_KEYS, SCENARIO_LOADERS)
+    query = select(Scenario).options(*options)
+    return paginate_keyset(db, query, SCENARIO_SORT_KEYS, limit, after)
+
+
+def list_active_scenarios_page(
+    db: Session, limit: int, after: tuple[datetime, int] | None = None
+) -> tuple[list[Scenario], tuple[datetime, int] | None]:
+    """Returns one page of active scenarios, newest first, and the
+    (created_at, id) key to continue after, if there are more."""
+    query = (
+        select(Scenario)
+        .where(Scenario.is_active.is_(True))
+        .options(
+            load_only(Scenario.id, Scenario.title, Scenario.description, Scenario.created_at)
+        )
+    )
+    return paginate_keyset(db, query, SCENARIO_SORT_KEYS, limit, after)
+
+
+def get_active_scenarios_version(db: Session) -> tuple[datetime | None, int]:
+    """Latest updated_at over all scenarios (activation changes included) and
+    the number of active ones, which also moves when one is deleted."""
+    row = db.execute(
+        select(
+            func.max(Scenario.updated_at),
+            func.count(Scenario.id).filter(Scenario.is_active.is_(True)),
+        )
+    ).one()
+    return row[0], row[1]
 
 
 def update_scenario(
@@ -69,16 +138,23 @@ def update_scenario(
     if steps is not None:
         _replace_steps(db, scenario, steps)
 
+    # Sets the timestamp explicitly: step-only edits do not touch the scenario
+    # row, and compiled plans are keyed by updated_at.
+    scenario.updated_at = datetime.now(timezone.utc)
     db.add(scenario)
     db.commit()
     db.refresh(scenario)
+    invalidate_scenario_plan(scenario.id)
     return scenario
 
 
 def delete_scenario(db: Session, scenario_id: int) -> None:
     scenario = get_scenario_by_id(db, scenario_id)
     db.delete(scenario)
+    # Deletes the scenario's reactions with it
+    bump_catalog_change_version(db)
     db.commit()
+    invalidate_scenario_plan(scenario_id)
 
 
 def get_scenario_with_steps(db: Session, scenario_id: int) -> Scenario:
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from core.exceptions import NotFoundError
+from models.scenario import Scenario
+from models.scenario_step import ScenarioStep
+
+
+@dataclass(frozen=True, slots=True)
+class PlannedStep:
+    order_index: int
+    action_type: str
+    instrument_id: Optional[int]
+    reagent_id: Optional[int]
+    source_container_name: Optional[str]
+    target_container_name: Optional[str]
+    amount_value: Optional[float]
+    amount_unit: Optional[str]
+    text_instruction: str
+    sound_effect_path: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class ScenarioPlan:
+    scenario_id: int
+    updated_at: datetime
+    steps: Tuple[PlannedStep, ...]
+    container_names: frozenset[str]
+
+    @property
+    def step_count(self) -> int:
+        return len(self.steps)
+
+    def step_at(self, index: int) -> PlannedStep | None:
+        if index < 0 or index >= len(self.steps):
+            return None
+        return self.steps[index]
+
+
+# In-process cache of compiled plans, one entry per scenario
+_plans: Dict[int, ScenarioPlan] = {}
+_plans_lock = threading.Lock()
+
+
+def _compile_step(step: ScenarioStep) -> PlannedStep:
+    return PlannedStep(
+        order_index=step.order_index,
+        action_type=step.action_type,
+        instrument_id=step.instrument_id,
+        reagent_id=step.reagent_id,
+        source_container_name=step.source_container_name,
+        target_container_name=step.target_container_name,
+        amount_value=step.amount_value,
+        amount_unit=step.amount_unit,
+        text_instruction=step.text_instruction,
+        sound_effect_path=step.sound_effect_path,
+    )
+
+
+def compile_scenario_plan(db: Session, scenario_id: int) -> ScenarioPlan:
+    scenario = db.get(Scenario, scenario_id)
+    if not scenario:
+        raise NotFoundError("Cenário não encontrado.")
+    ordered = sorted(scenario.steps, key=lambda s: s.order_index)
+    steps = tuple(_compile_step(step) for step in ordered)
+    container_names = frozenset(
+        name
+        for step in steps
+        for name in (step.source_container_name, step.target_container_name)
+        if name
+    )
+    return ScenarioPlan(
+        scenario_id=scenario.id,
+        updated_at=scenario.updated_at,
+        steps=steps,
+        container_names=container_names,
+    )
+
+
+def get_scenario_plan(db: Session, scenario_id: int) -> ScenarioPlan:
+    updated_at = db.execute(
+        select(Scenario.updated_at).where(Scenario.id == scenario_id)
+    ).scalar_one_or_none()
+    if updated_at is None:
+        invalidate_scenario_plan(scenario_id)
+        raise NotFoundError("Cenário não encontrado.")
+
+    cached = _plans.get(scenario_id)
+    if cached is not None and cached.updated_at == updated_at:
+        return cached
+
+    plan = compile_scenario_plan(db, scenario_id)
+    with _plans_lock:
+        _plans[scenario_id] = plan
+    return plan
+
+
+def invalidate_scenario_plan(scenario_id: int) -> None:
+    with _plans_lock:
+        _plans.pop(scenario_id, None)
+
+
+def clear_scenario_plans() -> None:
+    with _plans_lock:
+        _plans.clear()
@@ -1,192 +1,238 @@
 from __future__ import annotations
 
+import asyncio
 import uuid
-from dataclasses import asdict, dataclass
-from enum import Enum
-from typing import Dict, List, Optional
+from dataclasses import asdict
+from typing import Dict, Sequence
 
-from sqlalchemy import or_
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from core.exceptions import BadRequestError, NotFoundError
+from core.exceptions import BadRequestError, ConflictError, NotFoundError
+from core.http_cache import etag_matches
 from models.instrument import Instrument
-from models.reagent import Reagent
-from models.reaction import Reaction
-from models.scenario import Scenario
-from models.scenario_step import ScenarioStep
-from services.reaction import _generate_reaction_key, get_required_reagents_for_reaction
+from services.catalog_cache import (
+    get_catalog_instrument,
+    get_catalog_reagent,
+    sync_catalog_cache,
+)
+from services.reaction_index import get_reaction_index
+from services.run_state import (
+    AmountUnit,
+    ContainerContentItem,
+    ContainerMeta,
+    ContainersMeta,
+    ScenarioRunState,
+    clone_state,
+    containers_meta_to_dict,
+    intern_containers_meta,
+)
+from services.run_log import LogEntry, RunEvent, get_run_log
+from services.run_store import get_run_store
+from services.scenario_plan import PlannedStep, ScenarioPlan, get_scenario_plan
 from services.utils import validate_instrument_reagent_compatibility
 
 
-class AmountUnit(str, Enum):
-    GRAM = "g"
-    MILLILITER = "mL"
-    DROP = "drop"
+# (instrument_type, slot names, whether the slots are containers), in render order
+_ROSTER_SLOTS = (
+    ("beaker", ("beaker_1", "beaker_2"), True),
+    ("flask", ("flask_1",), True),
+    ("pipette", ("pipette_1",), False),
+    ("spatula", ("spatula_1",), False),
+)
 
 
-@dataclass
-class ContainerMeta:
-    instrument_id: int
-    instrument_type: str
-    is_container: bool
-    allowed_physical_states: Optional[str] = None
-
-
-@dataclass
-class ContainerContentItem:
-    reagent_id: int
-    amount_value: float
-    amount_unit: str
-
-
-@dataclass
-class ScenarioRunState:
-    run_id: str
-    scenario_id: int
-    containers: Dict[str, List[ContainerContentItem]]
-    containers_meta: Dict[str, ContainerMeta]
-    current_step_index: int = 0
-    message: Optional[str] = None
-
-
-# In-memory store for active runs
-_runs: Dict[str, ScenarioRunState] = {}
-
-
-def _default_containers_meta(db: Session) -> Dict[str, ContainerMeta]:
-    meta: Dict[str, ContainerMeta] = {}
-
-    beakers = (
-        db.query(Instrument)
-        .filter(Instrument.instrument_type == "beaker", Instrument.is_container.is_(True))
-        .order_by(Instrument.id)
-        .all()
-    )
-    if beakers:
-        meta["beaker_1"] = ContainerMeta(
-            instrument_id=beakers[0].id,
-            instrument_type="beaker",
-            is_container=True,
-            allowed_physical_states=beakers[0].allowed_physical_states,
+def _default_containers_meta(db: Session) -> ContainersMeta:
+    rows = db.execute(
+        select(
+            Instrument.id,
+            Instrument.instrument_type,
+            Instrument.is_container,
+            Instrument.allowed_physical_states,
         )
-    if len(beakers) > 1:
-        meta["beaker_2"] = ContainerMeta(
-            instrument_id=beakers[1].id,
-            instrument_type="beaker",
-            is_container=True,
-            allowed_physical_states=beakers[1].allowed_physical_states,
-        )
-
-    flasks = (
-        db.query(Instrument)
-        .filter(Instrument.instrument_type == "flask", Instrument.is_container.is_(True))
+        .where(Instrument.instrument_type.in_([slot[0] for slot in _ROSTER_SLOTS]))
         .order_by(Instrument.id)
-        .all()
-    )
-    if flasks:
-        meta["flask_1"] = ContainerMeta(
-            instrument_id=flasks[0].id,
-            instrument_type="flask",
-            is_container=True,
-            allowed_physical_states=flasks[0].allowed_physical_states,
-        )
+    ).all()
 
-    pipette = (
-        db.query(Instrument)
-        .filter(Instrument.instrument_type == "pipette")
-        .order_by(Instrument.id)
-        .first()
-    )
-    if pipette:
-        meta["pipette_1"] = ContainerMeta(
-            instrument_id=pipette.id,
-            instrument_type="pipette",
-            is_container=False,
-            allowed_physical_states=pipette.allowed_physical_states,
-        )
-
-    spatula = (
-        db.query(Instrument)
-        .filter(Instrument.instrument_type == "spatula")
-        .order_by(Instrument.id)
-        .first()
-    )
-    if spatula:
-        meta["spatula_1"] = ContainerMeta(
-            instrument_id=spatula.id,
-            instrument_type="spatula",
-            is_container=False,
-            allowed_physical_states=spatula.allowed_physical_states,
-        )
+    meta: Dict[str, ContainerMeta] = {}
+    for instrument_type, slot_names, is_container in _ROSTER_SLOTS:
+        candidates = [
+            row
+            for row in rows
+            if row.instrument_type == instrument_type and (row.is_container or not is_container)
+        ]
+        for slot_name, row in zip(slot_names, candidates):
+            meta[slot_name] = ContainerMeta(
+                instrument_id=row.id,
+                instrument_type=instrument_type,
+                is_container=is_container,
+                allowed_physical_states=row.allowed_physical_states,
+            )
 
     if not meta:
         raise NotFoundError("Nenhum instrumento encontrado para inicializar a simulação.")
 
-    return meta
+    return intern_containers_meta(meta)
 
 
 def _state_to_dict(state: ScenarioRunState) -> Dict[str, object]:
     return {
         "run_id": state.run_id,
         "scenario_id": state.scenario_id,
+        "version": state.version,
         "current_step_index": state.current_step_index,
         "containers": {
-            name: [asdict(item) for item in contents]
+            name: [asdict(item) for item in contents.values()]
             for name, contents in state.containers.items()
         },
-        "containers_meta": {name: asdict(meta) for name, meta in state.containers_meta.items()},
+        "containers_meta": containers_meta_to_dict(state.containers_meta),
         **({"message": state.message} if state.message else {}),
     }
 
 
-def start_scenario_run(scenario_id: int, db: Session) -> Dict[str, object]:
-    scenario = db.get(Scenario, scenario_id)
-    if not scenario:
-        raise NotFoundError("Cenário não encontrado.")
+def _state_to_delta(state: ScenarioRunState, since_version: int) -> Dict[str, object]:
+    return {
+        "run_id": state.run_id,
+        "scenario_id": state.scenario_id,
+        "version": state.version,
+        "since_version": since_version,
+        "current_step_index": state.current_step_index,
+        "containers": {
+            name: [asdict(item) for item in contents.values()]
+            for name, contents in state.containers.items()
+            if state.container_versions.get(name, 0) > since_version
+        },
+        "message": state.message,
+    }
+
+
+def run_etag(run_id: str, version: int) -> str:
+    return f'"{run_id}.{version}"'
+
 
-    run_id = str(uuid.uuid4())
+def state_etag(state: ScenarioRunState) -> str:
+    return run_etag(state.run_id, state.version)
+
+
+def _resolve_containers_meta(db: Session, plan: ScenarioPlan) -> ContainersMeta:
     try:
-        containers_meta = _default_containers_meta(db)
+        return _default_containers_meta(db)
     except NotFoundError:
-        if not scenario.steps:
-            containers_meta = {}
-        else:
+        if plan.step_count:
             raise
-    containers: Dict[str, List[ContainerContentItem]] = {name: [] for name in containers_meta}
-    state = ScenarioRunState(
-        run_id=run_id,
+        return intern_containers_meta({})
+
+
+def _new_run_state(scenario_id: int, containers_meta: ContainersMeta) -> ScenarioRunState:
+    return ScenarioRunState(
+        run_id=str(uuid.uuid4()),
         scenario_id=scenario_id,
-        containers=containers,
+        containers={name: {} for name in containers_meta},
         containers_meta=containers_meta,
         current_step_index=0,
     )
-    _runs[run_id] = state
-    return _state_to_dict(state)
+
+
+def _new_run_states(db: Session, scenario_id: int, count: int) -> list[ScenarioRunState]:
+    plan = get_scenario_plan(db, scenario_id)
+    containers_meta = _resolve_containers_meta(db, plan)
+    return [_new_run_state(scenario_id, containers_meta) for _ in range(count)]
+
+
+# The run store and the action log may block on SQLite, so the async
+# functions below call them through asyncio.to_thread and reach the
+# database, for the run engine, through AsyncSession.run_sync.
+
+# run_actors only orders writes within one process; across workers, a save
+# is conditional on the version it was computed from, and the update is
+# recomputed from the fresh state this many times before giving up.
+_RUN_UPDATE_ATTEMPTS = 3
 
 
 def _get_state(run_id: str) -> ScenarioRunState:
-    if run_id not in _runs:
+    state = get_run_store().get(run_id)
+    if state is None:
         raise NotFoundError("Execução do cenário não encontrada.")
-    return _runs[run_id]
+    return state
+
+
+def _save_new_runs(states: Sequence[ScenarioRunState]) -> None:
+    get_run_store().put_many(states)
+    run_log = get_run_log()
+    if run_log is not None:
+        run_log.snapshot_many(list(states))
+
+
+def _save_run(
+    state: ScenarioRunState,
+    log_entries: Sequence[LogEntry] = (),
+    expected_version: int | None = None,
+) -> bool:
+    """Saves the run and logs its entries; with ``expected_version``, returns
+    False without saving when another worker has moved the run since."""
+    if not get_run_store().put(state, expected_version):
+        return False
+    run_log = get_run_log()
+    if run_log is not None and log_entries:
+        run_log.append(list(log_entries))
+    return True
+
+
+def _run_conflict() -> ConflictError:
+    return ConflictError("A execução foi alterada por outra requisição. Tente novamente.")
+
+
+def _record_rejected(state: ScenarioRunState, action: dict, error: str) -> None:
+    run_log = get_run_log()
+    if run_log is not None:
+        run_log.record(state, action, accepted=False, error=error)
+
+
+def _accepted_entries(state: ScenarioRunState, action: dict) -> list[LogEntry]:
+    run_log = get_run_log()
+    if run_log is None:
+        return []
+    return run_log.entries_for(state, action, accepted=True)
+
+
+async def start_scenario_run(scenario_id: int, db: AsyncSession) -> Dict[str, object]:
+    (state,) = await db.run_sync(_new_run_states, scenario_id, 1)
+    await asyncio.to_thread(_save_new_runs, [state])
+    return _state_to_dict(state)
+
+
+async def start_scenario_runs_bulk(
+    scenario_id: int, labels: Sequence[str | None], db: AsyncSession
+) -> list[Dict[str, object]]:
+    """Starts one run per label, resolving the scenario and roster once and
+    saving every run in a single store operation."""
+    states = await db.run_sync(_new_run_states, scenario_id, len(labels))
+    await asyncio.to_thread(_save_new_runs, states)
+    return [
+        {"run_id": state.run_id, **({"label": label} if label is not None else {})}
+        for state, label in zip(states, labels)
+    ]
 
 
-def get_run_state(run_id: str, db: Session | None = None) -> Dict[str, object]:
-    state = _get_state(run_id)
+async def get_run_state(run_id: str) -> Dict[str, object]:
+    state = await asyncio.to_thread(_get_state, run_id)
     return _state_to_dict(state)
 
 
-def _get_ordered_steps_for_scenario(db: Session, scenario_id: int) -> list[ScenarioStep]:
-    scenario = db.get(Scenario, scenario_id)
-    if not scenario:
-        raise NotFoundError("Cenário não encontrado.")
-    return sorted(list(scenario.steps), key=lambda s: s.order_index)
+async def get_run_state_if_modified(
+    run_id: str, if_none_match: str | None
+) -> tuple[str, Dict[str, object] | None]:
+    """Returns the run's ETag, plus its state unless the client already holds it."""
+    state = await asyncio.to_thread(_get_state, run_id)
+    etag = state_etag(state)
+    if etag_matches(if_none_match, etag):
+        return etag, None
+    return etag, _state_to_dict(state)
 
 
-def _get_current_step(db: Session, state: ScenarioRunState) -> ScenarioStep | None:
-    steps = _get_ordered_steps_for_scenario(db, state.scenario_id)
-    if state.current_step_index >= len(steps):
-        return None
-    return steps[state.current_step_index]
+def _get_current_step(plan: ScenarioPlan, state: ScenarioRunState) -> PlannedStep | None:
+    return plan.step_at(state.current_step_index)
 
 
 def _does_action_match_step(
@@ -197,7 +243,7 @@ def _does_action_match_step(
     reagent_id: int | None,
     amount_value: float | None,
     amount_unit: str | None,
-    step: ScenarioStep,
+    step: PlannedStep,
 ) -> bool:
     if action_type != step.action_type:
         return False
@@ -223,10 +269,10 @@ def _does_action_match_step(
     return True
 
 
-def add_reagent_to_container(
-    db: Session, run_id: str, container_name: str, reagent_id: int
+async def add_reagent_to_container(
+    db: AsyncSession, run_id: str, container_name: str, reagent_id: int
 ) -> Dict[str, object]:
-    return apply_action(
+    return await apply_action(
         run_id=run_id,
         action_type="add_reagent",
         instrument_id=None,
@@ -250,51 +296,41 @@ def _ensure_container_meta(state: ScenarioRunState, container_name: str) -> Cont
 
 def _apply_reaction_if_matches(
     db: Session,
+    catalog_version: int,
     state: ScenarioRunState,
     container_name: str,
 ) -> None:
-    contents = state.containers.get(container_name, [])
-    container_reagents = {item.reagent_id for item in contents}
+    contents = state.containers.get(container_name, {})
+    container_reagents = {reagent_id for reagent_id, _ in contents}
     if not container_reagents:
         state.message = None
         return
 
-    candidates = (
-        db.query(Reaction)
-        .filter(
-            or_(Reaction.scenario_id == state.scenario_id, Reaction.scenario_id.is_(None)),
-        )
-        .all()
+    reaction = get_reaction_index(db, catalog_version).find_best_match(
+        state.scenario_id, container_reagents
     )
-
-    applicable: list[tuple[int, Reaction]] = []
-    for reaction in candidates:
-        required = get_required_reagents_for_reaction(reaction)
-        if required and required.issubset(container_reagents):
-            applicable.append((len(required), reaction))
-
-    if not applicable:
+    if reaction is None:
         state.message = None
         return
 
-    applicable.sort(key=lambda x: x[0], reverse=True)
-    reaction = applicable[0][1]
-
-    required_ids = get_required_reagents_for_reaction(reaction)
-    required_contents = [item for item in contents if item.reagent_id in required_ids]
-    remaining_contents = [item for item in contents if item.reagent_id not in required_ids]
+    required_ids = reaction.required
+    required_contents = [item for item in contents.values() if item.reagent_id in required_ids]
+    remaining_contents = {
+        key: item for key, item in contents.items() if item.reagent_id not in required_ids
+    }
 
     total_amount = sum(item.amount_value or 0 for item in required_contents)
     max_item = max(required_contents, key=lambda i: i.amount_value or 0, default=None)
     unit = max_item.amount_unit if max_item and max_item.amount_unit else "un"
 
     state.containers[container_name] = remaining_contents
-    state.containers[container_name].append(
-        ContainerContentItem(
-            reagent_id=reaction.product_reagent_id,
-            amount_value=total_amount if total_amount else 1.0,
-            amount_unit=unit,
-        )
+    state.mark_container_changed(container_name)
+    _add_content(
+        state,
+        container_name,
+        reaction.product_reagent_id,
+        total_amount if total_amount else 1.0,
+        unit,
     )
     state.message = reaction.message
 
@@ -306,39 +342,236 @@ def _add_content(
     amount_value: float,
     amount_unit: str,
 ) -> None:
-    contents = state.containers.setdefault(container_name, [])
-    for item in contents:
-        if item.reagent_id == reagent_id and item.amount_unit == amount_unit:
-            item.amount_value += amount_value
-            return
-    contents.append(
-        ContainerContentItem(
-            reagent_id=reagent_id,
-            amount_value=amount_value,
-            amount_unit=amount_unit,
-        )
+    contents = state.containers.setdefault(container_name, {})
+    key = (reagent_id, amount_unit)
+    state.mark_container_changed(container_name)
+    item = contents.get(key)
+    if item is not None:
+        item.amount_value += amount_value
+        return
+    contents[key] = ContainerContentItem(
+        reagent_id=reagent_id,
+        amount_value=amount_value,
+        amount_unit=amount_unit,
     )
 
 
 def _remove_content(
-    contents: List[ContainerContentItem],
+    state: ScenarioRunState,
+    container_name: str,
     reagent_id: int,
     amount_value: float,
     amount_unit: str,
 ) -> None:
-    for item in contents:
-        if item.reagent_id == reagent_id and item.amount_unit == amount_unit:
-            if item.amount_value < amount_value:
-                raise BadRequestError("Não há quantidade suficiente deste reagente no recipiente de origem.")
-            item.amount_value -= amount_value
-            if item.amount_value == 0:
-                contents.remove(item)
-            return
-    raise BadRequestError("Não há quantidade suficiente deste reagente no recipiente de origem.")
+    contents = state.containers.setdefault(container_name, {})
+    key = (reagent_id, amount_unit)
+    item = contents.get(key)
+    if item is None or item.amount_value < amount_value:
+        raise BadRequestError("Não há quantidade suficiente deste reagente no recipiente de origem.")
+    state.mark_container_changed(container_name)
+    item.amount_value -= amount_value
+    if item.amount_value == 0:
+        del contents[key]
+
+
+def _apply_to_copy(db: Session, state: ScenarioRunState, action: dict) -> ScenarioRunState:
+    """Applies an action to a copy of the run, so a rejected one leaves the
+    stored run untouched."""
+    catalog_version = sync_catalog_cache(db)
+    working = clone_state(state)
+    plan = get_scenario_plan(db, state.scenario_id)
+    _apply_action_dict(working, plan, action, db, catalog_version)
+    working.version += 1
+    return working
+
+
+async def apply_action(
+    run_id: str,
+    action_type: str,
+    instrument_id: int | None,
+    source_container_name: str | None,
+    target_container_name: str | None,
+    reagent_id: int | None,
+    amount_value: float | None,
+    amount_unit: str | None,
+    db: AsyncSession,
+    since_version: int | None = None,
+) -> Dict[str, object]:
+    """Applies an action to a run. With since_version, only what changed after
+    that version is returned."""
+    action = {
+        "action_type": action_type,
+        "instrument_id": instrument_id,
+        "source_container_name": source_container_name,
+        "target_container_name": target_container_name,
+        "reagent_id": reagent_id,
+        "amount_value": amount_value,
+        "amount_unit": amount_unit,
+    }
+    for _ in range(_RUN_UPDATE_ATTEMPTS):
+        state = await asyncio.to_thread(_get_state, run_id)
+        try:
+            working = await db.run_sync(_apply_to_copy, state, action)
+        except (BadRequestError, NotFoundError) as exc:
+            await asyncio.to_thread(_record_rejected, state, action, str(exc))
+            raise
+        entries = _accepted_entries(working, action)
+        if await asyncio.to_thread(_save_run, working, entries, state.version):
+            break
+    else:
+        raise _run_conflict()
+    if since_version is not None and 0 <= since_version < working.version:
+        return _state_to_delta(working, since_version)
+    return _state_to_dict(working)
+
+
+def _apply_batch_to_copy(
+    db: Session, state: ScenarioRunState, actions: Sequence[dict]
+) -> tuple[ScenarioRunState | None, list[Dict[str, object]], list[LogEntry]]:
+    """Applies actions in order to a copy of the run, stopping at the first
+    rejected one. Returns the copy (None when an action was rejected), one
+    outcome per action and the log entries of the accepted ones."""
+    catalog_version = sync_catalog_cache(db)
+    plan = get_scenario_plan(db, state.scenario_id)
+    working = clone_state(state)
+    results: list[Dict[str, object]] = []
+    failed = False
+    run_log = get_run_log()
+    log_entries: list[LogEntry] = []
+
+    for index, action in enumerate(actions):
+        if failed:
+            results.append({"index": index, "status": "skipped"})
+            continue
+        try:
+            _apply_action_dict(working, plan, action, db, catalog_version)
+        except (BadRequestError, NotFoundError) as exc:
+            failed = True
+            results.append({"index": index, "status": "rejected", "error": str(exc)})
+            continue
+        working.version += 1
+        if run_log is not None:
+            log_entries.extend(run_log.entries_for(working, action, accepted=True))
+        results.append(
+            {
+                "index": index,
+                "status": "applied",
+                "current_step_index": working.current_step_index,
+                "message": working.message,
+            }
+        )
 
+    return (None if failed else working), results, log_entries
 
-def apply_action(
-    run_id: str,
+
+async def apply_actions_batch(
+    run_id: str, actions: Sequence[dict], db: AsyncSession
+) -> tuple[bool, Dict[str, object]]:
+    """Applies actions in order against a copy of the run, all or nothing.
+
+    Stops at the first rejected action; the run is only saved if every action
+    was accepted. Returns whether the batch was applied, plus the resulting
+    state and one outcome per action.
+    """
+    for _ in range(_RUN_UPDATE_ATTEMPTS):
+        state = await asyncio.to_thread(_get_state, run_id)
+        working, results, log_entries = await db.run_sync(_apply_batch_to_copy, state, actions)
+        if working is None:
+            await asyncio.to_thread(_record_rolled_back_batch, state, actions, results)
+            return False, {"applied": False, "state": _state_to_dict(state), "results": results}
+        if await asyncio.to_thread(_save_run, working, log_entries, state.version):
+            break
+    else:
+        raise _run_conflict()
+    return True, {"applied": True, "state": _state_to_dict(working), "results": results}
+
+
+def _record_rolled_back_batch(
+    state: ScenarioRunState,
+    actions: Sequence[dict],
+    results: Sequence[Dict[str, object]],
+) -> None:
+    run_log = get_run_log()
+    if run_log is None:
+        return
+    for action, result in zip(actions, results):
+        if result["status"] == "skipped":
+            break
+        error = result.get("error") or "Lote de ações revertido."
+        run_log.record(state, action, accepted=False, error=str(error))
+
+
+def _replay(db: Session, state: ScenarioRunState, events: Sequence[RunEvent]) -> ScenarioRunState:
+    catalog_version = sync_catalog_cache(db)
+    plan = get_scenario_plan(db, state.scenario_id)
+    for event in events:
+        _apply_action_dict(state, plan, event.action, db, catalog_version)
+        state.version = event.version
+    return state
+
+
+async def rebuild_run_state(run_id: str, db: AsyncSession) -> ScenarioRunState:
+    """Rebuilds a run from its latest snapshot and the accepted actions after it."""
+    run_log = get_run_log()
+    replay = None
+    if run_log is not None:
+        replay = await asyncio.to_thread(run_log.load_for_replay, run_id)
+    if replay is None:
+        raise NotFoundError("Execução do cenário não encontrada.")
+    state, events = replay
+    return await db.run_sync(_replay, state, events)
+
+
+async def recover_run(run_id: str, db: AsyncSession) -> Dict[str, object]:
+    state = await rebuild_run_state(run_id, db)
+    await asyncio.to_thread(_save_run, state)
+    return _state_to_dict(state)
+
+
+def list_run_events(run_id: str) -> list[Dict[str, object]]:
+    run_log = get_run_log()
+    events = run_log.list_events(run_id) if run_log is not None else []
+    if not events:
+        raise NotFoundError("Execução do cenário não encontrada.")
+    return [
+        {
+            "version": event.version,
+            "recorded_at": event.recorded_at,
+            "accepted": event.accepted,
+            "action": event.action,
+            **({"error": event.error} if event.error else {}),
+        }
+        for event in events
+    ]
+
+
+def _apply_action_dict(
+    state: ScenarioRunState,
+    plan: ScenarioPlan,
+    action: Dict[str, object],
+    db: Session,
+    catalog_version: int,
+) -> None:
+    """Applies one action; ``catalog_version`` is what ``sync_catalog_cache``
+    returned for this action, so the reaction index needs no read of its own."""
+    _apply_action_to_state(
+        state=state,
+        plan=plan,
+        action_type=action["action_type"],
+        instrument_id=action.get("instrument_id"),
+        source_container_name=action.get("source_container_name"),
+        target_container_name=action.get("target_container_name"),
+        reagent_id=action.get("reagent_id"),
+        amount_value=action.get("amount_value"),
+        amount_unit=action.get("amount_unit"),
+        db=db,
+        catalog_version=catalog_version,
+    )
+
+
+def _apply_action_to_state(
+    state: ScenarioRunState,
+    plan: ScenarioPlan,
     action_type: str,
     instrument_id: int | None,
     source_container_name: str | None,
@@ -347,13 +580,12 @@ def apply_action(
     amount_value: float | None,
     amount_unit: str | None,
     db: Session,
-) -> Dict[str, object]:
-    state = _get_state(run_id)
+    catalog_version: int,
+) -> None:
     unit_value = amount_unit.value if isinstance(amount_unit, AmountUnit) else amount_unit
     unit_value_str = str(unit_value) if unit_value is not None else None
 
-    steps = _get_ordered_steps_for_scenario(db, state.scenario_id)
-    current_step = _get_current_step(db, state)
+    current_step = _get_current_step(plan, state)
     if current_step is None:
         raise BadRequestError("Este cenário já foi concluído. Não há mais passos a realizar.")
 
@@ -373,23 +605,23 @@ def apply_action(
         if reagent_id is None or target_container_name is None or amount_value is None or unit_value_str is None:
             raise BadRequestError("Dados insuficientes para adicionar reagente.")
         container_meta = _ensure_container_meta(state, target_container_name)
-        instrument = db.get(Instrument, container_meta.instrument_id)
+        instrument = get_catalog_instrument(db, container_meta.instrument_id)
         if not instrument:
             raise NotFoundError("Instrumento não encontrado para este recipiente.")
-        reagent = db.get(Reagent, reagent_id)
+        reagent = get_catalog_reagent(db, reagent_id)
         if not reagent:
             raise NotFoundError("Reagente não encontrado.")
         validate_instrument_reagent_compatibility(instrument, reagent)
         _add_content(state, target_container_name, reagent_id, amount_value, unit_value_str)
-        _apply_reaction_if_matches(db, state, target_container_name)
+        _apply_reaction_if_matches(db, catalog_version, state, target_container_name)
         state.current_step_index += 1
         state.message = f"Passo concluído: {current_step.text_instruction}"
-        return _state_to_dict(state)
+        return
 
     if action_type == "transfer_solid_with_spatula":
         if instrument_id is None:
             raise BadRequestError("Instrumento é obrigatório para esta ação.")
-        instrument = db.get(Instrument, instrument_id)
+        instrument = get_catalog_instrument(db, instrument_id)
         if not instrument or instrument.instrument_type != "spatula":
             raise BadRequestError("Instrumento informado não é uma espátula válida.")
         if reagent_id is None or target_container_name is None:
@@ -400,7 +632,7 @@ def apply_action(
             raise BadRequestError("A unidade para transferência com espátula deve ser g.")
         unit_value_str = AmountUnit.GRAM.value
 
-        reagent = db.get(Reagent, reagent_id)
+        reagent = get_catalog_reagent(db, reagent_id)
         if not reagent:
             raise NotFoundError("Reagente não encontrado.")
         if reagent.physical_state != "solid":
@@ -410,27 +642,26 @@ def apply_action(
         if source_container_name is None:
             _ensure_container_meta(state, target_container_name)
             _add_content(state, target_container_name, reagent_id, amount_value, unit_value_str)
-            _apply_reaction_if_matches(db, state, target_container_name)
+            _apply_reaction_if_matches(db, catalog_version, state, target_container_name)
             state.current_step_index += 1
             state.message = f"Passo concluído: {current_step.text_instruction}"
-            return _state_to_dict(state)
+            return
 
         source_meta = _ensure_container_meta(state, source_container_name)
         target_meta = _ensure_container_meta(state, target_container_name)
         _ = source_meta, target_meta
 
-        source_contents = state.containers.setdefault(source_container_name, [])
-        _remove_content(source_contents, reagent_id, amount_value, unit_value_str)
+        _remove_content(state, source_container_name, reagent_id, amount_value, unit_value_str)
         _add_content(state, target_container_name, reagent_id, amount_value, unit_value_str)
-        _apply_reaction_if_matches(db, state, target_container_name)
+        _apply_reaction_if_matches(db, catalog_version, state, target_container_name)
         state.current_step_index += 1
         state.message = f"Passo concluído: {current_step.text_instruction}"
-        return _state_to_dict(state)
+        return
 
     if action_type == "transfer_liquid_with_pipette":
         if instrument_id is None:
             raise BadRequestError("Instrumento é obrigatório para esta ação.")
-        instrument = db.get(Instrument, instrument_id)
+        instrument = get_catalog_instrument(db, instrument_id)
         if not instrument or instrument.instrument_type != "pipette":
             raise BadRequestError("Instrumento informado não é uma pipeta válida.")
         if reagent_id is None or target_container_name is None:
@@ -441,7 +672,7 @@ def apply_action(
             raise BadRequestError("A unidade para transferência com pipeta deve ser mL ou gotas.")
         unit_value_str = unit_value_str
 
-        reagent = db.get(Reagent, reagent_id)
+        reagent = get_catalog_reagent(db, reagent_id)
         if not reagent:
             raise NotFoundError("Reagente não encontrado.")
         if reagent.physical_state not in {"liquid", "solution"}:
@@ -451,22 +682,21 @@ def apply_action(
         if source_container_name is None:
             _ensure_container_meta(state, target_container_name)
             _add_content(state, target_container_name, reagent_id, amount_value, unit_value_str)
-            _apply_reaction_if_matches(db, state, target_container_name)
+            _apply_reaction_if_matches(db, catalog_version, state, target_container_name)
             state.current_step_index += 1
             state.message = f"Passo concluído: {current_step.text_instruction}"
-            return _state_to_dict(state)
+            return
 
         source_meta = _ensure_container_meta(state, source_container_name)
         target_meta = _ensure_container_meta(state, target_container_name)
         _ = source_meta, target_meta
 
-        source_contents = state.containers.setdefault(source_container_name, [])
-        _remove_content(source_contents, reagent_id, amount_value, unit_value_str)
+        _remove_content(state, source_container_name, reagent_id, amount_value, unit_value_str)
         _add_content(state, target_container_name, reagent_id, amount_value, unit_value_str)
-        _apply_reaction_if_matches(db, state, target_container_name)
+        _apply_reaction_if_matches(db, catalog_version, state, target_container_name)
         state.current_step_index += 1
         state.message = f"Passo concluído: {current_step.text_instruction}"
-        return _state_to_dict(state)
+        return
 
     if action_type == "pour_liquid_between_containers":
         if source_container_name is None or target_container_name is None:
@@ -475,21 +705,22 @@ def apply_action(
         target_meta = _ensure_container_meta(state, target_container_name)
         _ = source_meta, target_meta
 
-        source_contents = state.containers.setdefault(source_container_name, [])
-        target_contents = state.containers.setdefault(target_container_name, [])
+        source_contents = state.containers.setdefault(source_container_name, {})
+        state.containers.setdefault(target_container_name, {})
 
-        for item in list(source_contents):
-            reagent = db.get(Reagent, item.reagent_id)
+        for item in list(source_contents.values()):
+            reagent = get_catalog_reagent(db, item.reagent_id)
             if not reagent:
                 raise NotFoundError("Reagente não encontrado.")
             if reagent.physical_state not in {"liquid", "solution"}:
                 raise BadRequestError("Somente líquidos ou soluções podem ser despejados entre recipientes.")
             _add_content(state, target_container_name, item.reagent_id, item.amount_value, item.amount_unit)
 
-        state.containers[source_container_name] = []
-        _apply_reaction_if_matches(db, state, target_container_name)
+        state.containers[source_container_name] = {}
+        state.mark_container_changed(source_container_name)
+        _apply_reaction_if_matches(db, catalog_version, state, target_container_name)
         state.current_step_index += 1
         state.message = f"Passo concluído: {current_step.text_instruction}"
-        return _state_to_dict(state)
+        return
 
     raise BadRequestError("Tipo de ação inválido ou não suportado.")
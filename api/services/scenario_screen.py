@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from typing import Sequence
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
 
 from core.exceptions import NotFoundError
 from models.scenario import Scenario
@@ -52,6 +54,10 @@ def create_screens_for_scenario(
 
         created.append(screen)
 
+    # Screens are part of the scenario's content; cached run pages are keyed
+    # by the scenario's updated_at.
+    scenario.updated_at = datetime.now(timezone.utc)
+
     if commit:
         db.commit()
         for screen in created:
@@ -61,14 +67,31 @@ def create_screens_for_scenario(
 
 
 def list_screens_for_scenario(db: Session, scenario_id: int) -> list[ScenarioScreen]:
-    return (
-        db.query(ScenarioScreen)
-        .filter(ScenarioScreen.scenario_id == scenario_id)
-        .order_by(ScenarioScreen.order_index)
-        .all()
+    return list(
+        db.scalars(
+            select(ScenarioScreen)
+            .where(ScenarioScreen.scenario_id == scenario_id)
+            .order_by(ScenarioScreen.order_index, ScenarioScreen.id)
+            .options(selectinload(ScenarioScreen.slider_images))
+        )
     )
 
 
+def get_screen_at(db: Session, scenario_id: int, position: int) -> ScenarioScreen | None:
+    """Returns the scenario's screen at ``position`` in display order, loading
+    only that screen and its slider images."""
+    if position < 0:
+        return None
+    return db.scalars(
+        select(ScenarioScreen)
+        .where(ScenarioScreen.scenario_id == scenario_id)
+        .order_by(ScenarioScreen.order_index, ScenarioScreen.id)
+        .offset(position)
+        .limit(1)
+        .options(selectinload(ScenarioScreen.slider_images))
+    ).first()
+
+
 def get_screen(db: Session, screen_id: int) -> ScenarioScreen:
     screen = db.get(ScenarioScreen, screen_id)
     if not screen:
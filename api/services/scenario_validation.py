@@ -0,0 +1,183 @@
+"""Headless dry runs that check whether scenarios can be completed.
+
+Each scenario is driven through the run engine with one action per step,
+built from the step's own fields, without touching the run store or log.
+
+    python -m services.scenario_validation [--workers N] [--include-inactive] [SCENARIO_ID ...]
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from core.database import SessionLocal
+from core.exceptions import BadRequestError, NotFoundError
+from models.scenario import Scenario
+from services.catalog_cache import sync_catalog_cache
+from services.run_state import AmountUnit, ContainersMeta, ScenarioRunState
+from services.scenario_plan import PlannedStep, get_scenario_plan
+from services.scenario_run import _apply_action_dict, _default_containers_meta
+
+# Below this many scenarios, starting a pool costs more than it saves
+_MIN_SCENARIOS_FOR_POOL = 8
+# Most workers a caller may ask for; each is a fresh interpreter importing
+# the whole app, and validate_scenarios also caps them at the CPU count.
+MAX_WORKERS = 32
+
+_DEFAULT_UNITS = {
+    "add_reagent": "un",
+    "transfer_solid_with_spatula": AmountUnit.GRAM.value,
+    "transfer_liquid_with_pipette": AmountUnit.MILLILITER.value,
+}
+_DEFAULT_TOOLS = {
+    "transfer_solid_with_spatula": "spatula",
+    "transfer_liquid_with_pipette": "pipette",
+}
+
+
+def _action_for_step(step: PlannedStep, containers_meta: ContainersMeta) -> Dict[str, object]:
+    """Builds the action a student would submit for a step. Fields the step
+    leaves open get the roster's tool for the action and a unit amount."""
+    instrument_id = step.instrument_id
+    tool_type = _DEFAULT_TOOLS.get(step.action_type)
+    if instrument_id is None and tool_type is not None:
+        instrument_id = next(
+            (
+                meta.instrument_id
+                for meta in containers_meta.values()
+                if meta.instrument_type == tool_type
+            ),
+            None,
+        )
+    amount_value = step.amount_value
+    amount_unit = step.amount_unit
+    if step.action_type in _DEFAULT_UNITS:
+        amount_value = amount_value if amount_value is not None else 1.0
+        amount_unit = amount_unit or _DEFAULT_UNITS[step.action_type]
+    return {
+        "action_type": step.action_type,
+        "instrument_id": instrument_id,
+        "source_container_name": step.source_container_name,
+        "target_container_name": step.target_container_name,
+        "reagent_id": step.reagent_id,
+        "amount_value": amount_value,
+        "amount_unit": amount_unit,
+    }
+
+
+def _report(
+    scenario_id: int,
+    title: str | None = None,
+    step_count: int | None = None,
+    failed_step: Dict[str, object] | None = None,
+    reason: str | None = None,
+) -> Dict[str, object]:
+    """One report shape for every outcome; ``reason`` is set when it failed."""
+    return {
+        "scenario_id": scenario_id,
+        "title": title,
+        "step_count": step_count,
+        "ok": reason is None,
+        "failed_step": failed_step,
+        "reason": reason,
+    }
+
+
+def dry_run_scenario(db: Session, scenario_id: int) -> Dict[str, object]:
+    catalog_version = sync_catalog_cache(db)
+    plan = get_scenario_plan(db, scenario_id)
+    title = db.execute(select(Scenario.title).where(Scenario.id == scenario_id)).scalar_one()
+    try:
+        containers_meta = _default_containers_meta(db)
+    except NotFoundError as exc:
+        if not plan.steps:
+            return _report(scenario_id, title, plan.step_count)
+        return _report(scenario_id, title, plan.step_count, reason=str(exc))
+
+    state = ScenarioRunState(
+        run_id=f"dry-run-{scenario_id}",
+        scenario_id=scenario_id,
+        containers={name: {} for name in containers_meta},
+        containers_meta=containers_meta,
+    )
+    for index, step in enumerate(plan.steps):
+        try:
+            _apply_action_dict(
+                state, plan, _action_for_step(step, containers_meta), db, catalog_version
+            )
+        except (BadRequestError, NotFoundError) as exc:
+            failed_step = {
+                "index": index,
+                "order_index": step.order_index,
+                "text_instruction": step.text_instruction,
+            }
+            return _report(scenario_id, title, plan.step_count, failed_step, str(exc))
+    return _report(scenario_id, title, plan.step_count)
+
+
+def _validate_in_worker(scenario_id: int) -> Dict[str, object]:
+    db = SessionLocal()
+    try:
+        return dry_run_scenario(db, scenario_id)
+    except NotFoundError as exc:
+        return _report(scenario_id, reason=str(exc))
+    finally:
+        db.close()
+
+
+def list_scenario_ids(db: Session, include_inactive: bool = False) -> list[int]:
+    query = select(Scenario.id).order_by(Scenario.id)
+    if not include_inactive:
+        query = query.where(Scenario.is_active.is_(True))
+    return list(db.execute(query).scalars())
+
+
+def validate_scenarios(
+    scenario_ids: Sequence[int], workers: int | None = None
+) -> list[Dict[str, object]]:
+    cpu_count = os.cpu_count() or 1
+    workers = min(workers or cpu_count, cpu_count, MAX_WORKERS, len(scenario_ids))
+    if workers <= 1 or len(scenario_ids) < _MIN_SCENARIOS_FOR_POOL:
+        return [_validate_in_worker(scenario_id) for scenario_id in scenario_ids]
+
+    chunksize = max(1, len(scenario_ids) // (workers * 4))
+    # Spawned workers import the app fresh instead of inheriting the parent's
+    # engine, connections and threads (the web server's included) via fork.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        return list(pool.map(_validate_in_worker, scenario_ids, chunksize=chunksize))
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Valida cenários com execuções simuladas.")
+    parser.add_argument("scenario_ids", nargs="*", type=int)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--include-inactive", action="store_true")
+    args = parser.parse_args(argv)
+
+    scenario_ids = args.scenario_ids
+    if not scenario_ids:
+        db = SessionLocal()
+        try:
+            scenario_ids = list_scenario_ids(db, include_inactive=args.include_inactive)
+        finally:
+            db.close()
+
+    reports = validate_scenarios(scenario_ids, workers=args.workers)
+    for report in reports:
+        print(json.dumps(report, ensure_ascii=False))
+    failures = sum(1 for report in reports if not report["ok"])
+    print(f"{len(reports)} cenários validados, {failures} com falha.", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,23 +1,26 @@
 from __future__ import annotations
 
+from typing import Sequence
+
 from core.exceptions import BadRequestError
-from models.instrument import Instrument
-from models.reagent import Reagent
+from services.catalog_cache import CatalogInstrument, CatalogReagent
 
 
 def validate_instrument_reagent_compatibility(
-    instrument: Instrument,
-    reagent: Reagent,
+    instrument: CatalogInstrument,
+    reagent: CatalogReagent,
 ) -> None:
-    allowed_states_raw = (instrument.allowed_physical_states or "").strip()
-    if not allowed_states_raw:
-        return
-
-    allowed_states = {state.strip() for state in allowed_states_raw.split(",") if state.strip()}
-    if not allowed_states:
+    if not instrument.allowed_states:
         return
 
-    if reagent.physical_state not in allowed_states:
+    if reagent.physical_state not in instrument.allowed_states:
         raise BadRequestError(
             "Este instrumento não é compatível com o estado físico do reagente."
         )
+
+
+def generate_reaction_key(reagent_ids: Sequence[int]) -> str:
+    if not reagent_ids:
+        return ""
+    sorted_ids = sorted(reagent_ids)
+    return "+".join(str(rid) for rid in sorted_ids)
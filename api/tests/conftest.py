@@ -0,0 +1,29 @@
+"""The app on a throwaway SQLite database, with the in-memory run store and
+no run log. Settings are read once at import, so the environment is set
+before anything from the app is imported."""
+from __future__ import annotations
+
+import os
+import tempfile
+
+_tmp_dir = tempfile.mkdtemp(prefix="chemistry-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_tmp_dir}/app.db"
+os.environ["RUN_STORE_BACKEND"] = "memory"
+os.environ["RUN_LOG_ENABLED"] = "false"
+os.environ["STATIC_BUILD_DIR"] = f"{_tmp_dir}/static"
+os.environ["STATIC_BUILD_ON_STARTUP"] = "false"
+
+import pytest
+from fastapi.testclient import TestClient
+
+import models  # noqa: F401 - registers every mapper
+from core.database import Base, engine
+
+
+@pytest.fixture(scope="session")
+def client():
+    from main import app
+
+    Base.metadata.create_all(engine)
+    with TestClient(app) as client:
+        yield client
@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from core.database import engine
+
+
+@contextmanager
+def count_queries(target: Engine = engine):
+    """Collects every SQL statement ``target`` runs inside the block."""
+    statements: list[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(target, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(target, "before_cursor_execute", before_cursor_execute)
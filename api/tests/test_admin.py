@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from services import scenario_validation
+
+MISSING_IDS = list(range(900_001, 900_009))
+
+
+def test_validate_scenarios_runs_in_spawned_pool(client, monkeypatch):
+    # Enough CPUs for a pool even on single-core runners
+    monkeypatch.setattr(scenario_validation.os, "cpu_count", lambda: 2)
+    response = client.post(
+        "/admin/scenarios/validate",
+        params={"scenario_id": MISSING_IDS, "workers": 2},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/json")
+    data = response.json()
+    assert data["validated"] == len(MISSING_IDS)
+    assert data["failed"] == len(MISSING_IDS)
+    assert [report["scenario_id"] for report in data["reports"]] == MISSING_IDS
+
+
+def test_reports_share_one_shape(client):
+    scenario = client.post(
+        "/scenarios/", json=dict(title="Sem passos", description="Vazio", steps=[])
+    )
+    assert scenario.status_code == 201, scenario.text
+
+    response = client.post(
+        "/admin/scenarios/validate",
+        params={"scenario_id": [scenario.json()["id"], MISSING_IDS[0]]},
+    )
+
+    assert response.status_code == 200
+    found, missing = response.json()["reports"]
+    assert found.keys() == missing.keys()
+    assert found["ok"] and found["reason"] is None
+    assert not missing["ok"] and missing["title"] is None and missing["reason"]
+
+
+def test_worker_count_is_bounded(client):
+    response = client.post(
+        "/admin/scenarios/validate",
+        params={"scenario_id": MISSING_IDS, "workers": scenario_validation.MAX_WORKERS + 1},
+    )
+    assert response.status_code == 422
+
+
+def test_workers_are_capped_at_the_cpu_count(monkeypatch):
+    monkeypatch.setattr(scenario_validation.os, "cpu_count", lambda: 1)
+    calls = []
+    monkeypatch.setattr(
+        scenario_validation, "_validate_in_worker", lambda scenario_id: calls.append(scenario_id)
+    )
+
+    scenario_validation.validate_scenarios(MISSING_IDS, workers=scenario_validation.MAX_WORKERS)
+
+    # One CPU: validated inline, without a pool
+    assert calls == MISSING_IDS
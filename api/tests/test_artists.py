@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+
+def test_artist_responses_include_the_timeline(client):
+    created = client.post(
+        "/artists/",
+        json=dict(
+            name="Artista com linha do tempo",
+            bio="Bio",
+            timeline=[
+                {"year": 1950, "title": "Obra", "description": "Primeira obra"},
+                {"year": 1900, "description": "Nascimento"},
+            ],
+        ),
+    )
+    assert created.status_code == 201, created.text
+    artist_id = created.json()["id"]
+    expected = [
+        {"year": 1900, "title": None, "description": "Nascimento"},
+        {"year": 1950, "title": "Obra", "description": "Primeira obra"},
+    ]
+
+    def timeline(artist):
+        return [
+            {key: entry[key] for key in ("year", "title", "description")}
+            for entry in artist["timeline"]
+        ]
+
+    assert timeline(created.json()) == expected
+    assert timeline(client.get(f"/artists/{artist_id}").json()) == expected
+    (listed,) = [a for a in client.get("/artists/").json() if a["id"] == artist_id]
+    assert timeline(listed) == expected
+    # Sparse fieldsets leave the timeline, and its query, out unless asked
+    sparse_list = client.get("/artists/", params={"fields": "id,name"}).json()
+    (sparse,) = [a for a in sparse_list if a["id"] == artist_id]
+    assert sparse == {"id": artist_id, "name": "Artista com linha do tempo"}
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from sqlalchemy import update
+
+from core.database import SessionLocal
+from models.reagent import Reagent
+from services.catalog_cache import get_catalog_names, get_catalog_reagent, sync_catalog_cache
+from services.catalog_version import bump_catalog_change_version
+from tests.queries import count_queries
+
+
+def _write_from_another_worker(reagent_id: int, name: str) -> None:
+    # Bypasses this process's services, like a write served by another worker
+    with SessionLocal() as db:
+        db.execute(update(Reagent).where(Reagent.id == reagent_id).values(name=name))
+        bump_catalog_change_version(db)
+        db.commit()
+
+
+def test_cached_reagent_is_read_once_and_dropped_after_update(client):
+    response = client.post(
+        "/reagents/", json=dict(name="Cache antigo", formula="X", physical_state="liquid")
+    )
+    assert response.status_code == 201, response.text
+    reagent_id = response.json()["id"]
+
+    with SessionLocal() as db:
+        sync_catalog_cache(db)
+        assert get_catalog_reagent(db, reagent_id).name == "Cache antigo"
+        with count_queries() as statements:
+            assert get_catalog_reagent(db, reagent_id).name == "Cache antigo"
+        assert statements == []
+
+    response = client.put(f"/reagents/{reagent_id}", json=dict(name="Cache novo"))
+    assert response.status_code == 200, response.text
+
+    with SessionLocal() as db:
+        sync_catalog_cache(db)
+        assert get_catalog_reagent(db, reagent_id).name == "Cache novo"
+
+
+def test_name_maps_are_reused_until_the_catalog_changes(client):
+    with SessionLocal() as db:
+        names = get_catalog_names(db)
+        with count_queries() as statements:
+            assert get_catalog_names(db) is names
+        # Only the catalog version is read
+        assert len(statements) == 1
+
+    response = client.post(
+        "/instruments/", json=dict(name="Proveta", instrument_type="cylinder", is_container=True)
+    )
+    assert response.status_code == 201, response.text
+    instrument_id = response.json()["id"]
+
+    with SessionLocal() as db:
+        assert get_catalog_names(db).instruments[instrument_id] == "Proveta"
+
+
+def test_catalog_cache_follows_persisted_version(client):
+    response = client.post(
+        "/reagents/", json=dict(name="Outro antigo", formula="X", physical_state="liquid")
+    )
+    assert response.status_code == 201, response.text
+    reagent_id = response.json()["id"]
+
+    with SessionLocal() as db:
+        assert get_catalog_names(db).reagents[reagent_id] == "Outro antigo"
+        assert get_catalog_reagent(db, reagent_id).name == "Outro antigo"
+
+    _write_from_another_worker(reagent_id, "Outro novo")
+
+    with SessionLocal() as db:
+        assert get_catalog_names(db).reagents[reagent_id] == "Outro novo"
+        assert get_catalog_reagent(db, reagent_id).name == "Outro novo"
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from fastapi import FastAPI, Request
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+
+from core.compression import CompressionMiddleware, select_encoding
+from core.http_cache import etag_matches, not_modified
+
+ETAG = '"body-1"'
+
+
+def _app():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=16)
+
+    @app.get("/short")
+    def short():
+        return PlainTextResponse("curto")
+
+    @app.get("/text")
+    def text(request: Request):
+        if etag_matches(request.headers.get("if-none-match"), ETAG):
+            return not_modified(ETAG)
+        return PlainTextResponse("conteúdo " * 200, headers={"ETag": ETAG})
+
+    return TestClient(app)
+
+
+def test_encoded_responses_get_a_weak_etag():
+    client = _app()
+    identity = client.get("/text", headers={"Accept-Encoding": "identity"})
+    encoded = client.get("/text", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["etag"] == ETAG
+    assert encoded.headers["content-encoding"] == "gzip"
+    assert encoded.headers["etag"] == "W/" + ETAG
+
+    revalidated = client.get(
+        "/text", headers={"Accept-Encoding": "gzip", "If-None-Match": encoded.headers["etag"]}
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == "W/" + ETAG
+
+
+def test_small_bodies_are_sent_as_is():
+    response = _app().get("/short", headers={"Accept-Encoding": "gzip"})
+    assert "content-encoding" not in response.headers
+    assert response.text == "curto"
+
+
+def test_encoding_is_chosen_by_q_value():
+    assert select_encoding("gzip;q=0, identity") is None
+    assert select_encoding("identity;q=1, gzip;q=0.5") == "gzip"
+    assert select_encoding("") is None
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from itertools import combinations
+from urllib.parse import parse_qs, urlsplit
+
+from core.fieldsets import SPARSE_CACHE_SIZE, sparse_list_adapter, sparse_schema
+from core.json_response import type_adapter
+from schemas.reagent import ReagentRead
+
+
+def test_fieldset_caches_stay_bounded():
+    names = list(ReagentRead.model_fields)
+    fieldsets = [
+        frozenset(combo)
+        for size in range(1, len(names) + 1)
+        for combo in combinations(names, size)
+    ]
+    adapters_before = type_adapter.cache_info().currsize
+    for _ in range(2):
+        for fields in fieldsets:
+            sparse_list_adapter(ReagentRead, fields)
+
+    assert sparse_list_adapter.cache_info().maxsize == SPARSE_CACHE_SIZE
+    assert sparse_schema.cache_info().maxsize == SPARSE_CACHE_SIZE
+    assert sparse_list_adapter.cache_info().hits >= len(fieldsets)
+    # Fieldsets never reach the unbounded cache keyed by schema identity
+    assert type_adapter.cache_info().currsize == adapters_before
+
+
+def test_list_adapter_reused_for_equal_fieldsets():
+    first = sparse_list_adapter(ReagentRead, frozenset({"id", "name"}))
+    assert sparse_list_adapter(ReagentRead, frozenset({"name", "id"})) is first
+
+
+def test_list_returns_only_the_requested_fields(client):
+    for index in range(2):
+        response = client.post(
+            "/reagents/", json=dict(name=f"Campos {index}", formula="C", physical_state="solid")
+        )
+        assert response.status_code == 201, response.text
+
+    page = client.get("/reagents/", params={"fields": "id,name", "limit": 1})
+    assert page.status_code == 200, page.text
+    assert [set(item) for item in page.json()] == [{"id", "name"}]
+    next_url = page.headers["Link"].split(";")[0].strip("<>")
+    assert parse_qs(urlsplit(next_url).query)["fields"] == ["id,name"]
+
+    assert client.get("/reagents/", params={"fields": "id,nope"}).status_code == 400
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+from pydantic import TypeAdapter
+
+from core.json_response import dump_adapter_json
+from schemas.reagent import ReagentRead
+
+ROW = dict(id=1, name="Água", formula="H2O", physical_state="liquid", tags=None, image_path=None)
+
+
+class _CountingAdapter(TypeAdapter):
+    validations = 0
+
+    def validate_python(self, *args, **kwargs):
+        type(self).validations += 1
+        return super().validate_python(*args, **kwargs)
+
+
+def test_orm_rows_are_validated_and_models_are_dumped_directly():
+    adapter = _CountingAdapter(list[ReagentRead])
+
+    from_rows = dump_adapter_json(adapter, [SimpleNamespace(**ROW)])
+    assert _CountingAdapter.validations == 1
+
+    from_models = dump_adapter_json(adapter, [ReagentRead(**ROW)])
+    assert _CountingAdapter.validations == 1
+    assert json.loads(from_models) == json.loads(from_rows) == [ROW]
+
+
+def test_api_responses_are_json_bytes(client):
+    created = client.post(
+        "/reagents/", json=dict(name="Bytes", formula="B", physical_state="solid")
+    )
+    assert created.status_code == 201, created.text
+    assert created.headers["content-type"] == "application/json"
+
+    listed = client.get("/reagents/")
+    assert listed.headers["content-type"] == "application/json"
+    assert created.json() in listed.json()
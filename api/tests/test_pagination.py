@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from core.config import get_settings
+from core.pagination import encode_cursor
+
+CRAFTED_VALUES = [
+    [[1, 2], 1],
+    [{"id": 1}, 1],
+    ["Nome", [1]],
+    ["Nome", "1"],
+    ["Nome", True],
+    [["dt", "2024-01-01T00:00:00"], 1],
+]
+
+
+@pytest.mark.parametrize("values", CRAFTED_VALUES)
+def test_crafted_cursor_is_rejected(client, values):
+    response = client.get("/reagents/", params={"after": encode_cursor(values)})
+    assert response.status_code == 400, response.text
+
+
+@pytest.mark.parametrize("values", [[[1], 1], [["dt", "2024-01-01T00:00:00"], {"a": 1}]])
+def test_crafted_scenario_cursor_is_rejected(client, values):
+    response = client.get("/scenarios/", params={"after": encode_cursor(values)})
+    assert response.status_code == 400, response.text
+
+
+def test_next_page_cursor_round_trips(client):
+    for index in range(3):
+        client.post(
+            "/reagents/", json=dict(name=f"Página {index}", formula="X", physical_state="solid")
+        )
+    first = client.get("/reagents/", params={"limit": 1})
+    assert first.status_code == 200
+    next_url = first.headers["Link"].split(";")[0].strip("<>")
+    assert client.get(next_url).status_code == 200
+
+
+def test_unpaginated_request_gets_every_row(client, monkeypatch):
+    monkeypatch.setattr(get_settings(), "page_size_default", 2)
+    for index in range(4):
+        client.post(
+            "/reagents/", json=dict(name=f"Inteira {index}", formula="X", physical_state="solid")
+        )
+
+    everything = client.get("/reagents/")
+    assert everything.status_code == 200
+    assert "Link" not in everything.headers
+    assert len(everything.json()) >= 4
+
+    first = client.get("/reagents/", params={"limit": 2})
+    assert len(first.json()) == 2
+    # A cursor without a limit continues with the default page size
+    next_url = first.headers["Link"].split(";")[0].strip("<>")
+    (cursor,) = parse_qs(urlsplit(next_url).query)["after"]
+    assert len(client.get("/reagents/", params={"after": cursor}).json()) == 2
@@ -0,0 +1,98 @@
+"""Pins how many SQL statements each catalog endpoint runs, so a lazy load
+sneaking back into a list or detail response fails here instead of turning
+into one query per row. The counts include the catalog version read."""
+from __future__ import annotations
+
+import pytest
+
+from tests.queries import count_queries
+
+ROWS = 6
+
+
+@pytest.fixture(scope="module")
+def catalog(client):
+    def create(path, payload):
+        response = client.post(path, json=payload)
+        assert response.status_code == 201, response.text
+        return response.json()
+
+    reagents = [
+        create("/reagents/", dict(name=f"Contagem {index}", formula="X", physical_state="liquid"))
+        for index in range(ROWS)
+    ]
+    artists = [
+        create(
+            "/artists/",
+            dict(
+                name=f"Artista {index}",
+                bio="Bio",
+                timeline=[
+                    {"year": 1900 + index, "description": "Nascimento"},
+                    {"year": 1950 + index, "description": "Obra"},
+                ],
+            ),
+        )
+        for index in range(ROWS)
+    ]
+    scenarios = [
+        create(
+            "/scenarios/",
+            dict(
+                title=f"Cenário {index}",
+                description="Contagem",
+                artist_id=artist["id"],
+                steps=[
+                    dict(
+                        order_index=order,
+                        title="Passo",
+                        text_instruction="Adicione",
+                        action_type="add_reagent",
+                        reagent_id=reagents[0]["id"],
+                    )
+                    for order in range(3)
+                ],
+                screens=[
+                    dict(
+                        order_index=order,
+                        title="Tela",
+                        screen_type="title_image_slider",
+                        slider_images=[{"order_index": 0, "image_path": "a.png"}],
+                    )
+                    for order in range(2)
+                ],
+            ),
+        )
+        for index, artist in enumerate(artists)
+    ]
+    for index in range(ROWS):
+        create(
+            "/reactions/",
+            dict(
+                description=f"Reação {index}",
+                product_reagent_id=reagents[0]["id"],
+                message="Reagiu",
+                reagents=[
+                    {"reagent_id": reagents[1]["id"], "role": "reactant"},
+                    {"reagent_id": reagents[2]["id"], "role": "reactant"},
+                ],
+            ),
+        )
+    return {"scenario_id": scenarios[0]["id"]}
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("/scenarios/", 5),
+        ("/scenarios/{scenario_id}", 5),
+        ("/reactions/", 3),
+        ("/artists/", 3),
+        ("/reagents/", 2),
+    ],
+)
+def test_catalog_endpoint_query_count(client, catalog, path, expected):
+    with count_queries() as statements:
+        response = client.get(path.format(**catalog))
+    assert response.status_code == 200, response.text
+    assert len(statements) == expected, "\n\n".join(statements)
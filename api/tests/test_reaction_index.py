@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from core.database import SessionLocal
+from models.reaction import Reaction
+from models.reaction_reagent import ReactionReagent
+from services.catalog_version import bump_catalog_change_version
+from services.reaction_index import get_reaction_index
+from services.utils import generate_reaction_key
+
+
+def _reagents(client, prefix, count):
+    return [
+        client.post(
+            "/reagents/", json=dict(name=f"{prefix} {index}", formula="X", physical_state="liquid")
+        ).json()["id"]
+        for index in range(count)
+    ]
+
+
+def _reaction(client, product, reagent_ids):
+    response = client.post(
+        "/reactions/",
+        json=dict(
+            description="Reação",
+            product_reagent_id=product,
+            message="Reagiu",
+            reagents=[{"reagent_id": reagent_id, "role": "reagent"} for reagent_id in reagent_ids],
+        ),
+    )
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def test_most_specific_reaction_contained_in_the_container_wins(client):
+    first, second, third, product = _reagents(client, "Índice", 4)
+    pair = _reaction(client, product, [first, second])
+    triple = _reaction(client, product, [first, second, third])
+
+    with SessionLocal() as db:
+        index = get_reaction_index(db)
+        assert index.find_best_match(1, [first]) is None
+        assert index.find_best_match(1, [first, second]).reaction_id == pair
+        assert index.find_best_match(1, [first, second, third]).reaction_id == triple
+        assert index.find_best_match(1, [first, third, product]) is None
+
+
+def test_reaction_written_by_another_worker_is_matched(client):
+    first, second, product = _reagents(client, "Outro", 3)
+    with SessionLocal() as db:
+        assert get_reaction_index(db).find_best_match(1, [first, second]) is None
+
+    # Written without the reaction service, like a write served by another worker
+    with SessionLocal() as db:
+        reaction = Reaction(
+            description="Outro processo",
+            product_reagent_id=product,
+            reaction_key=generate_reaction_key([first, second]),
+            message="Reagiu",
+            reagents=[
+                ReactionReagent(reagent_id=first, role="reagent"),
+                ReactionReagent(reagent_id=second, role="reagent"),
+            ],
+        )
+        db.add(reaction)
+        bump_catalog_change_version(db)
+        db.commit()
+        reaction_id = reaction.id
+
+    with SessionLocal() as db:
+        match = get_reaction_index(db).find_best_match(1, [first, second])
+    assert match is not None and match.reaction_id == reaction_id
+
+
+def test_reaction_writes_rebuild_the_index(client):
+    first, second, product = _reagents(client, "Reescrita", 3)
+    with SessionLocal() as db:
+        assert get_reaction_index(db).find_best_match(1, [first, second]) is None
+
+    reaction_id = _reaction(client, product, [first, second])
+    with SessionLocal() as db:
+        assert get_reaction_index(db).find_best_match(1, [first, second]).reaction_id == reaction_id
+
+    assert client.delete(f"/reactions/{reaction_id}").status_code == 204
+    with SessionLocal() as db:
+        assert get_reaction_index(db).find_best_match(1, [first, second]) is None
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+from sqlalchemy import text
+
+from services.run_actors import get_actor_registry, run_serialized, run_serialized_in_session
+
+
+def test_calls_for_one_run_never_overlap():
+    running = {"now": 0, "most": 0}
+    lock = threading.Lock()
+
+    def work(index):
+        with lock:
+            running["now"] += 1
+            running["most"] = max(running["most"], running["now"])
+        time.sleep(0.01)
+        with lock:
+            running["now"] -= 1
+        return index
+
+    async def scenario():
+        calls = [run_serialized("run-1", work, index) for index in range(5)]
+        results = await asyncio.gather(*calls)
+        return results, get_actor_registry().stats()
+
+    results, stats = asyncio.run(scenario())
+    assert results == list(range(5))
+    assert running["most"] == 1
+    assert stats.active_actors == 0
+    assert stats.processed_messages == 5
+
+
+def test_work_keeps_its_session_when_the_caller_is_cancelled():
+    async def scenario():
+        started, release, finished = asyncio.Event(), asyncio.Event(), asyncio.Event()
+        seen = {}
+
+        async def work(*, db):
+            started.set()
+            await release.wait()
+            seen["value"] = (await db.execute(text("SELECT 1"))).scalar_one()
+            finished.set()
+
+        caller = asyncio.create_task(run_serialized_in_session("run-1", work))
+        await started.wait()
+        # The client went away: the request is cancelled mid-work.
+        caller.cancel()
+        release.set()
+        await asyncio.wait_for(finished.wait(), timeout=5)
+        return caller.cancelled(), seen["value"]
+
+    cancelled, value = asyncio.run(scenario())
+    assert cancelled
+    assert value == 1
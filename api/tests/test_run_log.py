@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+from services.run_log import RunActionLog
+from services.run_state import ScenarioRunState
+
+
+def _state(version: int) -> ScenarioRunState:
+    return ScenarioRunState(
+        run_id="run-1",
+        scenario_id=1,
+        containers={},
+        containers_meta={},
+        current_step_index=version,
+        version=version,
+    )
+
+
+def test_replay_starts_from_the_latest_snapshot(tmp_path):
+    log = RunActionLog(str(tmp_path / "run_log.db"), snapshot_every=2, flush_size=100)
+    log.snapshot(_state(0))
+    for version in (1, 2, 3):
+        log.record(_state(version), {"action_type": f"passo {version}"}, accepted=True)
+    log.record(_state(3), {"action_type": "errado"}, accepted=False, error="Não")
+
+    snapshot, events = log.load_for_replay("run-1")
+
+    assert snapshot.version == 2
+    assert [event.action for event in events] == [{"action_type": "passo 3"}]
+    assert [event.accepted for event in log.list_events("run-1")] == [True, True, True, False]
+    assert log.load_for_replay("run-2") is None
+
+
+def test_entries_are_buffered_until_the_flush_size(tmp_path):
+    path = str(tmp_path / "run_log.db")
+    log = RunActionLog(path, snapshot_every=0, flush_size=3)
+    reader = RunActionLog(path, snapshot_every=0, flush_size=3)
+    log.record(_state(1), {"action_type": "a"}, accepted=True)
+    log.record(_state(2), {"action_type": "b"}, accepted=True)
+
+    assert reader.list_events("run-1") == []
+    log.record(_state(3), {"action_type": "c"}, accepted=True)
+    assert [event.version for event in reader.list_events("run-1")] == [1, 2, 3]
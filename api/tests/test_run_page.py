@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import re
+
+TRICKY = "__run_id__ <run-id> </script>"
+
+
+def test_run_id_only_fills_its_own_slots(client):
+    scenario = client.post(
+        "/scenarios/",
+        json=dict(
+            title=f"Título {TRICKY}",
+            description=TRICKY,
+            screens=[dict(order_index=0, title=TRICKY, screen_type="title_image_slider")],
+        ),
+    )
+    assert scenario.status_code == 201, scenario.text
+    path = f"/ui/scenarios/{scenario.json()['id']}/run"
+
+    for _ in range(2):  # rendered, then served from the page cache
+        page = client.get(path)
+        assert page.status_code == 200, page.text
+        run_ids = set(re.findall(r'/ui/scenario-runs/([^/"]+)/', page.text))
+        assert len(run_ids) == 1
+        (run_id,) = run_ids
+        assert client.get(f"/scenario-runs/{run_id}").status_code == 200
+        assert "<run-id>" not in page.text
+        assert "__run_id__ &lt;run-id&gt;" in page.text
+        screens_data = page.text.split('id="screens-data"')[1].split("</script>")[0]
+        assert "__run_id__ \\u003crun-id\\u003e" in screens_data
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import pytest
+
+from core.exceptions import BadRequestError
+from services.run_state import (
+    ContainerMeta,
+    ScenarioRunState,
+    clone_state,
+    decode_state,
+    encode_state,
+    intern_containers_meta,
+)
+from services.scenario_run import _add_content, _remove_content
+
+
+def _meta():
+    return {
+        "beaker_1": ContainerMeta(1, "beaker", True, "liquid"),
+        "pipette_1": ContainerMeta(2, "pipette", False, "liquid"),
+    }
+
+
+def _state() -> ScenarioRunState:
+    return ScenarioRunState(
+        run_id="run-1",
+        scenario_id=1,
+        containers={"beaker_1": {}},
+        containers_meta=intern_containers_meta(_meta()),
+    )
+
+
+def test_runs_with_the_same_roster_share_one_read_only_meta_map():
+    shared = intern_containers_meta(_meta())
+
+    assert intern_containers_meta(_meta()) is shared
+    assert decode_state("run-2", encode_state(_state())).containers_meta is shared
+    with pytest.raises(TypeError):
+        shared["flask_1"] = ContainerMeta(3, "flask", True)
+
+
+def test_contents_merge_by_reagent_and_unit():
+    state = _state()
+    _add_content(state, "beaker_1", 7, 10.0, "mL")
+    _add_content(state, "beaker_1", 8, 1.0, "g")
+    _add_content(state, "beaker_1", 7, 5.0, "mL")
+    _add_content(state, "beaker_1", 7, 2.0, "drop")
+
+    contents = state.containers["beaker_1"]
+    entries = [(item.reagent_id, item.amount_value, item.amount_unit) for item in contents.values()]
+    assert entries == [
+        (7, 15.0, "mL"),
+        (8, 1.0, "g"),
+        (7, 2.0, "drop"),
+    ]
+
+    _remove_content(state, "beaker_1", 7, 15.0, "mL")
+    assert (7, "mL") not in contents
+    with pytest.raises(BadRequestError):
+        _remove_content(state, "beaker_1", 8, 2.0, "g")
+
+
+def test_clone_does_not_share_contents():
+    state = _state()
+    _add_content(state, "beaker_1", 7, 10.0, "mL")
+    copy = clone_state(state)
+    _add_content(copy, "beaker_1", 7, 5.0, "mL")
+    _add_content(copy, "beaker_1", 8, 1.0, "g")
+
+    assert [item.amount_value for item in state.containers["beaker_1"].values()] == [10.0]
+    assert copy.containers_meta is state.containers_meta
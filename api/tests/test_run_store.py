@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import sqlite3
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from services import run_store as run_store_module
+from services.run_state import ContainerContentItem, ContainerMeta, ScenarioRunState, encode_state
+from services.run_store import InMemoryRunStore, SqliteRunStore
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def store(request, tmp_path):
+    if request.param == "memory":
+        return InMemoryRunStore(max_runs=0, idle_ttl_seconds=0)
+    return SqliteRunStore(str(tmp_path / "runs.db"), max_runs=0, idle_ttl_seconds=0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Replaces the store's clock with one the test moves by hand."""
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(
+        run_store_module,
+        "time",
+        SimpleNamespace(time=lambda: now.value, monotonic=lambda: now.value),
+    )
+    return now
+
+
+def _state(run_id: str = "run-1") -> ScenarioRunState:
+    return ScenarioRunState(
+        run_id=run_id,
+        scenario_id=1,
+        containers={"beaker_1": {(7, "mL"): ContainerContentItem(7, 10.0, "mL")}},
+        containers_meta={"beaker_1": ContainerMeta(3, "beaker", True, "liquid")},
+        current_step_index=1,
+        message="Reagiu",
+    )
+
+
+def _at_version(version: int) -> ScenarioRunState:
+    state = _state()
+    state.current_step_index = version
+    state.version = version
+    return state
+
+
+def test_put_then_get_round_trips_the_run(store):
+    store.put(_state())
+
+    assert store.get("run-1") == _state()
+    assert store.get("run-2") is None
+    assert len(store) == 1
+
+
+def test_put_many_saves_every_run(store):
+    store.put_many([_state(f"run-{index}") for index in range(5)])
+
+    assert len(store) == 5
+    assert store.get("run-4") == _state("run-4")
+
+
+def test_delete_forgets_the_run(store):
+    store.put(_state("run-1"))
+    store.put(_state("run-2"))
+    store.delete("run-1")
+
+    assert store.get("run-1") is None
+    assert len(store) == 1
+
+
+def test_put_is_conditional_on_expected_version(store):
+    store.put(_at_version(0))
+
+    assert store.put(_at_version(1), expected_version=0)
+    # A second writer that also read version 0 loses.
+    stale = _at_version(1)
+    stale.current_step_index = 99
+    assert not store.put(stale, expected_version=0)
+
+    saved = store.get("run-1")
+    assert saved.version == 1
+    assert saved.current_step_index == 1
+
+
+def test_conditional_put_saves_a_run_that_is_gone(store):
+    assert store.put(_at_version(3), expected_version=2)
+    assert store.get("run-1").version == 3
+
+
+def test_sqlite_store_accepts_rows_from_before_the_version_column(tmp_path):
+    path = str(tmp_path / "runs.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE scenario_runs ("
+            "run_id TEXT PRIMARY KEY, state BLOB NOT NULL, updated_at REAL NOT NULL"
+            ") WITHOUT ROWID"
+        )
+        conn.execute(
+            "INSERT INTO scenario_runs VALUES (?, ?, ?)",
+            ("run-1", encode_state(_at_version(4)), time.time()),
+        )
+    store = SqliteRunStore(path, max_runs=0, idle_ttl_seconds=0)
+
+    assert store.put(_at_version(5), expected_version=4)
+    assert not store.put(_at_version(5), expected_version=4)
+    assert store.get("run-1").version == 5
+
+
+def test_idle_runs_expire_on_access_and_on_sweep(store, clock):
+    store.idle_ttl_seconds = 60
+    store.put(_state("run-1"))
+    store.put(_state("run-2"))
+    clock.value += 30
+    assert store.get("run-1") is not None
+
+    clock.value += 45
+    # run-1 was read 45s ago; run-2 has been idle for 75s
+    assert store.get("run-2") is None
+    store.put(_state("run-3"))
+    clock.value += 30
+    assert store.sweep() == 1
+
+    assert store.get("run-1") is None and store.get("run-3") is not None
+    assert store.stats().expired_idle == 2
+
+
+def test_least_recently_used_runs_are_evicted(store, clock):
+    store.max_runs = 2
+    store.put(_state("run-1"))
+    clock.value += 1
+    store.put(_state("run-2"))
+    clock.value += 1
+    store.get("run-1")
+    clock.value += 1
+    store.put(_state("run-3"))
+    store.sweep()
+
+    assert store.get("run-2") is None
+    assert store.get("run-1") is not None and store.get("run-3") is not None
+    assert store.stats().evicted_lru == 1
+
+
+def test_health_reports_the_live_run_gauge(client):
+    stats = client.get("/health/runs").json()
+    assert set(stats) == {"live_runs", "evicted_lru", "expired_idle"}
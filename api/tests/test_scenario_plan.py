@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from sqlalchemy import update
+
+from core.database import SessionLocal
+from models.scenario import Scenario
+from services.scenario_plan import get_scenario_plan
+
+
+def _step(order_index, text):
+    return dict(order_index=order_index, action_type="add_reagent", text_instruction=text)
+
+
+def _create_scenario(client):
+    response = client.post(
+        "/scenarios/",
+        json=dict(
+            title="Plano",
+            description="Plano compilado",
+            steps=[_step(1, "Segundo"), _step(0, "Primeiro")],
+        ),
+    )
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def test_plan_is_compiled_once_and_ordered(client):
+    scenario_id = _create_scenario(client)
+
+    with SessionLocal() as db:
+        plan = get_scenario_plan(db, scenario_id)
+        assert get_scenario_plan(db, scenario_id) is plan
+
+    assert [step.text_instruction for step in plan.steps] == ["Primeiro", "Segundo"]
+    assert plan.step_count == 2
+    assert plan.step_at(2) is None
+
+
+def test_plan_follows_step_edits(client):
+    scenario_id = _create_scenario(client)
+    with SessionLocal() as db:
+        get_scenario_plan(db, scenario_id)
+
+    response = client.put(f"/scenarios/{scenario_id}", json={"steps": [_step(0, "Único")]})
+    assert response.status_code == 200, response.text
+
+    with SessionLocal() as db:
+        plan = get_scenario_plan(db, scenario_id)
+    assert [step.text_instruction for step in plan.steps] == ["Único"]
+
+
+def test_plan_follows_updated_at_written_by_another_worker(client):
+    scenario_id = _create_scenario(client)
+    with SessionLocal() as db:
+        cached = get_scenario_plan(db, scenario_id)
+        # Another worker edits the scenario; this process never hears of it.
+        db.execute(
+            update(Scenario)
+            .where(Scenario.id == scenario_id)
+            .values(updated_at=datetime(2030, 1, 1, tzinfo=timezone.utc))
+        )
+        db.commit()
+
+        assert get_scenario_plan(db, scenario_id) is not cached
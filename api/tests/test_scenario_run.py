@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import re
+
+import pytest
+
+from core.database import async_engine
+from services import scenario_run as run_service
+from services.run_log import RunActionLog
+from services.run_state import clone_state
+from services.run_store import get_run_store
+from tests.queries import count_queries
+
+
+def _create(client, path, payload):
+    response = client.post(path, json=payload)
+    assert response.status_code == 201, response.text
+    return response.json()
+
+
+@pytest.fixture(scope="module")
+def pour_scenario(client):
+    """A scenario that puts water and salt in beaker_1, then pours it into
+    beaker_2, which the salt makes fail after the water was already handled.
+    Returns the scenario id and its steps' actions."""
+    for name, instrument_type, is_container, states in (
+        ("Béquer 1", "beaker", True, None),
+        ("Béquer 2", "beaker", True, None),
+        ("Pipeta", "pipette", False, "liquid,solution"),
+        ("Espátula", "spatula", False, "solid"),
+    ):
+        instrument = _create(
+            client,
+            "/instruments/",
+            dict(
+                name=name,
+                instrument_type=instrument_type,
+                is_container=is_container,
+                allowed_physical_states=states,
+            ),
+        )
+        if instrument_type == "pipette":
+            pipette_id = instrument["id"]
+        elif instrument_type == "spatula":
+            spatula_id = instrument["id"]
+    water = _create(client, "/reagents/", dict(name="Água", formula="H2O", physical_state="liquid"))
+    salt = _create(client, "/reagents/", dict(name="Sal", formula="NaCl", physical_state="solid"))
+    actions = [
+        dict(
+            action_type="transfer_liquid_with_pipette",
+            instrument_id=pipette_id,
+            reagent_id=water["id"],
+            target_container_name="beaker_1",
+            amount_value=10,
+            amount_unit="mL",
+        ),
+        dict(
+            action_type="transfer_solid_with_spatula",
+            instrument_id=spatula_id,
+            reagent_id=salt["id"],
+            target_container_name="beaker_1",
+            amount_value=2,
+            amount_unit="g",
+        ),
+        dict(
+            action_type="pour_liquid_between_containers",
+            source_container_name="beaker_1",
+            target_container_name="beaker_2",
+        ),
+    ]
+    scenario = _create(
+        client,
+        "/scenarios/",
+        dict(
+            title="Despejo",
+            description="Despejo com sólido",
+            steps=[
+                dict(order_index=index, text_instruction=f"Passo {index}", **action)
+                for index, action in enumerate(actions)
+            ],
+        ),
+    )
+    return scenario["id"], actions
+
+
+def _start_run(client, pour_scenario, applied):
+    """Starts a run and applies its first ``applied`` actions; returns the
+    run id and the next action."""
+    scenario_id, actions = pour_scenario
+    run_id = _create(client, "/scenario-runs/", {"scenario_id": scenario_id})["run_id"]
+    for action in actions[:applied]:
+        response = client.post(f"/scenario-runs/{run_id}/actions", json=action)
+        assert response.status_code == 200, response.text
+    return run_id, actions[applied]
+
+
+def test_rejected_action_leaves_stored_run_unchanged(client, pour_scenario):
+    run_id, pour = _start_run(client, pour_scenario, applied=2)
+    before = client.get(f"/scenario-runs/{run_id}")
+    etag = before.headers["ETag"]
+
+    response = client.post(f"/scenario-runs/{run_id}/actions", json=pour)
+    assert response.status_code == 400
+
+    after = client.get(f"/scenario-runs/{run_id}")
+    assert after.headers["ETag"] == etag
+    assert after.json() == before.json()
+    assert after.json()["containers"].get("beaker_2", []) == []
+    assert client.get(f"/scenario-runs/{run_id}", headers={"If-None-Match": etag}).status_code == 304
+
+
+def test_action_with_since_version_returns_only_the_delta(client, pour_scenario):
+    run_id, add_water = _start_run(client, pour_scenario, applied=0)
+    etag = client.get(f"/scenario-runs/{run_id}").headers["ETag"]
+
+    response = client.post(
+        f"/scenario-runs/{run_id}/actions", params={"since_version": 0}, json=add_water
+    )
+
+    assert response.status_code == 200, response.text
+    delta = response.json()
+    assert delta["version"] == 1
+    assert list(delta["containers"]) == ["beaker_1"]
+    assert "containers_meta" not in delta
+    assert response.headers["ETag"] != etag
+    assert client.get(f"/scenario-runs/{run_id}", headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_batch_is_all_or_nothing(client, pour_scenario):
+    _, actions = pour_scenario
+    run_id, _ = _start_run(client, pour_scenario, applied=0)
+    before = client.get(f"/scenario-runs/{run_id}")
+
+    rejected = client.post(f"/scenario-runs/{run_id}/actions:batch", json=actions[::-1])
+
+    assert rejected.status_code == 400
+    assert [result["status"] for result in rejected.json()["results"]] == [
+        "rejected",
+        "skipped",
+        "skipped",
+    ]
+    assert client.get(f"/scenario-runs/{run_id}").headers["ETag"] == before.headers["ETag"]
+
+    applied = client.post(f"/scenario-runs/{run_id}/actions:batch", json=actions[:2])
+
+    assert applied.status_code == 200, applied.text
+    body = applied.json()
+    assert [result["status"] for result in body["results"]] == ["applied", "applied"]
+    assert body["state"]["version"] == 2
+    assert body["state"]["current_step_index"] == 2
+    assert client.get(f"/scenario-runs/{run_id}").json() == body["state"]
+
+
+def test_ui_action_swaps_only_the_moved_step_items(client, pour_scenario):
+    run_id, add_water = _start_run(client, pour_scenario, applied=0)
+
+    loaded = client.get(f"/ui/scenario-runs/{run_id}/state")
+    assert loaded.status_code == 200, loaded.text
+    assert 'id="scenario-steps"' in loaded.text
+    assert loaded.text.count('id="step-item-') == 3
+
+    form = {key: str(value) for key, value in add_water.items()}
+    advanced = client.post(f"/ui/scenario-runs/{run_id}/actions", data=form)
+    assert advanced.status_code == 200, advanced.text
+    assert 'id="scenario-steps"' not in advanced.text
+    assert re.findall(r'id="step-item-(\d+)"', advanced.text) == ["0", "1"]
+    assert advanced.text.count('hx-swap-oob="outerHTML"') == 2
+
+    rejected = client.post(f"/ui/scenario-runs/{run_id}/actions", data=form)
+    assert rejected.status_code == 400
+    assert "step-item-" not in rejected.text
+
+
+def test_action_is_recomputed_when_another_worker_saved_first(
+    client, pour_scenario, monkeypatch
+):
+    run_id, add_salt = _start_run(client, pour_scenario, applied=1)
+    store = get_run_store()
+    before = store.get(run_id)
+    put = store.put
+
+    def put_after_other_worker(state, expected_version=None):
+        if store.get(run_id).version == before.version:
+            # Another worker saves a newer version of the run in between.
+            other = clone_state(before)
+            other.version += 1
+            put(other)
+        return put(state, expected_version)
+
+    monkeypatch.setattr(store, "put", put_after_other_worker)
+    response = client.post(f"/scenario-runs/{run_id}/actions", json=add_salt)
+
+    assert response.status_code == 200, response.text
+    # Applied on top of the other worker's save instead of over it
+    assert response.json()["version"] == before.version + 2
+    assert store.get(run_id).version == before.version + 2
+
+
+def test_action_conflicts_when_the_run_keeps_moving(client, pour_scenario, monkeypatch):
+    run_id, add_salt = _start_run(client, pour_scenario, applied=1)
+    before = client.get(f"/scenario-runs/{run_id}")
+    monkeypatch.setattr(get_run_store(), "put", lambda state, expected_version=None: False)
+
+    response = client.post(f"/scenario-runs/{run_id}/actions", json=add_salt)
+
+    assert response.status_code == 409
+    monkeypatch.undo()
+    assert client.get(f"/scenario-runs/{run_id}").json() == before.json()
+
+
+def test_action_reads_the_catalog_version_once(client, pour_scenario):
+    run_id, add_salt = _start_run(client, pour_scenario, applied=1)
+
+    with count_queries(async_engine.sync_engine) as statements:
+        response = client.post(f"/scenario-runs/{run_id}/actions", json=add_salt)
+
+    assert response.status_code == 200, response.text
+    version_reads = [sql for sql in statements if "catalog_versions" in sql]
+    assert len(version_reads) == 1, "\n\n".join(statements)
+
+
+@pytest.fixture
+def run_log(tmp_path, monkeypatch):
+    log = RunActionLog(str(tmp_path / "run_log.db"), snapshot_every=2, flush_size=100)
+    monkeypatch.setattr(run_service, "get_run_log", lambda: log)
+    return log
+
+
+def test_lost_run_is_recovered_from_the_log(client, pour_scenario, run_log):
+    run_id, pour = _start_run(client, pour_scenario, applied=2)
+    assert client.post(f"/scenario-runs/{run_id}/actions", json=pour).status_code == 400
+    before = client.get(f"/scenario-runs/{run_id}").json()
+
+    get_run_store().delete(run_id)
+    assert client.get(f"/scenario-runs/{run_id}").status_code == 404
+
+    events = client.get(f"/scenario-runs/{run_id}/events").json()
+    assert [(event["version"], event["accepted"]) for event in events] == [
+        (1, True),
+        (2, True),
+        (2, False),
+    ]
+    recovered = client.post(f"/scenario-runs/{run_id}/recover")
+    assert recovered.status_code == 200, recovered.text
+    assert recovered.json() == before
+    assert client.get(f"/scenario-runs/{run_id}").json() == before
+
+
+def test_bulk_start_costs_the_same_queries_for_any_class_size(client, pour_scenario):
+    scenario_id, _ = pour_scenario
+    labels = [f"Aluno {index}" for index in range(30)]
+    client.post("/scenario-runs:bulk", json={"scenario_id": scenario_id, "count": 1})
+
+    with count_queries() as small:
+        one = client.post("/scenario-runs:bulk", json={"scenario_id": scenario_id, "count": 3})
+    with count_queries() as large:
+        labelled = client.post(
+            "/scenario-runs:bulk", json={"scenario_id": scenario_id, "student_labels": labels}
+        )
+
+    assert one.status_code == labelled.status_code == 201, labelled.text
+    assert len(one.json()["runs"]) == 3
+    runs = labelled.json()["runs"]
+    assert [run["label"] for run in runs] == labels
+    assert len({run["run_id"] for run in runs}) == len(labels)
+    assert client.get(f"/scenario-runs/{runs[-1]['run_id']}").json()["version"] == 0
+    assert len(small) == len(large) <= 2, "\n\n".join(large)
+
+
+def test_bulk_start_takes_a_count_or_labels(client, pour_scenario):
+    scenario_id, _ = pour_scenario
+    both = {"scenario_id": scenario_id, "count": 2, "student_labels": ["A", "B"]}
+
+    assert client.post("/scenario-runs:bulk", json=both).status_code == 422
+    assert client.post("/scenario-runs:bulk", json={"scenario_id": scenario_id}).status_code == 422
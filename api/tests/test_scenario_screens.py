@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+
+def test_screens_bundle_is_json_with_etag(client):
+    scenario = client.post(
+        "/scenarios/",
+        json=dict(
+            title="Cenário com telas",
+            description="Telas",
+            screens=[
+                dict(order_index=order, title=f"Tela {order}", screen_type="title_image_slider")
+                for order in range(2)
+            ],
+        ),
+    )
+    assert scenario.status_code == 201, scenario.text
+    path = f"/ui/scenarios/{scenario.json()['id']}/screens"
+
+    response = client.get(path)
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("application/json")
+    assert len(response.json()["screens"]) == 2
+
+    cached = client.get(path, headers={"If-None-Match": response.headers["etag"]})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == response.headers["etag"]
+
+
+def test_screen_index_is_a_display_position(client):
+    scenario = client.post(
+        "/scenarios/",
+        json=dict(
+            title="Cenário com lacunas",
+            description="Telas",
+            screens=[
+                dict(order_index=order, title=f"Tela {order}", screen_type="title_image_slider")
+                for order in (10, 3)
+            ],
+        ),
+    )
+    assert scenario.status_code == 201, scenario.text
+    path = f"/ui/scenarios/{scenario.json()['id']}/screens"
+
+    first = client.get(f"{path}/0")
+    assert first.status_code == 200, first.text
+    assert "Tela 3" in first.text
+    assert first.headers["cache-control"].startswith("public, max-age=")
+    assert "Tela 10" in client.get(f"{path}/1").text
+    assert client.get(f"{path}/2").status_code == 404
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from core.static_assets import (
+    MANIFEST_NAME,
+    FingerprintedStaticFiles,
+    build_assets,
+    load_manifest,
+)
+
+
+def test_concurrent_builds_leave_complete_files(tmp_path):
+    source_dir = tmp_path / "static"
+    (source_dir / "js").mkdir(parents=True)
+    (source_dir / "styles.css").write_text("body { color: red; }\n" * 200)
+    (source_dir / "js" / "app.js").write_text("console.log('ok');\n" * 200)
+    build_dir = tmp_path / "build"
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        manifests = list(pool.map(lambda _: build_assets(source_dir, build_dir), range(16)))
+
+    assert all(manifest == manifests[0] for manifest in manifests)
+    assert json.loads((build_dir / MANIFEST_NAME).read_text(encoding="utf-8")) == manifests[0]
+    for source_name, hashed_name in manifests[0].items():
+        assert (build_dir / hashed_name).read_bytes() == (source_dir / source_name).read_bytes()
+    # No temp file is left behind by any of the builds
+    assert not [path for path in build_dir.rglob("*") if path.name.endswith(".tmp")]
+
+
+def test_each_encoding_has_its_own_etag(tmp_path):
+    source_dir = tmp_path / "static"
+    source_dir.mkdir()
+    (source_dir / "styles.css").write_text("body { color: red; }\n" * 200)
+    build_dir = tmp_path / "build"
+    manifest = build_assets(source_dir, build_dir)
+    app = FastAPI()
+    app.mount("/static", FingerprintedStaticFiles(source_dir, load_manifest("/static", build_dir)))
+    client = TestClient(app)
+    url = f"/static/{manifest['styles.css']}"
+
+    identity = client.get(url, headers={"Accept-Encoding": "identity"})
+    gzipped = client.get(url, headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in identity.headers
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert identity.headers["etag"] != gzipped.headers["etag"]
+    assert not gzipped.headers["etag"].startswith("W/")